@@ -8,7 +8,9 @@ import logging
 import random
 import hashlib
 import collections
+import queue
 import time
+import threading
 import copy
 import base64
 from packaging.version import parse as parse_version
@@ -30,6 +32,11 @@ SETTINGS_FILE = os.path.join(APP_DIR, "translator_settings.json")
 LOG_FILE = os.path.join(APP_DIR, "translator.log")
 MAX_RECENT_FILES = 10
 RPM_COOLDOWN_SECONDS = 61
+FLASH_SUCCESS_COLOR = "#2ca878"
+HIGHLIGHT_DURATION_MS = 1200
+HIGHLIGHT_FRAME_MS = 33
+HIGHLIGHT_MAX_ALPHA = 140
+ITEM_ID_ROLE = QtCore.Qt.ItemDataRole.UserRole + 65
 LOREBOOK_TEMPLATE = {"entries": {}}
 
 
@@ -89,32 +96,67 @@ def run_updater():
         sys.exit(1)
 
 
-def check_and_trigger_update():
-    LOCAL_APP_VERSION = APP_VERSION
-    VERSION_URL = "https://raw.githubusercontent.com/Ner-Kun/Lorebook-Gemini-Translator/main/version.txt"
-    logger.info("Verifying application and launcher versions...")
+UPDATE_CHECK_URL = "https://raw.githubusercontent.com/Ner-Kun/Lorebook-Gemini-Translator/main/version.txt"
+UPDATE_CHECK_CACHE_FILE = os.path.join(APP_DIR, "update_check_cache.json")
+UPDATE_CHECK_INTERVAL_SECONDS = 6 * 60 * 60
+UPDATE_CHECK_TIMEOUT_SECONDS = 5
+UPDATE_CHECK_DELAY_MS = 1500
 
+def _load_update_check_cache():
     try:
-        response = requests.get(VERSION_URL, timeout=5)
-        response.raise_for_status()
-        content = response.text
-        
-        remote_versions = {}
-        for line in content.splitlines():
-            if '=' in line and not line.strip().startswith('#'):
-                key, value = line.strip().split('=', 1)
-                remote_versions[key.strip()] = value.strip()
-        
-        REMOTE_APP_VERSION = remote_versions.get("APP_VERSION", "0.0.0")
-        REMOTE_LAUNCHER_VERSION = remote_versions.get("LAUNCHER_VERSION", "0.0.0")
-        
-    except requests.exceptions.RequestException as e:
-        logger.warning(f"Could not check for updates (network error): {e}. Skipping check.")
-        return
-    except Exception as e:
-        logger.error(f"Failed to parse version file: {e}. Skipping check.")
-        return
+        with open(UPDATE_CHECK_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def _save_update_check_cache(cache):
+    try:
+        with open(UPDATE_CHECK_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False, indent=2)
+    except OSError as e:
+        logger.warning(f"Could not store the update check result: {e}")
+
+def fetch_remote_versions():
+    cache = _load_update_check_cache()
+    cached_content = cache.get("content") if cache.get("url") == UPDATE_CHECK_URL else None
+    if cached_content is not None and time.time() - cache.get("checked_at", 0) < UPDATE_CHECK_INTERVAL_SECONDS:
+        logger.debug("Using cached version file; skipping the network update check.")
+        content = cached_content
+    else:
+        headers = {}
+        if cached_content is not None:
+            if cache.get("etag"):
+                headers["If-None-Match"] = cache["etag"]
+            if cache.get("last_modified"):
+                headers["If-Modified-Since"] = cache["last_modified"]
+        response = requests.get(UPDATE_CHECK_URL, headers=headers, timeout=UPDATE_CHECK_TIMEOUT_SECONDS)
+        if response.status_code == 304 and cached_content is not None:
+            logger.debug("Version file not modified since the last check.")
+            content = cached_content
+        else:
+            response.raise_for_status()
+            content = response.text
+            cache = {
+                "url": UPDATE_CHECK_URL,
+                "content": content,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+        cache["checked_at"] = time.time()
+        _save_update_check_cache(cache)
 
+    remote_versions = {}
+    for line in content.splitlines():
+        if '=' in line and not line.strip().startswith('#'):
+            key, value = line.strip().split('=', 1)
+            remote_versions[key.strip()] = value.strip()
+    return remote_versions
+
+def get_update_reason(remote_versions):
+    LOCAL_APP_VERSION = APP_VERSION
+    REMOTE_APP_VERSION = remote_versions.get("APP_VERSION", "0.0.0")
+    REMOTE_LAUNCHER_VERSION = remote_versions.get("LAUNCHER_VERSION", "0.0.0")
     try:
         launcher_path = os.path.join(APP_DIR, "run_translator.bat")
         if not os.path.exists(launcher_path):
@@ -135,24 +177,150 @@ def check_and_trigger_update():
 
     if not os.path.exists(os.path.join(APP_DIR, "run_translator.bat")):
         update_reason = "Launcher file 'run_translator.bat' is missing."
+    return update_reason
 
+def check_for_update():
+    logger.info("Verifying application and launcher versions...")
+    try:
+        remote_versions = fetch_remote_versions()
+    except requests.exceptions.RequestException as e:
+        logger.warning(f"Could not check for updates (network error): {e}. Skipping check.")
+        return ""
+    except Exception as e:
+        logger.error(f"Failed to parse version file: {e}. Skipping check.")
+        return ""
+    update_reason = get_update_reason(remote_versions)
     if update_reason:
         logger.warning(f"Update required: {update_reason}")
-        from PySide6 import QtWidgets
-        _ = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
-        msg_box = QtWidgets.QMessageBox()
-        msg_box.setIcon(QtWidgets.QMessageBox.Information)
-        msg_box.setWindowTitle("Update Required")
-        msg_box.setText(update_reason)
-        msg_box.setInformativeText("The application will now close and run the updater.")
-        msg_box.setStandardButtons(QtWidgets.QMessageBox.Ok | QtWidgets.QMessageBox.Cancel)
-        if msg_box.exec() == QtWidgets.QMessageBox.Ok:
+    else:
+        logger.info("OK. Application and launcher are up to date.")
+    return update_reason
+
+def prompt_for_update(update_reason, parent=None):
+    app = QtWidgets.QApplication.instance()
+    msg_box = QtWidgets.QMessageBox(parent)
+    msg_box.setIcon(QtWidgets.QMessageBox.Information)
+    msg_box.setWindowTitle("Update Required")
+    msg_box.setText(update_reason)
+    msg_box.setInformativeText("The application will now close and run the updater.")
+    msg_box.setStandardButtons(QtWidgets.QMessageBox.Ok | QtWidgets.QMessageBox.Cancel)
+    accepted = msg_box.exec() == QtWidgets.QMessageBox.Ok
+    if parent is not None and not parent.close():
+        logger.info("Update postponed: the main window was kept open.")
+        return
+    exit_code = 0
+    try:
+        if accepted:
             run_updater()
         else:
             logger.info("User cancelled the update. Exiting application to prevent issues.")
-            sys.exit(0)
-    else:
-        logger.info("OK. Application and launcher are up to date.")
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else 0
+    app.exit(exit_code)
+
+class UpdateCheckSignals(QtCore.QObject):
+    update_required = QtCore.Signal(str)
+
+class UpdateCheckRunnable(QtCore.QRunnable):
+    def __init__(self, signals):
+        super().__init__()
+        self.signals = signals
+
+    @QtCore.Slot()
+    def run(self):
+        try:
+            update_reason = check_for_update()
+        except Exception as e:
+            logger.error(f"Background update check failed: {e}", exc_info=True)
+            return
+        if update_reason:
+            self.signals.update_required.emit(update_reason)
+
+def start_background_update_check(parent):
+    signals = UpdateCheckSignals(parent)
+    signals.update_required.connect(lambda reason: prompt_for_update(reason, parent))
+    QtCore.QTimer.singleShot(
+        UPDATE_CHECK_DELAY_MS,
+        lambda: QtCore.QThreadPool.globalInstance().start(UpdateCheckRunnable(signals)),
+    )
+
+class ProgressReporter:
+    def __init__(self, eta_smoothing: float = 0.2):
+        self._lock = threading.Lock()
+        self.eta_smoothing = eta_smoothing
+        self.reset()
+
+    def reset(self, total: int = 0):
+        with self._lock:
+            self.total = total
+            self.completed = 0
+            self.failed = 0
+            self.retries = 0
+            self.started_at = time.monotonic()
+            self._last_done_at = self.started_at
+            self._avg_seconds_per_job = None
+
+    def _record_done(self, count: int):
+        now = time.monotonic()
+        per_job = (now - self._last_done_at) / count
+        self._last_done_at = now
+        if self._avg_seconds_per_job is None:
+            self._avg_seconds_per_job = per_job
+        else:
+            self._avg_seconds_per_job += self.eta_smoothing * (per_job - self._avg_seconds_per_job)
+
+    def record_completed(self, count: int = 1):
+        if count <= 0:
+            return
+        with self._lock:
+            self.completed += count
+            self._record_done(count)
+
+    def record_failed(self, count: int = 1):
+        if count <= 0:
+            return
+        with self._lock:
+            self.failed += count
+            self._record_done(count)
+
+    def record_retry(self, count: int = 1):
+        with self._lock:
+            self.retries += count
+
+    def snapshot(self):
+        with self._lock:
+            processed = self.completed + self.failed
+            remaining = max(self.total - processed, 0)
+            elapsed = time.monotonic() - self.started_at
+            eta_seconds = None
+            if self._avg_seconds_per_job is not None and remaining:
+                eta_seconds = remaining * self._avg_seconds_per_job
+            elif not remaining:
+                eta_seconds = 0.0
+            return {
+                "total": self.total,
+                "completed": self.completed,
+                "failed": self.failed,
+                "retries": self.retries,
+                "processed": processed,
+                "remaining": remaining,
+                "elapsed_seconds": elapsed,
+                "eta_seconds": eta_seconds,
+            }
+
+    @staticmethod
+    def format_snapshot(snapshot):
+        text = f"{snapshot['processed']}/{snapshot['total']} done"
+        if snapshot["failed"]:
+            text += f", {snapshot['failed']} failed"
+        if snapshot["retries"]:
+            text += f", {snapshot['retries']} retried"
+        eta = snapshot["eta_seconds"]
+        if eta is not None and snapshot["remaining"]:
+            minutes, seconds = divmod(int(eta), 60)
+            text += f" — ETA {minutes}:{seconds:02d}"
+        return text
+
 
 class JobSignals(QtCore.QObject):
     job_completed = QtCore.Signal(object, str, str)
@@ -481,6 +649,9 @@ class UIAnimator:
             anim.finished.connect(widget.hide)
         anim.start(QtCore.QAbstractAnimation.DeleteWhenStopped)
 
+def translation_item_id(uid, orig_key):
+    return f"{uid}:{orig_key}"
+
 def setup_logger():
     global fh
     logger.setLevel(getattr(logging, current_settings.get("log_level", "INFO").upper(), logging.INFO))
@@ -598,18 +769,136 @@ def save_settings():
     except Exception as e:
         logger.error(f"Failed to save settings: {e}")
 
+LOG_VIEW_MAX_RECORDS = 5000
+LOG_VIEW_FLUSH_INTERVAL_MS = 100
+LOG_VIEW_MAX_BATCH = 1000
+LOG_VIEW_ALL_SOURCES = "All sources"
+
+
 class QtLogHandler(logging.Handler):
-    def __init__(self, text_widget):
+    def __init__(self, log_view):
         super().__init__()
-        self.widget = text_widget
-        self.widget.setReadOnly(True)
+        self.log_view = log_view
         self.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
         self.setLevel(logging.DEBUG)
     def emit(self, record):
-        if self.widget and self.widget.isVisible():
-            msg = self.format(record)
-            self.widget.append(msg)
-            self.widget.moveCursor(QtGui.QTextCursor.End)
+        try:
+            self.log_view.record_queue.put((record.levelno, record.funcName, self.format(record)))
+        except Exception:
+            self.handleError(record)
+
+
+class LogView(QtWidgets.QWidget):
+    def __init__(self, parent=None, max_records=LOG_VIEW_MAX_RECORDS):
+        super().__init__(parent)
+        self.record_queue = queue.SimpleQueue()
+        self.records = collections.deque(maxlen=max_records)
+        self.known_sources = set()
+        self.min_level = logging.DEBUG
+        self.source_filter = None
+        self.needs_rebuild = False
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        filter_layout = QtWidgets.QHBoxLayout()
+        filter_layout.addWidget(QtWidgets.QLabel("Level:"))
+        self.level_combo = QtWidgets.QComboBox()
+        for level_name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"):
+            self.level_combo.addItem(level_name, logging.getLevelName(level_name))
+        self.level_combo.currentIndexChanged.connect(self._on_filter_changed)
+        filter_layout.addWidget(self.level_combo)
+        filter_layout.addWidget(QtWidgets.QLabel("Source:"))
+        self.source_combo = QtWidgets.QComboBox()
+        self.source_combo.setSizeAdjustPolicy(QtWidgets.QComboBox.AdjustToContents)
+        self.source_combo.addItem(LOG_VIEW_ALL_SOURCES, None)
+        self.source_combo.currentIndexChanged.connect(self._on_filter_changed)
+        filter_layout.addWidget(self.source_combo)
+        filter_layout.addStretch()
+        self.clear_button = QtWidgets.QPushButton("Clear")
+        self.clear_button.clicked.connect(self.clear)
+        filter_layout.addWidget(self.clear_button)
+        layout.addLayout(filter_layout)
+
+        self.text_view = QtWidgets.QPlainTextEdit()
+        self.text_view.setReadOnly(True)
+        self.text_view.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
+        self.text_view.setMaximumBlockCount(max_records)
+        layout.addWidget(self.text_view)
+
+        self.flush_timer = QtCore.QTimer(self)
+        self.flush_timer.setInterval(LOG_VIEW_FLUSH_INTERVAL_MS)
+        self.flush_timer.timeout.connect(self.flush_pending_records)
+        self.flush_timer.start()
+
+    def _accepts(self, levelno, source):
+        if levelno < self.min_level:
+            return False
+        return self.source_filter is None or source == self.source_filter
+
+    def _is_scrolled_to_bottom(self):
+        scroll_bar = self.text_view.verticalScrollBar()
+        return scroll_bar.value() >= scroll_bar.maximum() - 2
+
+    def _append_lines(self, lines):
+        if not lines:
+            return
+        stick_to_bottom = self._is_scrolled_to_bottom()
+        self.text_view.appendPlainText("\n".join(lines))
+        if stick_to_bottom:
+            self.text_view.verticalScrollBar().setValue(self.text_view.verticalScrollBar().maximum())
+
+    def _register_sources(self, sources):
+        new_sources = sources - self.known_sources
+        if not new_sources:
+            return
+        self.known_sources.update(new_sources)
+        self.source_combo.blockSignals(True)
+        for source in sorted(new_sources):
+            self.source_combo.addItem(source, source)
+        self.source_combo.blockSignals(False)
+
+    @QtCore.Slot()
+    def flush_pending_records(self):
+        batch = []
+        try:
+            while len(batch) < LOG_VIEW_MAX_BATCH:
+                batch.append(self.record_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if not batch:
+            return
+        self.records.extend(batch)
+        self._register_sources({source for _, source, _ in batch})
+        if not self.isVisible():
+            self.needs_rebuild = True
+            return
+        if self.needs_rebuild:
+            self.rebuild_view()
+            return
+        self._append_lines([text for levelno, source, text in batch if self._accepts(levelno, source)])
+
+    def rebuild_view(self):
+        self.needs_rebuild = False
+        self.text_view.clear()
+        self._append_lines([text for levelno, source, text in self.records if self._accepts(levelno, source)])
+        self.text_view.verticalScrollBar().setValue(self.text_view.verticalScrollBar().maximum())
+
+    @QtCore.Slot()
+    def _on_filter_changed(self):
+        self.min_level = self.level_combo.currentData() or logging.DEBUG
+        self.source_filter = self.source_combo.currentData()
+        self.rebuild_view()
+
+    @QtCore.Slot()
+    def clear(self):
+        self.records.clear()
+        self.needs_rebuild = False
+        self.text_view.clear()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.needs_rebuild:
+            self.rebuild_view()
 
 
 class ModelInspectorDialog(AnimatedDialog):
@@ -1222,6 +1511,68 @@ class FocusOutTextEdit(QtWidgets.QTextEdit):
         super().focusOutEvent(event)
 
 
+def item_id_from_first_column(index: QtCore.QModelIndex):
+    return index.siblingAtColumn(0).data(ITEM_ID_ROLE)
+
+
+class RowHighlightDelegate(QtWidgets.QStyledItemDelegate):
+    def __init__(self, view: QtWidgets.QAbstractItemView, default_color: str, item_id_for_index=item_id_from_first_column, duration_ms: int = HIGHLIGHT_DURATION_MS):
+        super().__init__(view)
+        self.view = view
+        self.default_color = default_color
+        self.item_id_for_index = item_id_for_index
+        self.duration = duration_ms / 1000.0
+        self._highlights = {}
+        self._frame_timer = QtCore.QTimer(self)
+        self._frame_timer.setInterval(HIGHLIGHT_FRAME_MS)
+        self._frame_timer.timeout.connect(self._on_frame)
+
+    def highlight_items(self, item_ids, color: str = None):
+        started = time.monotonic()
+        qcolor = QtGui.QColor(color or self.default_color)
+        for item_id in item_ids:
+            if item_id is not None:
+                self._highlights[item_id] = (started, qcolor)
+        if self._highlights and not self._frame_timer.isActive():
+            self._frame_timer.start()
+        self.view.viewport().update()
+
+    def clear_highlights(self):
+        self._highlights.clear()
+        self._frame_timer.stop()
+        self.view.viewport().update()
+
+    def _on_frame(self):
+        now = time.monotonic()
+        expired = [item_id for item_id, (started, _) in self._highlights.items() if now - started >= self.duration]
+        for item_id in expired:
+            del self._highlights[item_id]
+        if not self._highlights:
+            self._frame_timer.stop()
+        self.view.viewport().update()
+
+    def _highlight_color(self, index: QtCore.QModelIndex):
+        if not self._highlights:
+            return None
+        highlight = self._highlights.get(self.item_id_for_index(index))
+        if highlight is None:
+            return None
+        started, color = highlight
+        progress = (time.monotonic() - started) / self.duration
+        if progress >= 1.0:
+            return None
+        strength = progress * 2 if progress < 0.5 else (1.0 - progress) * 2
+        faded = QtGui.QColor(color)
+        faded.setAlpha(int(HIGHLIGHT_MAX_ALPHA * strength))
+        return faded
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        color = self._highlight_color(index)
+        if color is not None:
+            painter.fillRect(option.rect, color)
+
+
 class EditorTab(QtWidgets.QWidget):
     search_term_changed = QtCore.Signal(str)
 
@@ -1852,6 +2203,7 @@ class TranslationTab(QtWidgets.QWidget):
         self.main_window = main_window
 
         self.table_data = []
+        self.row_by_item_id = {}
         self.current_row = None
         self.current_orig_key_for_editor = None
         self.current_translation_in_editor_before_change = None
@@ -1907,6 +2259,8 @@ class TranslationTab(QtWidgets.QWidget):
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.table.setWordWrap(False)
+        self.row_highlight_delegate = RowHighlightDelegate(self.table, FLASH_SUCCESS_COLOR)
+        self.table.setItemDelegate(self.row_highlight_delegate)
         table_layout.addWidget(self.table)
         top_middle_h_splitter.addWidget(table_group)
         edit_group = QtWidgets.QGroupBox("Edit Selected Translation")
@@ -2008,9 +2362,8 @@ class TranslationTab(QtWidgets.QWidget):
 
         self.log_panel = QtWidgets.QGroupBox("Application Log")
         log_panel_layout = QtWidgets.QVBoxLayout(self.log_panel)
-        self.log_text_edit = QtWidgets.QTextEdit()
-        self.log_text_edit.setReadOnly(True)
-        log_panel_layout.addWidget(self.log_text_edit)
+        self.log_view = LogView()
+        log_panel_layout.addWidget(self.log_view)
         self.log_panel.setVisible(current_settings.get("show_log_panel", True)) 
         translation_layout.addWidget(self.log_panel, stretch=1)
 
@@ -2035,8 +2388,8 @@ class TranslationTab(QtWidgets.QWidget):
 
         self.animation.start(QtCore.QAbstractAnimation.DeleteWhenStopped)
 
-    def get_log_text_edit(self):
-        return self.log_text_edit
+    def get_log_view(self):
+        return self.log_view
 
     @QtCore.Slot(bool)
     def on_toggle_use_context(self, checked):
@@ -2279,6 +2632,9 @@ class TranslationTab(QtWidgets.QWidget):
         self.update_table_widget()
 
     def update_table_widget(self):
+        self.row_highlight_delegate.clear_highlights()
+        self.main_window.pending_row_updates.clear()
+        self.row_by_item_id = {}
         self.table.setRowCount(0)
         tgt_lang_header = self.current_target_language
         header_lbl = f'Translated ({tgt_lang_header if tgt_lang_header else "N/A"})'
@@ -2291,7 +2647,11 @@ class TranslationTab(QtWidgets.QWidget):
             for r, row_content in enumerate(self.table_data):
                 if len(row_content) == 4:
                     uid, orig, trans, content = row_content
-                    self.table.setItem(r, 0, QtWidgets.QTableWidgetItem(uid))
+                    item_id = translation_item_id(uid, orig)
+                    self.row_by_item_id[item_id] = r
+                    uid_item = QtWidgets.QTableWidgetItem(uid)
+                    uid_item.setData(ITEM_ID_ROLE, item_id)
+                    self.table.setItem(r, 0, uid_item)
                     self.table.setItem(r, 1, QtWidgets.QTableWidgetItem(orig))
                     self.table.setItem(r, 2, QtWidgets.QTableWidgetItem(trans))
                     preview = str(content).replace("\n", " ")[:147] + "..." if len(str(content).replace("\n", " ")) > 150 else str(content).replace("\n", " ")
@@ -2625,8 +2985,13 @@ class TranslatorApp(QtWidgets.QMainWindow):
         self.translation_timer = QtCore.QTimer(self)
         self.translation_timer.setSingleShot(True)
         self.translation_timer.timeout.connect(self._dispatch_next_job_to_pool)
-        self.total_jobs_for_progress = 0
-        self.completed_jobs_for_progress = 0
+        self.progress_reporter = ProgressReporter()
+        self.progress_label_prefix = ""
+        self.progress_refresh_timer = QtCore.QTimer(self)
+        self.progress_refresh_timer.setInterval(250)
+        self.progress_refresh_timer.timeout.connect(self._refresh_progress_dialog)
+        self.pending_row_updates = {}
+        self.job_results_flush_timer = self._create_debounce_timer(self._flush_job_results, 33)
 
         self.api_request_timestamps_per_key = {}
         self.api_key_cooldown_end_times = {}
@@ -2639,8 +3004,8 @@ class TranslatorApp(QtWidgets.QMainWindow):
         
         self.init_ui()
         
-        if self.translation_tab and self.translation_tab.get_log_text_edit():
-            self.qt_log_handler = QtLogHandler(self.translation_tab.get_log_text_edit())
+        if self.translation_tab and self.translation_tab.get_log_view():
+            self.qt_log_handler = QtLogHandler(self.translation_tab.get_log_view())
             logger.addHandler(self.qt_log_handler)
         
         self.apply_settings_effects()
@@ -2699,90 +3064,6 @@ class TranslatorApp(QtWidgets.QMainWindow):
         tab_widget.setCurrentIndex(2)
         self.loading_overlay = LoadingOverlay(self.centralWidget())
 
-    def _flash_row_color(self, row, highlight_color=QtGui.QColor("#2ca878"), duration_ms=1200):
-            table = self.translation_tab.table
-            if not (0 <= row < table.rowCount()):
-                return
-            
-            selection_model = table.selectionModel()
-            selected_rows = {index.row() for index in selection_model.selectedRows()}
-            is_row_selected = row in selected_rows
-            selection_color = QtGui.QColor("#44689e")
-            start_color = selection_color if is_row_selected else QtGui.QColor(0, 0, 0, 0)
-
-            items_in_row_to_animate = []
-            for col in range(table.columnCount()):
-                item = table.item(row, col)
-                if not item:
-                    item = QtWidgets.QTableWidgetItem()
-                    table.setItem(row, col, item)
-                items_in_row_to_animate.append(item)
-
-            if selected_rows:
-                selection_model.blockSignals(True)
-                selection_model.clear()
-                
-                for r in selected_rows:
-                    if r == row:
-                        continue
-                    for c in range(table.columnCount()):
-                        item = table.item(r, c)
-                        if item:
-                            item.setBackground(selection_color)
-                for item in items_in_row_to_animate:
-                    item.setBackground(start_color)
-                selection_model.blockSignals(False)
-
-            animation_group = QtCore.QParallelAnimationGroup(self)
-            for item in items_in_row_to_animate:
-                fade_in_anim = QtCore.QVariantAnimation()
-                fade_in_anim.setDuration(duration_ms // 2)
-                fade_in_anim.setStartValue(start_color)
-                fade_in_anim.setEndValue(highlight_color)
-                fade_in_anim.setEasingCurve(QtCore.QEasingCurve.InQuad)
-
-                fade_out_anim = QtCore.QVariantAnimation()
-                fade_out_anim.setDuration(duration_ms // 2)
-                fade_out_anim.setStartValue(highlight_color)
-                fade_out_anim.setEndValue(start_color)
-                fade_out_anim.setEasingCurve(QtCore.QEasingCurve.OutQuad)
-                
-                sequential_anim = QtCore.QSequentialAnimationGroup()
-                sequential_anim.addAnimation(fade_in_anim)
-                sequential_anim.addAnimation(fade_out_anim)
-
-                def create_update_func(it):
-                    return lambda color: it.setBackground(QtGui.QBrush(color))
-
-                update_func = create_update_func(item)
-                fade_in_anim.valueChanged.connect(update_func)
-                fade_out_anim.valueChanged.connect(update_func)
-                animation_group.addAnimation(sequential_anim)
-
-            def on_group_finished():
-                rows_we_touched = selected_rows | {row}
-                for r in rows_we_touched:
-                    for c in range(table.columnCount()):
-                        item = table.item(r, c)
-                        if item:
-                            item.setBackground(QtGui.QBrush())
-                
-                if selected_rows:
-                    selection_model.blockSignals(True)
-                    selection_model.clear()
-                    for r in selected_rows:
-                        selection_model.select(
-                            table.model().index(r, 0),
-                            QtCore.QItemSelectionModel.Select | QtCore.QItemSelectionModel.Rows
-                        )
-                    selection_model.blockSignals(False)
-            
-            animation_group.finished.connect(on_group_finished)
-            animation_group.start(QtCore.QAbstractAnimation.DeleteWhenStopped)
-
-            if items_in_row_to_animate:
-                items_in_row_to_animate[0].setData(QtCore.Qt.UserRole + 1, animation_group)
-
     def set_dirty_flag(self, dirty=True):
         if dirty and not self.is_dirty:
             self.is_dirty = True
@@ -3538,13 +3819,14 @@ class TranslatorApp(QtWidgets.QMainWindow):
             logger.error(f"Invalid jobs_to_queue for {op_name}: {type(jobs_to_queue)}.")
             QtWidgets.QMessageBox.critical(self, "Internal Error", "Invalid job data for batch.")
             return
-        self.total_jobs_for_progress = len(self.pending_translation_jobs)
-        self.completed_jobs_for_progress = 0
+        total_jobs = len(self.pending_translation_jobs)
+        self.progress_reporter.reset(total_jobs)
         if self.progress_dialog:
             self.progress_dialog.cancel()
             self.progress_dialog.deleteLater()
             self.progress_dialog = None
-        self.progress_dialog = QtWidgets.QProgressDialog(f"{op_name} {self.total_jobs_for_progress} item(s) for '{tgt_lang}'", "Cancel", 0, self.total_jobs_for_progress, self)
+        self.progress_label_prefix = f"{op_name} {total_jobs} item(s) for '{tgt_lang}'"
+        self.progress_dialog = QtWidgets.QProgressDialog(self.progress_label_prefix, "Cancel", 0, total_jobs, self)
         self.progress_dialog.setWindowTitle(f"{op_name} Progress")
         flags = self.progress_dialog.windowFlags() & ~QtCore.Qt.WindowContextHelpButtonHint
         self.progress_dialog.setWindowFlags(flags)
@@ -3554,9 +3836,10 @@ class TranslatorApp(QtWidgets.QMainWindow):
         self.progress_dialog.setAutoClose(False)
         self.progress_dialog.setAutoReset(False)
         self.progress_dialog.show()
-        logger.info(f"Starting batch: {op_name}, {self.total_jobs_for_progress} items for lang '{tgt_lang}'.")
-        self.status_bar.showMessage(f"{op_name} {self.total_jobs_for_progress} items for '{tgt_lang}'...")
-        if self.total_jobs_for_progress > 0:
+        self.progress_refresh_timer.start()
+        logger.info(f"Starting batch: {op_name}, {total_jobs} items for lang '{tgt_lang}'.")
+        self.status_bar.showMessage(f"{op_name} {total_jobs} items for '{tgt_lang}'...")
+        if total_jobs > 0:
             self.translation_timer.start(0)
 
 
@@ -3641,7 +3924,6 @@ class TranslatorApp(QtWidgets.QMainWindow):
         used_key = job_data.get('api_key', 'UNKNOWN_KEY')
         logger.info(f"Job completed for '{job_data.get('text_to_translate')}' (UID {uid}, Key {self._mask_api_key(used_key)}) -> '{translated_text}'. In-flight jobs remaining: {self.active_translation_jobs}")
         
-        row_idx = job_data.get('row_idx', -1)
         orig_key = job_data.get('text_to_translate')
         tgt_lang = job_data.get('target_lang', '')
         src_lang = job_data.get('source_lang')
@@ -3650,38 +3932,57 @@ class TranslatorApp(QtWidgets.QMainWindow):
             if self._update_translation_cache(uid, orig_key, translated_text, src_lang, tgt_lang):
                 self.set_dirty_flag(True)
                 
-                if tgt_lang == self.translation_tab.current_target_language and 0 <= row_idx < len(self.translation_tab.table_data):
-                    tbl_uid, tbl_orig, _, _ = self.translation_tab.table_data[row_idx]
-                    if str(tbl_uid) == str(uid) and tbl_orig == orig_key:
-                        self.translation_tab.table_data[row_idx][2] = translated_text
-                        item = self.translation_tab.table.item(row_idx, 2)
-                        if item:
-                            item.setText(translated_text)
-                            self._flash_row_color(row_idx)
-                        else:
-                            self.translation_tab.table.setItem(row_idx, 2, QtWidgets.QTableWidgetItem(translated_text))
-                        
-                        if self.translation_tab.current_row == row_idx and self.translation_tab.current_orig_key_for_editor == orig_key:
-                            self.translation_tab.trans_edit.blockSignals(True)
-                            self.translation_tab.trans_edit.setText(translated_text)
-                            self.translation_tab.trans_edit.blockSignals(False)
-                            self.translation_tab.current_translation_in_editor_before_change = translated_text
-                            UIAnimator.flash_status_label(self.translation_tab.translator_save_status_label, "<b>Saved ✅</b>")
+                item_id = translation_item_id(uid, orig_key)
+                row_idx = self.translation_tab.row_by_item_id.get(item_id)
+                if tgt_lang == self.translation_tab.current_target_language and row_idx is not None:
+                    self.translation_tab.table_data[row_idx][2] = translated_text
+                    self.pending_row_updates[item_id] = translated_text
         else:
             logger.error(f"Missing job_data in _handle_job_completed. UID:{uid},Orig:{orig_key},Tgt:{tgt_lang},Src:{src_lang}. Job:{job_data}")
         
-        self._update_progress_dialog()
-
-
-        if 0 <= row_idx < self.translation_tab.table.rowCount():
-            item_to_scroll_to = self.translation_tab.table.item(row_idx, 0)
-            if item_to_scroll_to:
-                self.translation_tab.table.scrollToItem(item_to_scroll_to, QtWidgets.QAbstractItemView.ScrollHint.PositionAtCenter)
-
+        self.progress_reporter.record_completed()
+        if self.pending_row_updates and not self.job_results_flush_timer.isActive():
+            self.job_results_flush_timer.start()
 
         if not self.pending_translation_jobs and self.active_translation_jobs == 0:
             self._finalize_batch_translation("completed (last active job finished)")
 
+    def _flush_job_results(self):
+        self.job_results_flush_timer.stop()
+        row_updates = self.pending_row_updates
+        self.pending_row_updates = {}
+        table = self.translation_tab.table
+        row_by_item_id = self.translation_tab.row_by_item_id
+
+        if row_updates:
+            table.setUpdatesEnabled(False)
+            try:
+                for item_id, translated_text in row_updates.items():
+                    row_idx = row_by_item_id.get(item_id)
+                    if row_idx is None:
+                        continue
+                    item = table.item(row_idx, 2)
+                    if item:
+                        item.setText(translated_text)
+                    else:
+                        table.setItem(row_idx, 2, QtWidgets.QTableWidgetItem(translated_text))
+                    if self.translation_tab.current_row == row_idx and self.translation_tab.current_orig_key_for_editor == self.translation_tab.table_data[row_idx][1]:
+                        self.translation_tab.trans_edit.blockSignals(True)
+                        self.translation_tab.trans_edit.setText(translated_text)
+                        self.translation_tab.trans_edit.blockSignals(False)
+                        self.translation_tab.current_translation_in_editor_before_change = translated_text
+                        UIAnimator.flash_status_label(self.translation_tab.translator_save_status_label, "<b>Saved ✅</b>")
+            finally:
+                table.setUpdatesEnabled(True)
+            self.translation_tab.row_highlight_delegate.highlight_items(row_updates.keys())
+
+        if row_updates:
+            last_row = row_by_item_id.get(next(reversed(row_updates)))
+            if last_row is not None:
+                item_to_scroll_to = table.item(last_row, 0)
+                if item_to_scroll_to:
+                    table.scrollToItem(item_to_scroll_to, QtWidgets.QAbstractItemView.ScrollHint.PositionAtCenter)
+
 
     def _handle_job_failed(self, job_data, _error_str, _thinking_text, _full_error_details_str, exception_obj, extra_error_details):
             if extra_error_details is None:
@@ -3697,7 +3998,7 @@ class TranslatorApp(QtWidgets.QMainWindow):
             if is_quota_error:
                 logger.warning(f"Quota error for key {self._mask_api_key(used_key)}. Re-queuing job for '{job_data.get('text_to_translate')}'.")
                 self.pending_translation_jobs.append(job_data)
-                self.completed_jobs_for_progress -= 1
+                self.progress_reporter.record_retry()
 
                 retry_delay_seconds = extra_error_details.get('retry_delay_seconds')
                 cooldown_duration_seconds = RPM_COOLDOWN_SECONDS
@@ -3723,39 +4024,38 @@ class TranslatorApp(QtWidgets.QMainWindow):
                         self.status_bar.showMessage(f"Adjusted RPM for {current_model} to {discovered_limit_rpm} (API limit).", 7000)
                 
                 self.update_rpm_display_and_check_cooldown()
-
-            self._update_progress_dialog()
+            else:
+                self.progress_reporter.record_failed()
 
             if not self.pending_translation_jobs and self.active_translation_jobs == 0:
                 self._finalize_batch_translation("completed (last active job failed)")
 
-    def _update_progress_dialog(self):
-        self.completed_jobs_for_progress += 1
-        if self.progress_dialog:
-            current_val = self.progress_dialog.value()
-            new_val = self.completed_jobs_for_progress
-            self.progress_animation = QtCore.QPropertyAnimation(self.progress_dialog, b"value")
-            self.progress_animation.setDuration(250)
-            self.progress_animation.setStartValue(current_val)
-            self.progress_animation.setEndValue(new_val)
-            self.progress_animation.setEasingCurve(QtCore.QEasingCurve.InOutQuad)
-            self.progress_animation.start(QtCore.QAbstractAnimation.DeleteWhenStopped)
-            if new_val >= self.total_jobs_for_progress and self.active_translation_jobs == 0:
-                self._finalize_batch_translation("completed normally")
+    def _refresh_progress_dialog(self):
+        if not self.progress_dialog:
+            self.progress_refresh_timer.stop()
+            return
+        snapshot = self.progress_reporter.snapshot()
+        if self.progress_dialog.value() != snapshot["processed"]:
+            self.progress_dialog.setValue(snapshot["processed"])
+        if not self.progress_dialog.wasCanceled():
+            self.progress_dialog.setLabelText(f"{self.progress_label_prefix}\n{ProgressReporter.format_snapshot(snapshot)}")
 
     def _finalize_batch_translation(self, reason=""):
-        if not self.progress_dialog and self.total_jobs_for_progress == 0 and self.active_translation_jobs == 0:
+        self._flush_job_results()
+        snapshot = self.progress_reporter.snapshot()
+        if not self.progress_dialog and snapshot["total"] == 0 and self.active_translation_jobs == 0:
             return
-        logger.info(f"Finalizing batch. Reason: {reason}. Total:{self.total_jobs_for_progress},Done:{self.completed_jobs_for_progress},Active:{self.active_translation_jobs}")
+        self.progress_refresh_timer.stop()
+        logger.info(f"Finalizing batch. Reason: {reason}. Total:{snapshot['total']},Done:{snapshot['completed']},Failed:{snapshot['failed']},Retries:{snapshot['retries']},Active:{self.active_translation_jobs}")
         if self.progress_dialog:
-            self.progress_dialog.setValue(self.total_jobs_for_progress)
+            self.progress_dialog.setValue(snapshot["total"])
             self.progress_dialog.done(QtWidgets.QDialog.Accepted)
             self.progress_dialog.deleteLater()
             self.progress_dialog = None
 
         self.save_cache()
 
-        status_msg = f"Batch {reason}. Processed {self.completed_jobs_for_progress}/{self.total_jobs_for_progress}."
+        status_msg = f"Batch {reason}. Processed {snapshot['processed']}/{snapshot['total']}."
         if "cancel" in reason and self.pending_translation_jobs:
             rem_pend = len(self.pending_translation_jobs)
             if rem_pend > 0:
@@ -3764,8 +4064,7 @@ class TranslatorApp(QtWidgets.QMainWindow):
         self.status_bar.showMessage(status_msg, 7000)
         logger.info(status_msg)
         self.active_translation_jobs = 0
-        self.total_jobs_for_progress = 0
-        self.completed_jobs_for_progress = 0
+        self.progress_reporter.reset()
 
     @QtCore.Slot()
     def _cancel_batch_translation(self, silent=False):
@@ -4102,6 +4401,7 @@ def run_main_app():
     win = TranslatorApp()
     win.showMaximized()
     logger.info(f"Lorebook Gemini Translator v{APP_VERSION} started.")
+    start_background_update_check(win)
     sys.exit(app.exec())
 
 if __name__ == '__main__':
@@ -4135,8 +4435,6 @@ if __name__ == '__main__':
     logging.getLogger('google.auth').setLevel(lib_level)
     logging.getLogger('httpcore').setLevel(lib_level)
 
-    check_and_trigger_update()
-
     from google import genai
     from google.genai import types, errors
     from google.api_core.exceptions import ResourceExhausted
@@ -6,8 +6,13 @@ from omni_trans_core import settings
 from omni_trans_core.localization_manager import loc_man, translate
 from omni_trans_core.core import CoreApp
 from omni_trans_core.prompt_formatter import DefaultPromptFormatter
-from .data_handler import LorebookDataHandler
-from .export_manager import export_lorebook
+from .data_handler import LorebookDataHandler, prefetch_snapshots
+from .search_service import SearchService
+from .coverage_index import CoverageIndex
+from .cache_bridge import CacheWriteHooks, HeadlessCacheSync
+from . import serialization
+from .startup_profiler import profiler
+from .update_check import UpdateChecker
 from .tabs.editor_tab import EditorTab
 from .tabs.translation_tab import TranslationTab
 from .constants import (
@@ -24,6 +29,8 @@ from .constants import (
 
 logger: Logger = logging.getLogger(name=f"{LOG_PREFIX}_APP")
 
+SNAPSHOT_PREFETCH_DELAY_MS = 3000
+
 
 class LGTApp(CoreApp):
 
@@ -37,8 +44,12 @@ class LGTApp(CoreApp):
             }
         }
         settings.PROVIDER_CUSTOM_HEADERS.update(LGT_HEADERS)
+        serialization.set_fast_backend_enabled(
+            settings.current_settings.get("use_fast_json_backend", True)
+        )
+        logger.debug(f"JSON backend: {serialization.active_backend()}")
 
-        data_handler = LorebookDataHandler()
+        data_handler = LorebookDataHandler(use_snapshots=True)
         prompt_formatter = DefaultPromptFormatter(
             system_prompt=SYSTEM_PROMPT,
             user_prompt=USER_PROMPT,
@@ -46,30 +57,56 @@ class LGTApp(CoreApp):
             context_instructions=CONTEXT_INSTRUCTIONS,
         )
 
-        super().__init__(
-            data_handler=data_handler,
-            tabs=[],
-            prompt_formatter=prompt_formatter,
-            app_name=APP_NAME,
-            app_version_url=APP_VERSION_URL,
-            app_version=APP_VERSION,
-        )
+        with profiler.phase("core_app_init"):
+            super().__init__(
+                data_handler=data_handler,
+                tabs=[],
+                prompt_formatter=prompt_formatter,
+                app_name=APP_NAME,
+                app_version_url="",
+                app_version=APP_VERSION,
+            )
 
-        self._setup_ui()
-        self._connect_tab_signals()
-        self._load_icon()
-        self._show_wip_dialog()
+        with profiler.phase("build_tabs"):
+            self._setup_ui()
+        with profiler.phase("connect_tabs"):
+            self._connect_tab_signals()
+        QtCore.QTimer.singleShot(0, self._load_icon)
+        QtCore.QTimer.singleShot(0, self._show_wip_dialog)
+        self.update_checker = UpdateChecker(
+            APP_VERSION_URL,
+            APP_VERSION,
+            settings.current_settings,
+            settings.save_settings,
+            parent=self,
+        )
+        self.update_checker.update_available.connect(self._on_update_available)
+        self.update_checker.schedule()
+        QtCore.QTimer.singleShot(SNAPSHOT_PREFETCH_DELAY_MS, self._prefetch_recent_snapshots)
 
     def _setup_ui(self) -> None:
         export_action = QtGui.QAction(self)
         loc_man.register(export_action, "text", "action.export")
         loc_man.register(export_action, "toolTip", "action.export.tooltip")
         export_action.setShortcut("Ctrl+E")
-        export_action.triggered.connect(lambda: export_lorebook(self))
+        export_action.triggered.connect(self._export_lorebook)
         export_action.setEnabled(False)
         self.file_menu.insertAction(self.settings_action, export_action)
         self.data_handler.data_loaded.connect(lambda: export_action.setEnabled(True))
 
+        self.cache_hooks = CacheWriteHooks(self.cache_manager)
+        self.headless_cache_sync = HeadlessCacheSync(
+            self.data_handler, self.cache_manager, self.cache_hooks, parent=self
+        )
+        QtWidgets.QApplication.instance().aboutToQuit.connect(
+            self.headless_cache_sync.flush
+        )
+        QtWidgets.QApplication.instance().aboutToQuit.connect(
+            self.data_handler.flush_snapshot
+        )
+        self.coverage_index = CoverageIndex(
+            self.data_handler, self.cache_manager, self.cache_hooks, parent=self
+        )
         self.editor_tab = EditorTab(main_window=self, data_handler=self.data_handler)
         self.translation_tab = TranslationTab(
             main_window=self, data_handler=self.data_handler
@@ -80,13 +117,43 @@ class LGTApp(CoreApp):
         self.tab_widget.setCurrentIndex(1)
 
     def _connect_tab_signals(self) -> None:
-        self.editor_tab.search_term_changed.connect(
-            self.translation_tab.table_widget.search_input.setText
+        self.search_service = SearchService(self.data_handler, parent=self)
+        self.search_service.attach_input(
+            self.translation_tab.table_widget.search_input,
+            self.translation_tab.table_widget,
         )
-        self.translation_tab.table_widget.search_input.textChanged.connect(
-            self.editor_tab.editor_search_input.setText
+        self.editor_tab.materialized.connect(
+            lambda: self.search_service.attach_input(
+                self.editor_tab.editor_search_input, self.editor_tab.table_widget
+            )
+        )
+        self.search_service.register_view(self.editor_tab)
+        self.search_service.register_view(self.translation_tab)
+        self.search_service.add_text_provider(self.translation_tab.get_search_texts)
+        self.translation_tab.translations_changed.connect(
+            self.search_service.refresh
+        )
+
+    def _export_lorebook(self) -> None:
+        from .export_manager import export_lorebook
+
+        export_lorebook(self)
+
+    @QtCore.Slot(str, str)
+    def _on_update_available(self, remote_version: str, repo_url: str) -> None:
+        self.status_bar.showMessage(
+            translate(
+                "app.status.update_available",
+                version=remote_version,
+                current=APP_VERSION,
+            )
         )
 
+    def _prefetch_recent_snapshots(self) -> None:
+        recent_files = settings.current_settings.get("recent_files", [])
+        if isinstance(recent_files, list):
+            prefetch_snapshots(recent_files)
+
     def _load_icon(self) -> None:
         if self.ICON_BASE64_DATA:
             try:
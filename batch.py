@@ -0,0 +1,351 @@
+import os
+import sys
+import time
+import logging
+import argparse
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from logging import Logger
+from typing import Any
+from .constants import LOG_PREFIX
+from .cli import (
+    JsonLinesEmitter,
+    add_engine_arguments,
+    configure_logging,
+    create_engine_from_args,
+    initialize_settings,
+    write_trace_file,
+    EXIT_OK,
+    EXIT_FAILED,
+    EXIT_USAGE,
+)
+from .cache_store import TranslationCacheStore, HEADLESS_CACHE_SUFFIX, headless_cache_path
+from .data_handler import LorebookDataHandler
+from .engine import TranslationEngine, TranslationRequest
+from .tracing import tracer, STAGE_CACHE_WRITTEN
+from .headless import LanguagePair, EventCallback, collect_source_texts, parse_language_pair
+
+logger: Logger = logging.getLogger(f"{LOG_PREFIX}_APP.batch")
+
+BATCH_GROUP = "batch"
+AUXILIARY_SUFFIXES = ("_edit.json", "_translation_cache.json", HEADLESS_CACHE_SUFFIX, ".manifest.json")
+
+ItemKey = tuple[str, str, str]
+
+
+def is_within(path: str, directory: str) -> bool:
+    try:
+        return os.path.commonpath([path, directory]) == directory
+    except ValueError:
+        return False
+
+
+def find_lorebooks(paths: list[str], recursive: bool = False) -> list[str]:
+    found: list[str] = []
+    for path in paths:
+        if os.path.isfile(path):
+            found.append(path)
+            continue
+        if recursive:
+            candidates = (
+                os.path.join(root, name) for root, _, names in os.walk(path) for name in names
+            )
+        else:
+            candidates = (entry.path for entry in os.scandir(path) if entry.is_file())
+        for candidate in candidates:
+            if candidate.lower().endswith(".json") and not candidate.endswith(AUXILIARY_SUFFIXES):
+                found.append(candidate)
+    return sorted(dict.fromkeys(os.path.abspath(path) for path in found))
+
+
+def scan_lorebook(path: str, pairs: list[LanguagePair]) -> dict[str, Any]:
+    data_handler = LorebookDataHandler()
+    data_handler.load(path)
+    source_texts = collect_source_texts(data_handler)
+    cache = TranslationCacheStore(headless_cache_path(path))
+    cached: dict[ItemKey, str] = {}
+    for src_lang, tgt_lang in pairs:
+        for source_text in source_texts:
+            translation = cache.get(source_text, src_lang, tgt_lang)
+            if translation:
+                cached[(source_text, src_lang, tgt_lang)] = translation
+    return {
+        "path": path,
+        "cache_path": headless_cache_path(path),
+        "entries": len(data_handler.data["entries"]),
+        "source_texts": source_texts,
+        "cached": cached,
+    }
+
+
+@dataclass
+class BatchBook:
+    path: str
+    cache: TranslationCacheStore
+    entries: int
+    needed: set[ItemKey] = field(default_factory=set)
+    filled_from_other_books: int = 0
+    cached: int = 0
+    translated: int = 0
+    failed: int = 0
+    done: bool = False
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "status": "failed" if self.failed else "done",
+            "entries": self.entries,
+            "translated": self.translated,
+            "failed": self.failed,
+            "cached": self.cached,
+            "shared": self.filled_from_other_books,
+        }
+
+
+class DirectoryBatch:
+    def __init__(
+        self,
+        engine: TranslationEngine,
+        pairs: list[LanguagePair],
+        emit: EventCallback,
+        force: bool = False,
+        use_context: bool = False,
+        parse_workers: int | None = None,
+    ) -> None:
+        self.engine = engine
+        self.pairs = list(dict.fromkeys(pairs))
+        self.emit = emit
+        self.force = force
+        self.use_context = use_context
+        self.parse_workers = parse_workers
+        self.books: dict[str, BatchBook] = {}
+        self.load_failures = 0
+        self.total_requests = 0
+        self.processed = 0
+        self._waiting_books: dict[ItemKey, list[BatchBook]] = {}
+        self._contexts: dict[ItemKey, str] = {}
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+
+    def _scan_all(self, paths: list[str]) -> list[dict[str, Any]]:
+        scans: list[dict[str, Any]] = []
+        workers = self.parse_workers or min(len(paths), os.cpu_count() or 1)
+        if workers <= 1 or len(paths) <= 1:
+            futures = None
+        else:
+            try:
+                executor = ProcessPoolExecutor(max_workers=workers)
+            except (OSError, NotImplementedError) as e:
+                logger.warning(f"Process pool unavailable, parsing sequentially: {e}")
+                futures = None
+            else:
+                with executor:
+                    futures = {
+                        executor.submit(scan_lorebook, path, self.pairs): path for path in paths
+                    }
+                    for future in as_completed(futures):
+                        self._collect_scan(futures[future], future.result, scans)
+        if futures is None:
+            for path in paths:
+                self._collect_scan(path, lambda path=path: scan_lorebook(path, self.pairs), scans)
+        order = {path: index for index, path in enumerate(paths)}
+        scans.sort(key=lambda scan: order[scan["path"]])
+        return scans
+
+    def _collect_scan(self, path: str, get_result, scans: list[dict[str, Any]]) -> None:
+        try:
+            scans.append(get_result())
+        except Exception as e:
+            self.load_failures += 1
+            logger.error(f"Failed to load {path}: {e}")
+            self.emit({"event": "book_failed", "book": path, "error": str(e)})
+
+    def prepare(self, paths: list[str]) -> None:
+        started = time.monotonic()
+        scans = self._scan_all(paths)
+        known: dict[ItemKey, str] = {}
+        if not self.force:
+            for scan in scans:
+                known.update(scan["cached"])
+        for scan in scans:
+            book = BatchBook(
+                path=scan["path"],
+                cache=TranslationCacheStore(scan["cache_path"], preload=False),
+                entries=scan["entries"],
+            )
+            self.books[book.path] = book
+            for src_lang, tgt_lang in self.pairs:
+                for source_text, content in scan["source_texts"].items():
+                    item: ItemKey = (source_text, src_lang, tgt_lang)
+                    if not self.force and item in scan["cached"]:
+                        book.cached += 1
+                    elif item in known:
+                        book.cache.set(source_text, src_lang, tgt_lang, known[item])
+                        book.filled_from_other_books += 1
+                    else:
+                        book.needed.add(item)
+                        self._waiting_books.setdefault(item, []).append(book)
+                        if self.use_context and content:
+                            self._contexts.setdefault(item, content)
+        self.total_requests = len(self._waiting_books)
+        total_needed = sum(len(book.needed) for book in self.books.values())
+        self.emit(
+            {
+                "event": "batch_loaded",
+                "books": len(self.books),
+                "failed_to_load": self.load_failures,
+                "requests": self.total_requests,
+                "deduplicated": total_needed - self.total_requests,
+                "shared_from_other_books": sum(
+                    book.filled_from_other_books for book in self.books.values()
+                ),
+                "scan_seconds": round(time.monotonic() - started, 3),
+            }
+        )
+
+    def start(self) -> None:
+        for book in self.books.values():
+            if not book.needed:
+                self._finish_book(book)
+        if not self._waiting_books:
+            self._finished.set()
+            return
+        for source_text, src_lang, tgt_lang in list(self._waiting_books):
+            self.engine.submit(
+                TranslationRequest(
+                    source_text=source_text,
+                    src_lang=src_lang,
+                    tgt_lang=tgt_lang,
+                    context=self._contexts.get((source_text, src_lang, tgt_lang), ""),
+                    group=BATCH_GROUP,
+                ),
+                self._on_result,
+            )
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._finished.wait(timeout)
+
+    def cancel(self) -> None:
+        self.engine.cancel_group(BATCH_GROUP)
+        for book in self.books.values():
+            book.cache.save()
+        self._finished.set()
+
+    def _on_result(
+        self, request: TranslationRequest, translation: str | None, error: Exception | None
+    ) -> None:
+        item: ItemKey = (request.source_text, request.src_lang, request.tgt_lang)
+        completed_books: list[BatchBook] = []
+        with self._lock:
+            books = self._waiting_books.pop(item, [])
+            self.processed += 1
+            processed = self.processed
+            for book in books:
+                if translation:
+                    book.cache.set(*item, translation)
+                    book.translated += 1
+                else:
+                    book.failed += 1
+                book.needed.discard(item)
+                if not book.needed:
+                    completed_books.append(book)
+            all_done = not self._waiting_books
+        if translation:
+            tracer.mark(request.request_id, STAGE_CACHE_WRITTEN)
+        else:
+            self.emit(
+                {
+                    "event": "item_failed",
+                    "source_text": request.source_text,
+                    "pair": f"{request.src_lang}:{request.tgt_lang}",
+                    "books": [book.path for book in books],
+                    "attempts": request.attempts,
+                    "error": str(error) if error else "No translation returned.",
+                }
+            )
+        self.emit({"event": "progress", "processed": processed, "total": self.total_requests})
+        for book in completed_books:
+            self._finish_book(book)
+        if all_done:
+            self._finished.set()
+
+    def _finish_book(self, book: BatchBook) -> None:
+        book.cache.save()
+        book.done = True
+        self.emit({"event": "book_done", "book": book.path, **book.summary()})
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m lgt_app.batch",
+        description="Translate every LORE-book in one or more folders through a single shared queue.",
+    )
+    parser.add_argument("paths", nargs="+", help="Folders or LORE-book files.")
+    parser.add_argument("--pair", action="append", required=True, metavar="SOURCE:TARGET")
+    parser.add_argument("--recursive", action="store_true", help="Include sub-folders.")
+    parser.add_argument("--parse-workers", type=int, help="Processes used to parse LORE-books.")
+    add_engine_arguments(parser)
+    parser.add_argument("--force", action="store_true", help="Re-translate keys that are already cached.")
+    parser.add_argument("--use-context", action="store_true", help="Send entry content as translation context.")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    configure_logging(args)
+    emit = JsonLinesEmitter()
+    try:
+        pairs = [parse_language_pair(pair) for pair in args.pair]
+        engine = create_engine_from_args(args)
+    except ValueError as e:
+        emit({"event": "error", "error": str(e)})
+        return EXIT_USAGE
+    initialize_settings()
+    paths = find_lorebooks(args.paths, args.recursive)
+    if not paths:
+        emit({"event": "error", "error": "No LORE-books found."})
+        return EXIT_USAGE
+
+    batch = DirectoryBatch(
+        engine,
+        pairs,
+        emit,
+        force=args.force,
+        use_context=args.use_context,
+        parse_workers=args.parse_workers,
+    )
+    batch.prepare(paths)
+    engine.start()
+    interrupted = False
+    try:
+        batch.start()
+        while not batch.wait(0.5):
+            pass
+    except KeyboardInterrupt:
+        interrupted = True
+        batch.cancel()
+    finally:
+        engine.shutdown(wait=not interrupted)
+
+    write_trace_file(args)
+    failed_items = sum(book.failed for book in batch.books.values())
+    emit(
+        {
+            "event": "summary",
+            "books": len(paths),
+            "books_failed": batch.load_failures
+            + sum(1 for book in batch.books.values() if book.failed or not book.done),
+            "requests": batch.total_requests,
+            "translated": engine.completed,
+            "failed": failed_items,
+            "retried": engine.retried,
+            "interrupted": interrupted,
+        }
+    )
+    if interrupted or batch.load_failures or failed_items:
+        return EXIT_FAILED
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
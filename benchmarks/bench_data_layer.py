@@ -0,0 +1,178 @@
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from lgt_app.data_handler import LorebookDataHandler
+from lgt_app.coverage_index import CoverageIndex
+from lgt_app.export_manager import _make_entry_transform
+from lgt_app.export_writer import write_lorebook_streams
+from lgt_app.tabs.translation_tab import TranslationTab
+from synthetic import make_translation_cache, write_synthetic_project
+
+SRC_LANG = "English"
+TGT_LANG = "Ukrainian"
+DEFAULT_SIZES = "1000,10000,50000"
+DEFAULT_THRESHOLD = 0.20
+NOISE_FLOOR = {"seconds": 0.002, "peak_mib": 0.5}
+
+
+class DictCache:
+    def __init__(self, translations):
+        self.translations = translations
+
+    def get_from_cache(self, text, src_lang, tgt_lang):
+        return self.translations.get((text, src_lang, tgt_lang))
+
+
+def _noop(*args, **kwargs):
+    return None
+
+
+def make_table_harness(data_handler, cache):
+    signal = SimpleNamespace(emit=_noop)
+    combo = lambda text: SimpleNamespace(combo=SimpleNamespace(currentText=lambda: text))
+    return SimpleNamespace(
+        data_handler=data_handler,
+        main_window=SimpleNamespace(cache_manager=cache),
+        source_lang_widget=combo(SRC_LANG),
+        target_lang_widget=combo(TGT_LANG),
+        row_delegate=SimpleNamespace(clear_highlights=_noop),
+        table_widget=SimpleNamespace(set_data=_noop),
+        table_data=[],
+        row_data_by_id={},
+        search_matches=None,
+        data_availability_changed=signal,
+        translations_changed=signal,
+        _flush_pending_results=_noop,
+        apply_search_filter=_noop,
+    )
+
+
+def build_operations(project_path, temp_dir, cache):
+    handler = LorebookDataHandler()
+    handler.load(project_path)
+    coverage_index = CoverageIndex(handler, cache)
+    coverage_index.rebuild()
+    main_window = SimpleNamespace(cache_manager=cache, coverage_index=coverage_index)
+    harness = make_table_harness(handler, cache)
+    export_path = os.path.join(temp_dir, "export.json")
+    edited_ids = list(handler.data["entries"])[:: max(1, len(handler.data["entries"]) // 100)]
+
+    def load():
+        LorebookDataHandler().load(project_path)
+
+    def load_snapshot():
+        LorebookDataHandler(use_snapshots=True).load(project_path)
+
+    def save():
+        for entry_id in edited_ids:
+            handler.modified_entry_ids.add(entry_id)
+        handler.save()
+
+    def export():
+        transform = _make_entry_transform(main_window, SRC_LANG, [TGT_LANG], True, "leave")
+        write_lorebook_streams(handler.data, [(export_path, transform)])
+
+    return [
+        ("load", load),
+        ("load_snapshot", load_snapshot),
+        ("save", save),
+        ("get_sorted_lore_entries", handler.get_sorted_lore_entries),
+        ("get_translatable_items", handler.get_translatable_items),
+        ("populate_table_data", lambda: TranslationTab.populate_table_data(harness)),
+        ("export_lorebook", export),
+    ]
+
+
+def measure(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def run(sizes, keys, content_chars, repeat, seed):
+    results = {}
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_path, data = write_synthetic_project(
+                temp_dir, size, keys, content_chars, seed
+            )
+            cache = DictCache(make_translation_cache(data, SRC_LANG, TGT_LANG, seed=seed))
+            size_results = {}
+            for name, fn in build_operations(project_path, temp_dir, cache):
+                seconds, peak = measure(fn, repeat)
+                size_results[name] = {"seconds": seconds, "peak_mib": peak / 1024 / 1024}
+                print(
+                    f"{size:>8} {name:<26} {seconds * 1000:>10.1f}ms {peak / 1024 / 1024:>9.1f} MiB",
+                    flush=True,
+                )
+            results[str(size)] = size_results
+    return results
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for size, operations in results.items():
+        for name, current in operations.items():
+            previous = baseline.get(size, {}).get(name)
+            if not previous:
+                continue
+            for metric in ("seconds", "peak_mib"):
+                if previous[metric] <= 0 or max(previous[metric], current[metric]) < NOISE_FLOOR[metric]:
+                    continue
+                ratio = current[metric] / previous[metric] - 1
+                if ratio > threshold:
+                    regressions.append((size, name, metric, previous[metric], current[metric], ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the LORE-book data layer at scale.")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated entry counts, up to 200000.")
+    parser.add_argument("--keys", type=int, default=3, help="Average keys per entry.")
+    parser.add_argument("--content-chars", type=int, default=600, help="Average content length.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", help="Compare against this baseline JSON file.")
+    parser.add_argument("--save-baseline", help="Write the results to this baseline JSON file.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed slowdown, 0.2 = 20%%.")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    print(f"{'entries':>8} {'operation':<26} {'time':>12} {'peak':>13}")
+    results = run(sizes, args.keys, args.content_chars, args.repeat, args.seed)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline written to {args.save_baseline}")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for size, name, metric, previous, current, ratio in regressions:
+            print(f"REGRESSION {size} {name} {metric}: {previous:.4f} -> {current:.4f} (+{ratio:.0%})")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions above {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
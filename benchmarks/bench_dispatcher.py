@@ -0,0 +1,217 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import threading
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from lgt_app.engine import TranslationEngine, TranslationRequest
+from lgt_app.providers import create_provider
+from mock_provider import add_server_arguments, create_mock_server, state_from_args
+
+MONOLITH_PATH = Path(__file__).resolve().parents[1] / "Lorebook_Gemini_Translator.py"
+MONOLITH_RPM_WINDOW_SECONDS = 60.0
+MONOLITH_POLL_INTERVAL_MS = 20
+
+
+def run_batch(args):
+    state = state_from_args(args)
+    server = create_mock_server(state)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    if args.provider == "gemini":
+        provider = create_provider("gemini", base_url=f"{base}/v1beta")
+    else:
+        provider = create_provider("openai", model="mock-model", base_url=f"{base}/v1")
+    api_keys = [f"mock-key-{index:02d}" for index in range(args.keys)]
+    engine = TranslationEngine(
+        provider,
+        api_keys,
+        rpm_limit=args.client_rpm or args.server_rpm,
+        concurrency=args.concurrency,
+        max_retries=args.max_retries,
+        rpm_window_seconds=args.window,
+    )
+    results = {"ok": 0, "failed": 0}
+    lock = threading.Lock()
+
+    def on_result(request, translation, error):
+        with lock:
+            results["ok" if translation else "failed"] += 1
+
+    engine.start()
+    started = time.perf_counter()
+    for index in range(args.requests):
+        engine.submit(
+            TranslationRequest(
+                source_text=f"keyword {index}",
+                src_lang="English",
+                tgt_lang="Ukrainian",
+                group=f"book-{index % args.books}",
+            ),
+            on_result,
+        )
+    finished = engine.wait_idle(args.timeout)
+    elapsed = time.perf_counter() - started
+    engine_stats = engine.stats()
+    engine.shutdown(wait=False)
+    server.shutdown()
+    server.server_close()
+    return finished, elapsed, results, dict(engine.requests_per_key), engine_stats, state.stats()
+
+
+def load_monolith(base_url, settings_dir):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from google import genai
+    from google.genai import types, errors
+    from google.api_core.exceptions import ResourceExhausted
+
+    sys.path.insert(0, str(MONOLITH_PATH.parent))
+    spec = importlib.util.spec_from_file_location("Lorebook_Gemini_Translator", MONOLITH_PATH)
+    monolith = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(monolith)
+    # Settings changes made during the run must not reach the user's translator_settings.json.
+    monolith.SETTINGS_FILE = os.path.join(settings_dir, "translator_settings.json")
+    # The monolith binds its Gemini imports in the __main__ block; the client is pointed at the mock server.
+    monolith.types, monolith.errors, monolith.ResourceExhausted = types, errors, ResourceExhausted
+    monolith.genai = SimpleNamespace(
+        Client=lambda api_key: genai.Client(api_key=api_key, http_options=types.HttpOptions(base_url=base_url))
+    )
+    return monolith
+
+
+def run_monolith_batch(args):
+    state = state_from_args(args)
+    server = create_mock_server(state)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    settings_dir = tempfile.TemporaryDirectory(prefix="lgt_bench_")
+    monolith = load_monolith(f"http://127.0.0.1:{server.server_port}", settings_dir.name)
+    from PySide6 import QtCore, QtWidgets
+
+    api_keys = [f"mock-key-{index:02d}" for index in range(args.keys)]
+    monolith.current_settings.update(
+        {
+            "api_keys": api_keys,
+            "current_api_key_index": 0,
+            "gemini_model": "mock-model",
+            "rpm_limit": args.client_rpm or args.server_rpm,
+            "manual_rpm_control": False,
+            "enable_model_thinking": False,
+            "show_log_panel": False,
+            "log_to_file": False,
+        }
+    )
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    window = monolith.TranslatorApp()
+    # No project is open, so the debounced auto-save would prompt for an export path.
+    window.set_dirty_flag = lambda dirty=True: None
+    for index in range(args.requests):
+        job_data, _ = window._get_translation_from_cache_or_prepare_job(
+            f"keyword {index}", "English", "Ukrainian", index, None
+        )
+        window.pending_translation_jobs.append(job_data)
+    window.progress_reporter.reset(args.requests)
+
+    cooldowns = {"seen": {}, "seconds": 0.0}
+    outcome = {"finished": False, "unfinished": 0}
+    started = time.perf_counter()
+    deadline = started + args.timeout
+
+    def poll():
+        now = time.monotonic()
+        for key, cooldown_end in window.api_key_cooldown_end_times.items():
+            if cooldowns["seen"].get(key) != cooldown_end:
+                cooldowns["seen"][key] = cooldown_end
+                cooldowns["seconds"] += max(0.0, cooldown_end - now)
+        if not window.pending_translation_jobs and window.active_translation_jobs == 0:
+            outcome["finished"] = True
+            app.quit()
+        elif time.perf_counter() > deadline:
+            outcome["unfinished"] = len(window.pending_translation_jobs) + window.active_translation_jobs
+            window._cancel_batch_translation(silent=True)
+            app.quit()
+
+    poll_timer = QtCore.QTimer()
+    poll_timer.timeout.connect(poll)
+    poll_timer.start(MONOLITH_POLL_INTERVAL_MS)
+    window.translation_timer.start(0)
+    app.exec()
+    elapsed = time.perf_counter() - started
+    poll_timer.stop()
+    window.translation_timer.stop()
+    window.rpm_monitor_timer.stop()
+    window.thread_pool.waitForDone()
+    server_stats = state.stats()
+    server.shutdown()
+    server.server_close()
+    settings_dir.cleanup()
+
+    ok = len(window.cache)
+    rate_limited = sum(server_stats["rate_limited"].values())
+    results = {"ok": ok, "failed": args.requests - ok - outcome["unfinished"]}
+    requests_per_key = {
+        key: server_stats["served"].get(key, 0) + server_stats["rate_limited"].get(key, 0) for key in api_keys
+    }
+    dispatcher_stats = {"retried": rate_limited, "rate_limited": rate_limited, "cooldown_seconds": cooldowns["seconds"]}
+    return outcome["finished"], elapsed, results, requests_per_key, dispatcher_stats, server_stats
+
+
+def report(args, finished, elapsed, results, requests_per_key, engine_stats, server_stats):
+    capacity = args.server_rpm * elapsed / args.window if args.window else 0
+    print(f"Target:          {args.target}")
+    print(f"Provider:        {args.provider}, {args.keys} key(s), {args.requests} request(s), {args.books} book(s)")
+    print(f"Finished:        {finished} in {elapsed:.2f}s")
+    print(f"Results:         {results['ok']} ok, {results['failed']} failed, {engine_stats['retried']} retried")
+    print(f"Throughput:      {results['ok'] / elapsed:.2f} translations/s")
+    print(f"Wasted cooldowns: {engine_stats['rate_limited']} (429s answered by the server)")
+    print(
+        f"Cooldown time:   {engine_stats['cooldown_seconds']:.1f}s applied vs "
+        f"{server_stats['retry_delay_total']:.1f}s actually needed"
+    )
+    print(f"Server errors:   {server_stats['server_errors']}")
+    print("Key utilisation:")
+    for key, sent in requests_per_key.items():
+        served = server_stats["served"].get(key, 0)
+        limited = server_stats["rate_limited"].get(key, 0)
+        utilisation = served / capacity if capacity else 0.0
+        print(f"  {key}: {sent:>5} sent, {served:>5} served, {limited:>4} limited, {utilisation:>6.1%} of quota")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive a translation dispatcher against the mock provider.")
+    parser.add_argument(
+        "--target",
+        choices=["engine", "monolith"],
+        default="engine",
+        help="engine: the headless TranslationEngine; monolith: TranslatorApp._dispatch_next_job_to_pool.",
+    )
+    parser.add_argument("--provider", choices=["gemini", "openai"], default="gemini")
+    parser.add_argument("--keys", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--books", type=int, default=3, help="Spread requests over this many groups.")
+    parser.add_argument("--client-rpm", type=int, help="RPM the engine assumes per key (defaults to --server-rpm).")
+    parser.add_argument("--concurrency", type=int)
+    parser.add_argument("--max-retries", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=600.0)
+    add_server_arguments(parser)
+    parser.set_defaults(window=6.0, latency="lognormal:0.05,0.4")
+    args = parser.parse_args()
+    if args.target == "monolith":
+        if args.provider != "gemini":
+            parser.error("--target monolith only speaks the Gemini API")
+        if args.window != MONOLITH_RPM_WINDOW_SECONDS:
+            print(f"Note: the monolith counts RPM over a fixed {MONOLITH_RPM_WINDOW_SECONDS:.0f}s window; using it for the server too.")
+            args.window = MONOLITH_RPM_WINDOW_SECONDS
+        args.books = 1
+        report(args, *run_monolith_batch(args))
+    else:
+        report(args, *run_batch(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from lgt_app import serialization
+from lgt_app.export_writer import write_lorebook_stream
+from synthetic import make_synthetic_lorebook
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def run(data, repeat):
+    rows = []
+    backends = [False, True] if serialization.HAS_ORJSON else [False]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        out_path = os.path.join(temp_dir, "book.json")
+        for fast in backends:
+            serialization.set_fast_backend_enabled(fast)
+            backend = serialization.active_backend()
+            for compact in (False, True):
+                mode = "compact" if compact else "indent=2"
+                dump_time, text = timed(
+                    lambda: serialization.dumps(data, compact=compact), repeat
+                )
+                stream_time, _ = timed(
+                    lambda: write_lorebook_stream(data, out_path, compact=compact),
+                    repeat,
+                )
+                size = os.path.getsize(out_path)
+                load_time, _ = timed(lambda: serialization.load_file(out_path), repeat)
+                rows.append((backend, mode, dump_time, stream_time, load_time, size, hash(text)))
+    serialization.set_fast_backend_enabled(True)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare JSON backends and layouts.")
+    parser.add_argument("--input", help="Existing LORE-book to benchmark instead of synthetic data.")
+    parser.add_argument("--entries", type=int, default=20000)
+    parser.add_argument("--keys", type=int, default=5)
+    parser.add_argument("--content-chars", type=int, default=1200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.input:
+        data = serialization.load_file(args.input)
+        label = args.input
+    else:
+        data = make_synthetic_lorebook(args.entries, args.keys, args.content_chars)
+        label = f"synthetic ({args.entries} entries)"
+
+    print(f"Book: {label}")
+    print(f"{'backend':<8} {'layout':<9} {'dumps':>9} {'stream':>9} {'load':>9} {'size':>12}")
+    rows = run(data, args.repeat)
+    for backend, mode, dump_time, stream_time, load_time, size, _ in rows:
+        print(
+            f"{backend:<8} {mode:<9} {dump_time * 1000:>7.1f}ms {stream_time * 1000:>7.1f}ms "
+            f"{load_time * 1000:>7.1f}ms {size / 1024 / 1024:>9.2f} MiB"
+        )
+    for mode in ("indent=2", "compact"):
+        digests = {digest for _, row_mode, *_, digest in rows if row_mode == mode}
+        print(f"{mode}: output identical across backends: {len(digests) == 1}")
+
+
+if __name__ == "__main__":
+    main()
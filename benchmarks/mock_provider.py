@@ -0,0 +1,283 @@
+import re
+import sys
+import json
+import math
+import time
+import random
+import argparse
+import threading
+from collections import deque, Counter
+from http import HTTPStatus
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+KEYWORD_PATTERN = re.compile(r'keyword(?: is)?:? "(.*?)"', re.S)
+
+
+def parse_latency(spec):
+    kind, _, params = spec.partition(":")
+    values = [float(value) for value in params.split(",") if value]
+    if kind == "fixed":
+        return lambda rng: values[0]
+    if kind == "uniform":
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == "normal":
+        return lambda rng: max(0.0, rng.gauss(values[0], values[1]))
+    if kind == "lognormal":
+        median, sigma = values
+        return lambda rng: rng.lognormvariate(math.log(median), sigma)
+    raise ValueError(f"Unknown latency distribution '{spec}'.")
+
+
+def estimate_tokens(text):
+    return max(1, len(text) // 4)
+
+
+class KeyQuota:
+    def __init__(self, rpm, tpm, window_seconds):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.window_seconds = window_seconds
+        self.requests = deque()
+        self.tokens = deque()
+
+    def _trim(self, now):
+        while self.requests and now - self.requests[0] >= self.window_seconds:
+            self.requests.popleft()
+        while self.tokens and now - self.tokens[0][0] >= self.window_seconds:
+            self.tokens.popleft()
+
+    def check(self, now, tokens):
+        self._trim(now)
+        if self.rpm and len(self.requests) >= self.rpm:
+            return "GenerateRequestsPerMinutePerProjectPerModel", self.rpm, self.requests[0] + self.window_seconds - now
+        used_tokens = sum(count for _, count in self.tokens)
+        if self.tpm and used_tokens + tokens > self.tpm:
+            return "GenerateContentInputTokensPerModelPerMinute", self.tpm, self.tokens[0][0] + self.window_seconds - now
+        self.requests.append(now)
+        self.tokens.append((now, tokens))
+        return None
+
+
+class MockProviderState:
+    def __init__(
+        self,
+        latency="lognormal:0.25,0.4",
+        rpm=15,
+        tpm=0,
+        window_seconds=60.0,
+        thinking=False,
+        error_rate=0.0,
+        omit_retry_delay=False,
+        seed=0,
+    ):
+        self.sample_latency = parse_latency(latency)
+        self.rpm = rpm
+        self.tpm = tpm
+        self.window_seconds = window_seconds
+        self.thinking = thinking
+        self.error_rate = error_rate
+        self.omit_retry_delay = omit_retry_delay
+        self.rng = random.Random(seed)
+        self.quotas = {}
+        self.lock = threading.Lock()
+        self.served = Counter()
+        self.rate_limited = Counter()
+        self.server_errors = 0
+        self.retry_delay_total = 0.0
+
+    def admit(self, api_key, tokens):
+        with self.lock:
+            quota = self.quotas.get(api_key)
+            if quota is None:
+                quota = self.quotas[api_key] = KeyQuota(self.rpm, self.tpm, self.window_seconds)
+            violation = quota.check(time.monotonic(), tokens)
+            if violation is not None:
+                self.rate_limited[api_key] += 1
+                self.retry_delay_total += max(0.0, violation[2])
+                return violation
+            if self.error_rate and self.rng.random() < self.error_rate:
+                self.server_errors += 1
+                return "server_error"
+            self.served[api_key] += 1
+            return None
+
+    def latency(self):
+        with self.lock:
+            return self.sample_latency(self.rng)
+
+    def stats(self):
+        with self.lock:
+            return {
+                "served": dict(self.served),
+                "rate_limited": dict(self.rate_limited),
+                "server_errors": self.server_errors,
+                "retry_delay_total": round(self.retry_delay_total, 3),
+            }
+
+
+def fake_translation(prompt):
+    match = KEYWORD_PATTERN.search(prompt)
+    keyword = match.group(1) if match else prompt.strip().splitlines()[-1]
+    return f"~{keyword}~"
+
+
+class MockProviderHandler(BaseHTTPRequestHandler):
+    state: MockProviderState
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body, headers=None):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _rate_limited(self, metric, limit, retry_delay):
+        details = [
+            {
+                "@type": "type.googleapis.com/google.rpc.QuotaFailure",
+                "violations": [
+                    {
+                        "quotaMetric": f"generativelanguage.googleapis.com/{metric}",
+                        "quotaId": metric,
+                        "quotaValue": str(limit),
+                    }
+                ],
+            }
+        ]
+        if not self.state.omit_retry_delay:
+            details.append(
+                {
+                    "@type": "type.googleapis.com/google.rpc.RetryInfo",
+                    "retryDelay": f"{max(1, math.ceil(retry_delay))}s",
+                }
+            )
+        self._send(
+            HTTPStatus.TOO_MANY_REQUESTS,
+            {
+                "error": {
+                    "code": 429,
+                    "message": "You exceeded your current quota.",
+                    "status": "RESOURCE_EXHAUSTED",
+                    "details": details,
+                }
+            },
+        )
+
+    def do_GET(self):
+        if urlparse(self.path).path == "/stats":
+            self._send(HTTPStatus.OK, self.state.stats())
+        else:
+            self._send(HTTPStatus.NOT_FOUND, {"error": {"code": 404, "message": "Not found"}})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", "0"))) or b"{}")
+        if url.path.endswith(":generateContent"):
+            api_key = self.headers.get("x-goog-api-key") or parse_qs(url.query).get("key", [""])[0]
+            system = " ".join(part.get("text", "") for part in body.get("systemInstruction", {}).get("parts", []))
+            prompt = " ".join(
+                part.get("text", "") for content in body.get("contents", []) for part in content.get("parts", [])
+            )
+            style = "gemini"
+        elif url.path.endswith("/chat/completions"):
+            api_key = self.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+            messages = body.get("messages", [])
+            system = " ".join(m.get("content", "") for m in messages if m.get("role") == "system")
+            prompt = " ".join(m.get("content", "") for m in messages if m.get("role") != "system")
+            style = "openai"
+        else:
+            self._send(HTTPStatus.NOT_FOUND, {"error": {"code": 404, "message": "Not found"}})
+            return
+        if not api_key:
+            self._send(HTTPStatus.UNAUTHORIZED, {"error": {"code": 401, "message": "API key missing"}})
+            return
+        tokens = estimate_tokens(system) + estimate_tokens(prompt)
+        verdict = self.state.admit(api_key, tokens)
+        if verdict == "server_error":
+            time.sleep(self.state.latency() / 4)
+            self._send(HTTPStatus.SERVICE_UNAVAILABLE, {"error": {"code": 503, "message": "The model is overloaded."}})
+            return
+        if verdict is not None:
+            self._rate_limited(*verdict)
+            return
+        time.sleep(self.state.latency())
+        translation = fake_translation(prompt)
+        if style == "gemini":
+            parts = [{"text": translation}]
+            if self.state.thinking:
+                parts.insert(0, {"text": "Considering the lore context first...", "thought": True})
+            self._send(
+                HTTPStatus.OK,
+                {
+                    "candidates": [{"content": {"role": "model", "parts": parts}, "finishReason": "STOP"}],
+                    "usageMetadata": {"promptTokenCount": tokens, "candidatesTokenCount": estimate_tokens(translation)},
+                },
+            )
+        else:
+            self._send(
+                HTTPStatus.OK,
+                {
+                    "choices": [{"index": 0, "message": {"role": "assistant", "content": translation}, "finish_reason": "stop"}],
+                    "usage": {"prompt_tokens": tokens, "completion_tokens": estimate_tokens(translation)},
+                },
+            )
+
+
+def create_mock_server(state, host="127.0.0.1", port=0):
+    handler = type("BoundMockProviderHandler", (MockProviderHandler,), {"state": state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def add_server_arguments(parser):
+    parser.add_argument("--latency", default="lognormal:0.25,0.4", help="fixed:S, uniform:A,B, normal:MU,SD or lognormal:MEDIAN,SIGMA")
+    parser.add_argument("--server-rpm", type=int, default=15, help="Requests per window allowed per key.")
+    parser.add_argument("--server-tpm", type=int, default=0, help="Tokens per window allowed per key (0 = unlimited).")
+    parser.add_argument("--window", type=float, default=60.0, help="Quota window in seconds.")
+    parser.add_argument("--thinking", action="store_true", help="Add thought parts to Gemini responses.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with HTTP 503.")
+    parser.add_argument("--omit-retry-delay", action="store_true", help="Leave retryDelay out of 429 payloads.")
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def state_from_args(args):
+    return MockProviderState(
+        latency=args.latency,
+        rpm=args.server_rpm,
+        tpm=args.server_tpm,
+        window_seconds=args.window,
+        thinking=args.thinking,
+        error_rate=args.error_rate,
+        omit_retry_delay=args.omit_retry_delay,
+        seed=args.seed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Gemini and OpenAI-compatible APIs.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    add_server_arguments(parser)
+    args = parser.parse_args()
+    server = create_mock_server(state_from_args(args), args.host, args.port)
+    print(f"Gemini:  http://{args.host}:{server.server_port}/v1beta")
+    print(f"OpenAI:  http://{args.host}:{server.server_port}/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+import os
+import json
+import random
+
+WORDS = [
+    "ancient", "dragon", "citadel", "névoa", "zúčtování", "эльф", "crown",
+    "river", "oath", "ember", "shadow", "guild", "relic", "storm", "echo",
+]
+
+
+def _content(rng, content_chars):
+    content_words = []
+    length = 0
+    while length < content_chars:
+        word = rng.choice(WORDS)
+        content_words.append(word)
+        length += len(word) + 1
+    return " ".join(content_words)
+
+
+def make_synthetic_lorebook(num_entries, keys_per_entry, content_chars, seed=0, vary=False):
+    rng = random.Random(seed)
+    entries = {}
+    for uid in range(num_entries):
+        key_count = keys_per_entry
+        entry_chars = content_chars
+        if vary:
+            key_count = rng.randint(max(0, keys_per_entry // 2), keys_per_entry * 2)
+            entry_chars = int(content_chars * rng.uniform(0.25, 1.75))
+        content = _content(rng, entry_chars)
+        entries[str(uid)] = {
+            "uid": uid,
+            "key": [f"{rng.choice(WORDS)} {uid}-{k}" for k in range(key_count)],
+            "keysecondary": [],
+            "comment": f"Entry {uid}",
+            "content": content,
+            "constant": False,
+            "vectorized": False,
+            "selective": True,
+            "selectiveLogic": 0,
+            "order": 100,
+            "position": 0,
+            "disable": False,
+            "probability": 100,
+            "useProbability": True,
+            "group": "",
+            "automationId": "",
+        }
+    return {"entries": entries}
+
+
+def make_edit_overlay(data, modified_ratio=0.05, deleted_ratio=0.01, seed=0):
+    rng = random.Random(seed + 1)
+    entry_ids = list(data["entries"])
+    modified_count = int(len(entry_ids) * modified_ratio)
+    deleted_count = int(len(entry_ids) * deleted_ratio)
+    picked = rng.sample(entry_ids, min(len(entry_ids), modified_count + deleted_count))
+    modified_ids, deleted_ids = picked[:modified_count], picked[modified_count:]
+    overlay = {"entries": {}, "deleted": deleted_ids}
+    for entry_id in modified_ids:
+        entry = dict(data["entries"][entry_id])
+        entry["key"] = entry["key"] + [f"{rng.choice(WORDS)} edited-{entry_id}"]
+        entry["content"] = entry["content"] + " " + _content(rng, 80)
+        overlay["entries"][entry_id] = entry
+    next_uid = len(entry_ids)
+    for offset in range(max(1, modified_count // 10)):
+        uid = next_uid + offset
+        overlay["entries"][str(uid)] = {
+            "uid": uid,
+            "key": [f"{rng.choice(WORDS)} new-{uid}"],
+            "comment": f"New entry {uid}",
+            "content": _content(rng, 200),
+        }
+    return overlay
+
+
+def make_translation_cache(data, src_lang, tgt_lang, translated_ratio=0.5, seed=0):
+    rng = random.Random(seed + 2)
+    cache = {}
+    for entry in data["entries"].values():
+        for key_text in entry["key"]:
+            if rng.random() < translated_ratio:
+                cache[(key_text, src_lang, tgt_lang)] = f"[{tgt_lang}] {key_text}"
+    return cache
+
+
+def write_synthetic_project(directory, num_entries, keys_per_entry=3, content_chars=600, seed=0, overlay=True):
+    data = make_synthetic_lorebook(num_entries, keys_per_entry, content_chars, seed, vary=True)
+    path = os.path.join(directory, f"synthetic_{num_entries}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    if overlay:
+        base_name, _ = os.path.splitext(path)
+        with open(f"{base_name}_edit.json", "w", encoding="utf-8") as f:
+            json.dump(make_edit_overlay(data, seed=seed), f, ensure_ascii=False, indent=2)
+    return path, data
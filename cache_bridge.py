@@ -0,0 +1,97 @@
+import inspect
+import logging
+from logging import Logger
+from typing import TYPE_CHECKING, Any, Callable
+from PySide6 import QtCore
+from .constants import LOG_PREFIX
+from .cache_store import TranslationCacheStore, headless_cache_path
+
+if TYPE_CHECKING:
+    from .data_handler import LorebookDataHandler
+
+logger: Logger = logging.getLogger(f"{LOG_PREFIX}_APP.cache_bridge")
+
+CacheListener = Callable[[str, str, str, str], None]
+HEADLESS_SYNC_SAVE_DELAY_MS = 2000
+
+
+class CacheWriteHooks:
+    def __init__(self, cache_manager) -> None:
+        self.cache_manager = cache_manager
+        self._update_cache = cache_manager.update_cache
+        self._signature = inspect.signature(self._update_cache)
+        self._listeners: list[CacheListener] = []
+        cache_manager.update_cache = self.update_cache
+
+    def add_listener(self, listener: CacheListener) -> None:
+        self._listeners.append(listener)
+
+    def update_cache(self, *args: Any, **kwargs: Any) -> Any:
+        result = self._update_cache(*args, **kwargs)
+        source_text, translation, src_lang, tgt_lang = self._signature.bind(*args, **kwargs).args[:4]
+        for listener in list(self._listeners):
+            listener(source_text, translation or "", src_lang, tgt_lang)
+        return result
+
+
+class HeadlessCacheSync(QtCore.QObject):
+    def __init__(
+        self,
+        data_handler: "LorebookDataHandler",
+        cache_manager,
+        hooks: CacheWriteHooks,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+        self.data_handler = data_handler
+        self.cache_manager = cache_manager
+        self._store: TranslationCacheStore | None = None
+        self._importing = False
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(HEADLESS_SYNC_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.flush)
+        hooks.add_listener(self._on_cache_write)
+        self.data_handler.data_loaded.connect(self._on_data_loaded)
+
+    @QtCore.Slot()
+    def flush(self) -> None:
+        self._save_timer.stop()
+        if self._store is not None:
+            self._store.save()
+
+    @QtCore.Slot()
+    def _on_data_loaded(self) -> None:
+        self.flush()
+        path = self.data_handler.get_project_path()
+        self._store = TranslationCacheStore(headless_cache_path(path)) if path else None
+        if self._store is not None and self.data_handler.data:
+            self._import_headless_results()
+
+    def _import_headless_results(self) -> None:
+        assert self._store is not None and self.data_handler.data is not None
+        key_texts = {
+            key_text
+            for entry_data in self.data_handler.data["entries"].values()
+            for key_text in entry_data.get("key", [])
+        }
+        imported = 0
+        self._importing = True
+        try:
+            for src_lang, tgt_lang in self._store.language_pairs():
+                for key_text in key_texts:
+                    translation = self._store.get(key_text, src_lang, tgt_lang)
+                    if translation and not self.cache_manager.get_from_cache(key_text, src_lang, tgt_lang):
+                        self.cache_manager.update_cache(key_text, translation, src_lang, tgt_lang)
+                        imported += 1
+        finally:
+            self._importing = False
+        if imported:
+            logger.info(f"Imported {imported} translation(s) from {self._store.path}.")
+
+    def _on_cache_write(self, source_text: str, translation: str, src_lang: str, tgt_lang: str) -> None:
+        if self._importing or self._store is None:
+            return
+        self._store.set(source_text, src_lang, tgt_lang, translation)
+        if not self._save_timer.isActive():
+            self._save_timer.start()
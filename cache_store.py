@@ -0,0 +1,126 @@
+import os
+import hashlib
+import logging
+import threading
+from logging import Logger
+from .constants import LOG_PREFIX
+from . import serialization
+
+logger: Logger = logging.getLogger(f"{LOG_PREFIX}_APP.cache_store")
+
+HEADLESS_CACHE_SUFFIX = "_headless_cache.json"
+
+_DELETED = object()
+_save_locks: dict[str, threading.Lock] = {}
+_save_locks_guard = threading.Lock()
+
+
+def _save_lock(path: str) -> threading.Lock:
+    key = os.path.normcase(os.path.abspath(path))
+    with _save_locks_guard:
+        lock = _save_locks.get(key)
+        if lock is None:
+            lock = _save_locks[key] = threading.Lock()
+        return lock
+
+
+def headless_cache_path(lorebook_path: str) -> str:
+    # The core cache manager's key scheme is private to it, so headless runs keep their own
+    # file; cache_bridge.HeadlessCacheSync copies entries between the two in the GUI.
+    base_name, _ = os.path.splitext(lorebook_path)
+    return f"{base_name}{HEADLESS_CACHE_SUFFIX}"
+
+
+def cache_key(source_text: str, src_lang: str, tgt_lang: str) -> str:
+    text_hash = hashlib.sha256(source_text.strip().encode("utf-8")).hexdigest()[:16]
+    return f"{src_lang.strip()}_{tgt_lang.strip()}_{text_hash}"
+
+
+class TranslationCacheStore:
+    def __init__(self, path: str, compact: bool = False, preload: bool = True) -> None:
+        self.path = path
+        self.compact = compact
+        self._data: dict[str, object] = {}
+        self._pending: dict[str, object] = {}
+        self._lock = threading.Lock()
+        if preload:
+            self.load()
+
+    def _read_file(self) -> dict[str, object]:
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            loaded = serialization.load_file(self.path)
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not read translation cache {self.path}: {e}")
+            return {}
+        if not isinstance(loaded, dict):
+            logger.warning(f"Ignoring translation cache {self.path}: not a JSON object.")
+            return {}
+        return loaded
+
+    def load(self) -> None:
+        loaded = self._read_file()
+        with self._lock:
+            self._data = loaded
+            self._pending.clear()
+        logger.debug(f"Loaded {len(loaded)} cached translations from {self.path}")
+
+    def get(self, source_text: str, src_lang: str, tgt_lang: str) -> str | None:
+        with self._lock:
+            value = self._data.get(cache_key(source_text, src_lang, tgt_lang))
+        return value if isinstance(value, str) and value else None
+
+    def set(self, source_text: str, src_lang: str, tgt_lang: str, translation: str | None) -> None:
+        key = cache_key(source_text, src_lang, tgt_lang)
+        translation = translation.strip() if translation else ""
+        with self._lock:
+            if translation:
+                self._data[key] = translation
+                self._pending[key] = translation
+            elif key in self._data:
+                del self._data[key]
+                self._pending[key] = _DELETED
+
+    def language_pairs(self) -> frozenset[tuple[str, str]]:
+        with self._lock:
+            keys = list(self._data)
+        pairs = []
+        for key in keys:
+            prefix, _, _ = key.rpartition("_")
+            src_lang, separator, tgt_lang = prefix.partition("_")
+            if separator and src_lang and tgt_lang and "_" not in tgt_lang:
+                pairs.append((src_lang, tgt_lang))
+        return frozenset(pairs)
+
+    def is_dirty(self) -> bool:
+        with self._lock:
+            return bool(self._pending)
+
+    def save(self) -> bool:
+        with self._lock:
+            if not self._pending:
+                return False
+            pending = dict(self._pending)
+            self._pending.clear()
+        try:
+            with _save_lock(self.path):
+                merged = self._read_file()
+                for key, value in pending.items():
+                    if value is _DELETED:
+                        merged.pop(key, None)
+                    else:
+                        merged[key] = value
+                serialization.dump_file(merged, self.path, compact=self.compact)
+        except OSError as e:
+            logger.error(f"Failed to save translation cache {self.path}: {e}")
+            with self._lock:
+                for key, value in pending.items():
+                    self._pending.setdefault(key, value)
+            return False
+        with self._lock:
+            for key, value in merged.items():
+                if key not in self._pending:
+                    self._data[key] = value
+        logger.debug(f"Saved {len(pending)} translation cache change(s) to {self.path}")
+        return True
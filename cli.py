@@ -0,0 +1,211 @@
+import os
+import sys
+import json
+import logging
+import argparse
+import threading
+from logging import Logger
+from pathlib import Path
+from typing import Any
+from .constants import LOG_PREFIX
+from . import serialization
+from .providers import create_provider
+from .engine import TranslationEngine, DEFAULT_RPM_LIMIT, DEFAULT_MAX_RETRIES
+from .headless import BookJob, parse_language_pair
+from .tracing import tracer
+
+logger: Logger = logging.getLogger(f"{LOG_PREFIX}_APP.cli")
+
+API_KEYS_ENV = "LGT_API_KEYS"
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+
+
+class JsonLinesEmitter:
+    def __init__(self, stream=None) -> None:
+        self.stream = stream or sys.stdout
+        self._lock = threading.Lock()
+
+    def __call__(self, event: dict[str, Any]) -> None:
+        line = json.dumps(event, ensure_ascii=False)
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+
+def _api_keys_from_args(args: argparse.Namespace) -> list[str]:
+    api_keys = [key.strip() for key in args.api_key or [] if key.strip()]
+    if not api_keys:
+        api_keys = [
+            key.strip()
+            for key in os.environ.get(API_KEYS_ENV, "").replace(";", ",").split(",")
+            if key.strip()
+        ]
+    return api_keys
+
+
+def add_engine_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--api-key",
+        action="append",
+        help=f"API key. Can be repeated; defaults to the comma-separated {API_KEYS_ENV} variable.",
+    )
+    parser.add_argument("--provider", choices=["gemini", "openai"], default="gemini")
+    parser.add_argument("--model", help="Model name (defaults to the provider default).")
+    parser.add_argument("--base-url", help="API base URL (required for the openai provider).")
+    parser.add_argument("--temperature", type=float)
+    parser.add_argument("--rpm", type=int, default=DEFAULT_RPM_LIMIT, help="Requests per minute per key.")
+    parser.add_argument("--concurrency", type=int, help="Maximum parallel requests.")
+    parser.add_argument("--max-retries", type=int, default=DEFAULT_MAX_RETRIES)
+    parser.add_argument("--log-level", default="WARNING", help="Log level for messages on stderr.")
+    parser.add_argument(
+        "--trace-file",
+        help="Write per-stage latency histograms here when done (.prom for OpenMetrics, otherwise JSON).",
+    )
+
+
+def configure_logging(args: argparse.Namespace) -> None:
+    logging.basicConfig(
+        level=getattr(logging, str(args.log_level).upper(), logging.WARNING),
+        stream=sys.stderr,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+
+def create_engine_from_args(args: argparse.Namespace) -> TranslationEngine:
+    api_keys = _api_keys_from_args(args)
+    if not api_keys:
+        raise ValueError(f"No API keys given. Use --api-key or set {API_KEYS_ENV}.")
+    provider = create_provider(
+        args.provider, model=args.model, base_url=args.base_url, temperature=args.temperature
+    )
+    return TranslationEngine(
+        provider,
+        api_keys,
+        rpm_limit=args.rpm,
+        concurrency=args.concurrency,
+        max_retries=args.max_retries,
+    )
+
+
+def write_trace_file(args: argparse.Namespace) -> None:
+    if not args.trace_file:
+        return
+    try:
+        with open(args.trace_file, "w", encoding="utf-8") as f:
+            if args.trace_file.lower().endswith((".prom", ".txt")):
+                f.write(tracer.to_openmetrics())
+            else:
+                json.dump(tracer.snapshot(), f, indent=2)
+    except OSError as e:
+        logger.error(f"Failed to write trace file {args.trace_file}: {e}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m lgt_app.cli",
+        description="Translate LORE-book keys without the GUI. Progress is written to stdout as JSON lines.",
+    )
+    parser.add_argument("books", nargs="+", help="LORE-book JSON files to translate.")
+    parser.add_argument(
+        "--pair",
+        action="append",
+        required=True,
+        metavar="SOURCE:TARGET",
+        help="Language pair, e.g. English:Ukrainian. Can be repeated.",
+    )
+    add_engine_arguments(parser)
+    parser.add_argument("--force", action="store_true", help="Re-translate keys that are already cached.")
+    parser.add_argument("--use-context", action="store_true", help="Send entry content as translation context.")
+    parser.add_argument("--export-dir", help="Write one translated LORE-book per target language here.")
+    parser.add_argument("--compact", action="store_true", help="Write exports without indentation.")
+    return parser
+
+
+def initialize_settings() -> None:
+    try:
+        from omni_trans_core import settings
+
+        project_root = str(Path(__file__).parent.parent.resolve())
+        settings.initialize_app_paths(project_root_path=project_root)
+        settings.load_settings()
+        serialization.set_fast_backend_enabled(
+            settings.current_settings.get("use_fast_json_backend", True)
+        )
+    except Exception as e:
+        logger.warning(f"Could not load application settings, using defaults: {e}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    configure_logging(args)
+    emit = JsonLinesEmitter()
+    try:
+        pairs = [parse_language_pair(pair) for pair in args.pair]
+        engine = create_engine_from_args(args)
+    except ValueError as e:
+        emit({"event": "error", "error": str(e)})
+        return EXIT_USAGE
+
+    initialize_settings()
+    jobs: list[BookJob] = []
+    load_failures = 0
+    for book_path in args.books:
+        job = BookJob(engine, book_path, pairs, emit, force=args.force, use_context=args.use_context)
+        try:
+            job.prepare()
+        except Exception as e:
+            load_failures += 1
+            logger.error(f"Failed to load {book_path}: {e}")
+            emit({"event": "book_failed", "book": book_path, "error": str(e)})
+            continue
+        jobs.append(job)
+
+    engine.start()
+    interrupted = False
+    try:
+        for job in jobs:
+            job.start()
+        for job in jobs:
+            while not job.wait(0.5):
+                pass
+    except KeyboardInterrupt:
+        interrupted = True
+        for job in jobs:
+            job.cancel()
+    finally:
+        engine.shutdown(wait=not interrupted)
+
+    export_failures = 0
+    if args.export_dir and not interrupted:
+        for job in jobs:
+            try:
+                job.export(args.export_dir, compact=args.compact)
+            except Exception as e:
+                export_failures += 1
+                logger.error(f"Export failed for {job.path}: {e}", exc_info=True)
+                emit({"event": "export_failed", "book": job.path, "error": str(e)})
+
+    write_trace_file(args)
+    failed_items = sum(job.failed for job in jobs)
+    emit(
+        {
+            "event": "summary",
+            "books": len(args.books),
+            "books_failed": load_failures + sum(1 for job in jobs if job.status != "done"),
+            "translated": sum(job.translated for job in jobs),
+            "cached": sum(job.cached for job in jobs),
+            "failed": failed_items,
+            "retried": engine.retried,
+            "interrupted": interrupted,
+        }
+    )
+    if interrupted or load_failures or export_failures or failed_items:
+        return EXIT_FAILED
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
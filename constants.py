@@ -5,6 +5,10 @@ LOG_PREFIX = "L_G_T"
 APP_VERSION_URL = "https://raw.githubusercontent.com/Ner-Kun/Lorebook-Gemini-Translator/refs/heads/main/version.txt"
 
 
+# UI
+FLASH_SUCCESS_COLOR = "#2ca878"
+
+
 # Prompt
 SYSTEM_PROMPT = """You are a master linguist and loremaster specializing in localization of lore—whether from games, books, histories or invented universes.
     Your mission is to translate LORE keywords from {source_language_name} into {target_language_name}.
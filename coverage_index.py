@@ -0,0 +1,138 @@
+import logging
+from collections import Counter
+from logging import Logger
+from typing import TYPE_CHECKING
+from PySide6 import QtCore
+from .constants import LOG_PREFIX
+
+if TYPE_CHECKING:
+    from .data_handler import LorebookDataHandler
+    from .cache_bridge import CacheWriteHooks
+
+logger: Logger = logging.getLogger(f"{LOG_PREFIX}_APP.coverage_index")
+
+LanguagePair = tuple[str, str]
+
+
+class CoverageIndex(QtCore.QObject):
+    coverage_changed = QtCore.Signal()
+
+    def __init__(
+        self,
+        data_handler: "LorebookDataHandler",
+        cache_manager,
+        cache_hooks: "CacheWriteHooks | None" = None,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+        self.data_handler = data_handler
+        self.cache_manager = cache_manager
+        self.key_counts: Counter[str] = Counter()
+        self.total_keys: int = 0
+        self._entry_keys: dict[str, tuple[str, ...]] = {}
+        self._translated: dict[LanguagePair, set[str]] = {}
+        self._translated_occurrences: dict[LanguagePair, int] = {}
+        self.data_handler.data_loaded.connect(self.rebuild)
+        self.data_handler.entry_added.connect(self._refresh_entry)
+        self.data_handler.entry_deleted.connect(self._refresh_entry)
+        self.data_handler.entry_fields_changed.connect(self._on_entry_fields_changed)
+        if cache_hooks is not None:
+            cache_hooks.add_listener(self._on_cache_write)
+
+    @QtCore.Slot()
+    def rebuild(self) -> None:
+        self.key_counts.clear()
+        self._entry_keys.clear()
+        self._translated.clear()
+        self._translated_occurrences.clear()
+        if self.data_handler.data:
+            for entry_id, entry_data in self.data_handler.data["entries"].items():
+                keys = tuple(entry_data.get("key", []))
+                self._entry_keys[str(entry_id)] = keys
+                self.key_counts.update(keys)
+        self.total_keys = sum(self.key_counts.values())
+        self.coverage_changed.emit()
+
+    def _pair(self, src_lang: str, tgt_lang: str) -> LanguagePair:
+        pair = (src_lang, tgt_lang)
+        if pair not in self._translated:
+            translated = {
+                key_text
+                for key_text in self.key_counts
+                if self.cache_manager.get_from_cache(key_text, src_lang, tgt_lang)
+            }
+            self._translated[pair] = translated
+            self._translated_occurrences[pair] = sum(
+                self.key_counts[key_text] for key_text in translated
+            )
+            logger.debug(
+                f"Built coverage for {src_lang}->{tgt_lang}: {len(translated)}/{len(self.key_counts)} unique keys."
+            )
+        return pair
+
+    def translated_keys(self, src_lang: str, tgt_lang: str) -> set[str]:
+        return self._translated[self._pair(src_lang, tgt_lang)]
+
+    def translated_count(self, src_lang: str, tgt_lang: str) -> int:
+        return self._translated_occurrences[self._pair(src_lang, tgt_lang)]
+
+    def missing_count(self, src_lang: str, tgt_lang: str) -> int:
+        return self.total_keys - self.translated_count(src_lang, tgt_lang)
+
+    def record_translation(
+        self, key_text: str, src_lang: str, tgt_lang: str, translation: str | None
+    ) -> None:
+        pair = (src_lang, tgt_lang)
+        translated = self._translated.get(pair)
+        if translated is None or key_text not in self.key_counts:
+            return
+        occurrences = self.key_counts[key_text]
+        if translation and key_text not in translated:
+            translated.add(key_text)
+            self._translated_occurrences[pair] += occurrences
+        elif not translation and key_text in translated:
+            translated.discard(key_text)
+            self._translated_occurrences[pair] -= occurrences
+        else:
+            return
+        self.coverage_changed.emit()
+
+    def _on_cache_write(
+        self, source_text: str, translation: str, src_lang: str, tgt_lang: str
+    ) -> None:
+        self.record_translation(source_text, src_lang, tgt_lang, translation)
+
+    @QtCore.Slot(str, object)
+    def _on_entry_fields_changed(self, entry_id: str, changed_fields: frozenset[str]) -> None:
+        if "key" in changed_fields:
+            self._refresh_entry(entry_id)
+
+    @QtCore.Slot(str)
+    def _refresh_entry(self, entry_id: str) -> None:
+        entry_data = self.data_handler.get_entry(entry_id)
+        new_keys = tuple(entry_data.get("key", [])) if entry_data else ()
+        old_keys = self._entry_keys.pop(entry_id, ())
+        if new_keys:
+            self._entry_keys[entry_id] = new_keys
+        if old_keys == new_keys:
+            return
+        for key_text in old_keys:
+            self._adjust_key(key_text, -1)
+        for key_text in new_keys:
+            self._adjust_key(key_text, 1)
+        self.coverage_changed.emit()
+
+    def _adjust_key(self, key_text: str, delta: int) -> None:
+        self.key_counts[key_text] += delta
+        self.total_keys += delta
+        is_new_key = delta > 0 and self.key_counts[key_text] == delta
+        for (src_lang, tgt_lang), translated in self._translated.items():
+            pair = (src_lang, tgt_lang)
+            if is_new_key and self.cache_manager.get_from_cache(key_text, src_lang, tgt_lang):
+                translated.add(key_text)
+            if key_text in translated:
+                self._translated_occurrences[pair] += delta
+        if self.key_counts[key_text] <= 0:
+            del self.key_counts[key_text]
+            for translated in self._translated.values():
+                translated.discard(key_text)
@@ -1,12 +1,19 @@
+import io
 import os
-import json
+import time
+import pickle
+import hashlib
 import logging
+import threading
 from logging import Logger
 import copy
 from PySide6 import QtCore
 from typing import TypedDict, NotRequired, override, final, TypeGuard, cast
 from omni_trans_core.interfaces import AbstractDataHandler, TranslatableItem
+from omni_trans_core import settings
 from .constants import LOG_PREFIX
+from . import serialization
+from .lazy_content import MappedSource, load_mapped_lorebook
 
 logger: Logger = logging.getLogger(f'{LOG_PREFIX}_APP.data_handler')
 
@@ -47,7 +54,30 @@ class LorebookData(TypedDict):
     entries: dict[str, LorebookEntry]
     deleted: NotRequired[list[str]]
 
+class LorebookSnapshot(TypedDict):
+    data: LorebookData
+    deleted: list[str]
+    edited: list[str]
+    order: list[str]
+    source: NotRequired[MappedSource]
+
 LOREBOOK_TEMPLATE: LorebookData = {"entries": {}}
+SNAPSHOT_SUFFIX = "_snapshot.pickle"
+SNAPSHOT_FORMAT_VERSION = 4
+
+SNAPSHOT_WRITE_DELAY_MS = 3000
+
+_MISSING = object()
+_snapshot_write_lock = threading.Lock()
+
+def diff_entry_fields(old_entry: LorebookEntry, new_entry: LorebookEntry) -> frozenset[str]:
+    changed: set[str] = set()
+    for field in old_entry.keys() | new_entry.keys():
+        old_value = old_entry.get(field, _MISSING)
+        new_value = new_entry.get(field, _MISSING)
+        if type(old_value) is not type(new_value) or old_value != new_value:
+            changed.add(field)
+    return frozenset(changed)
 
 def is_lorebook_data(data: object) -> TypeGuard[LorebookData]:
     if not isinstance(data, dict):
@@ -58,46 +88,253 @@ def is_lorebook_data(data: object) -> TypeGuard[LorebookData]:
         return False
     return True
 
+def get_edit_path(path: str) -> str:
+    base_name, _ = os.path.splitext(path)
+    return f"{base_name}_edit.json"
+
+def get_snapshot_path(path: str) -> str:
+    base_name, _ = os.path.splitext(path)
+    return f"{base_name}{SNAPSHOT_SUFFIX}"
+
+def _file_signature(path: str) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns)
+
+def _snapshot_signature(path: str) -> dict[str, object]:
+    return {
+        "format": SNAPSHOT_FORMAT_VERSION,
+        "source": _file_signature(path),
+        "edits": _file_signature(get_edit_path(path)),
+    }
+
+def _sort_key(item: tuple[str, LorebookEntry]) -> int:
+    try:
+        return item[1].get("uid", 0)
+    except (ValueError, TypeError, KeyError):
+        return 0
+
+def ensure_entry_key_is_list(entry_data: LorebookEntry) -> None:
+    current_primary_key_field: list[str] | None = entry_data.get("key")
+    consolidated_keys: set[str] = set()
+    if (
+        isinstance(current_primary_key_field, str)
+        and current_primary_key_field.strip()
+    ):
+        consolidated_keys.add(current_primary_key_field.strip())
+    elif isinstance(current_primary_key_field, list):
+        for item in current_primary_key_field:
+            if item.strip():
+                consolidated_keys.add(item.strip())
+    entry_data["key"] = sorted(list(consolidated_keys))
+
+def with_normalized_keys(entry_data: LorebookEntry) -> LorebookEntry:
+    keys = entry_data.get("key")
+    if isinstance(keys, list) and all(
+        isinstance(item, str) and item == item.strip() and item for item in keys
+    ) and all(a < b for a, b in zip(keys, keys[1:])):
+        return entry_data
+    normalized = cast(LorebookEntry, dict(entry_data))
+    ensure_entry_key_is_list(normalized)
+    return normalized
+
+def read_lorebook_project(path: str, lazy_content: bool = False) -> LorebookSnapshot:
+    source: MappedSource | None = None
+    if lazy_content:
+        loaded_json, source = load_mapped_lorebook(path)
+    else:
+        loaded_json = cast(dict[str, object], serialization.load_file(path))
+    if not is_lorebook_data(loaded_json):
+        if source is not None:
+            source.close()
+        raise ValueError("Invalid LORE-book format.")
+    data: LorebookData = loaded_json
+    deleted_entry_ids: set[str] = set()
+    edited_entry_ids: set[str] = set()
+    edit_file_path = get_edit_path(path)
+    if os.path.exists(path=edit_file_path):
+        try:
+            edits = cast(
+                dict[str, object], serialization.load_file(edit_file_path)
+            )
+            if is_lorebook_data(edits):
+                for del_id in edits.get("deleted", []):
+                    if str(del_id) in data["entries"]:
+                        del data["entries"][str(del_id)]
+                    deleted_entry_ids.add(str(del_id))
+                for entry_id, edited_entry_data in edits["entries"].items():
+                    deleted_entry_ids.discard(entry_id)
+                    edited_entry_ids.add(entry_id)
+                    data["entries"][entry_id] = edited_entry_data
+        except Exception as e:
+            logger.error(f"Failed to apply edits: {e}")
+
+    for entry_data in data["entries"].values():
+        ensure_entry_key_is_list(entry_data)
+    snapshot: LorebookSnapshot = {
+        "data": data,
+        "deleted": sorted(deleted_entry_ids),
+        "edited": sorted(edited_entry_ids),
+        "order": [entry_id for entry_id, _ in sorted(data["entries"].items(), key=_sort_key)],
+    }
+    if source is not None:
+        snapshot["source"] = source
+    return snapshot
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def find_class(self, module: str, name: str):
+        raise pickle.UnpicklingError(f"Refusing to load {module}.{name} from a LORE-book snapshot.")
+
+def _restricted_loads(payload: bytes) -> object:
+    return _SnapshotUnpickler(io.BytesIO(payload)).load()
+
+def write_snapshot(path: str, snapshot: LorebookSnapshot, signature: dict[str, object]) -> bool:
+    snapshot_path = get_snapshot_path(path)
+    try:
+        payload = pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+        envelope = {
+            **signature,
+            "digest": hashlib.blake2b(payload, digest_size=16).hexdigest(),
+            "payload": payload,
+        }
+        serialization.replace_file(
+            snapshot_path, pickle.dumps(envelope, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+    except Exception as e:
+        logger.warning(f"Could not write LORE-book snapshot {snapshot_path}: {e}")
+        return False
+    logger.debug(f"Wrote LORE-book snapshot {snapshot_path} ({len(payload)} bytes).")
+    return True
+
+def read_snapshot(path: str) -> LorebookSnapshot | None:
+    snapshot_path = get_snapshot_path(path)
+    if not os.path.exists(snapshot_path):
+        return None
+    try:
+        with open(snapshot_path, "rb") as f:
+            envelope = _restricted_loads(f.read())
+        if not isinstance(envelope, dict):
+            return None
+        signature = _snapshot_signature(path)
+        for field, expected in signature.items():
+            stored = envelope.get(field)
+            if isinstance(stored, list):
+                stored = tuple(stored)
+            if stored != expected:
+                logger.debug(f"Snapshot {snapshot_path} is stale ({field} changed).")
+                return None
+        payload = envelope.get("payload")
+        if not isinstance(payload, bytes) or hashlib.blake2b(
+            payload, digest_size=16
+        ).hexdigest() != envelope.get("digest"):
+            logger.warning(f"Snapshot {snapshot_path} failed its integrity check.")
+            return None
+        snapshot = _restricted_loads(payload)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable LORE-book snapshot {snapshot_path}: {e}")
+        return None
+    if not isinstance(snapshot, dict) or not is_lorebook_data(snapshot.get("data")):
+        return None
+    return cast(LorebookSnapshot, snapshot)
+
+def write_snapshot_in_background(
+    path: str, snapshot: LorebookSnapshot, signature: dict[str, object]
+) -> threading.Thread:
+    def run() -> None:
+        with _snapshot_write_lock:
+            write_snapshot(path, snapshot, signature)
+
+    thread = threading.Thread(target=run, name="lorebook-snapshot-writer")
+    thread.start()
+    return thread
+
+def lazy_content_enabled() -> bool:
+    return bool(settings.current_settings.get("lazy_content_loading", False))
+
+def snapshots_enabled() -> bool:
+    if lazy_content_enabled():
+        return False
+    return bool(settings.current_settings.get("use_lorebook_snapshots", True))
+
+def prefetch_snapshots(paths: list[str]) -> threading.Thread | None:
+    paths = [path for path in paths if isinstance(path, str) and os.path.isfile(path)]
+    if not paths or not snapshots_enabled():
+        return None
+
+    def run() -> None:
+        built = 0
+        started = time.perf_counter()
+        for path in paths:
+            if read_snapshot(path) is not None:
+                continue
+            signature = _snapshot_signature(path)
+            try:
+                snapshot = read_lorebook_project(path)
+            except Exception as e:
+                logger.debug(f"Skipping snapshot prefetch for {path}: {e}")
+                continue
+            if write_snapshot(path, snapshot, signature):
+                built += 1
+        logger.debug(
+            f"Snapshot prefetch checked {len(paths)} LORE-book(s), rebuilt {built} "
+            f"in {time.perf_counter() - started:.2f}s."
+        )
+
+    thread = threading.Thread(target=run, name="lorebook-snapshot-prefetch", daemon=True)
+    thread.start()
+    return thread
+
 @final
 class LorebookDataHandler(AbstractDataHandler):
     entry_added = QtCore.Signal(str)
     entry_deleted = QtCore.Signal(str)
     entry_updated = QtCore.Signal(str, dict)
+    entry_fields_changed = QtCore.Signal(str, object)
 
-    def __init__(self) -> None:
+    def __init__(self, use_snapshots: bool = False) -> None:
         super().__init__()
+        self.use_snapshots = use_snapshots
         self.data: LorebookData | None = None
-        self.original_data: LorebookData | None = None
         self.cache: dict[str, str] = {}
         self.input_path: str | None = None
         self.cache_file_path: str | None = None
         self._is_dirty: bool = False
         self.modified_entry_ids: set[str] = set()
         self.deleted_entry_ids: set[str] = set()
+        self.edited_entry_ids: set[str] = set()
+        self._uid_index: dict[str, str] | None = None
+        self._sorted_ids: list[str] | None = None
+        self._mapped_source: MappedSource | None = None
+        self._snapshot_revision: int = 0
+        self._snapshot_written_revision: int = 0
+        self._snapshot_timer = QtCore.QTimer(self)
+        self._snapshot_timer.setSingleShot(True)
+        self._snapshot_timer.setInterval(SNAPSHOT_WRITE_DELAY_MS)
+        self._snapshot_timer.timeout.connect(self.flush_snapshot)
 
     def _ensure_entry_key_is_list(self, entry_data: LorebookEntry) -> None:
-        current_primary_key_field: list[str] | None = entry_data.get("key")
-        consolidated_keys: set[str] = set()
-        if (
-            isinstance(current_primary_key_field, str)
-            and current_primary_key_field.strip()
-        ):
-            consolidated_keys.add(current_primary_key_field.strip())
-        elif isinstance(current_primary_key_field, list):
-            for item in current_primary_key_field:
-                if item.strip():
-                    consolidated_keys.add(item.strip())
-        entry_data["key"] = sorted(list(consolidated_keys))
+        ensure_entry_key_is_list(entry_data)
+
+    def _invalidate_indexes(self) -> None:
+        self._uid_index = None
+        self._sorted_ids = None
 
     @override
     def is_dirty(self) -> bool:
         return self._is_dirty
 
     def reset_state(self) -> None:
+        self.flush_snapshot()
+        self._invalidate_indexes()
+        if self._mapped_source is not None:
+            self._mapped_source.close()
+            self._mapped_source = None
         self.data = None
-        self.original_data = None
         self.modified_entry_ids.clear()
         self.deleted_entry_ids.clear()
+        self.edited_entry_ids.clear()
         self.input_path = None
         self.set_dirty_flag(False)
         logger.debug("LorebookDataHandler state has been reset.")
@@ -108,33 +345,37 @@ class LorebookDataHandler(AbstractDataHandler):
             raise FileNotFoundError(f"File not found: {path}")
         self.reset_state()
         try:
-            with open(file=path, mode="r", encoding="utf-8") as f:
-                loaded_json = cast(dict[str, object], json.load(f))
-            if not is_lorebook_data(loaded_json):
-                raise ValueError("Invalid LORE-book format.")
-            self.original_data = loaded_json
-            self.data = copy.deepcopy(x=self.original_data)
+            started = time.perf_counter()
+            lazy_content = lazy_content_enabled()
+            use_snapshot = self.use_snapshots and snapshots_enabled()
+            snapshot = read_snapshot(path) if use_snapshot else None
+            source = "snapshot" if snapshot is not None else "memory-mapped JSON" if lazy_content else "JSON"
+            if snapshot is None:
+                signature = _snapshot_signature(path)
+                snapshot = read_lorebook_project(path, lazy_content=lazy_content)
+                if use_snapshot:
+                    write_snapshot_in_background(
+                        path,
+                        {
+                            "data": {**snapshot["data"], "entries": dict(snapshot["data"]["entries"])},
+                            "deleted": snapshot["deleted"],
+                            "edited": snapshot["edited"],
+                            "order": snapshot["order"],
+                        },
+                        signature,
+                    )
+            self.data = snapshot["data"]
+            self.deleted_entry_ids = set(snapshot["deleted"])
+            self.edited_entry_ids = set(snapshot["edited"])
+            self._mapped_source = snapshot.get("source")
             self.input_path = path
-            
-            base_name, _ = os.path.splitext(self.input_path)
-            edit_file_path: str = f"{base_name}_edit.json"
-            if os.path.exists(path=edit_file_path):
-                try:
-                    with open(file=edit_file_path, mode="r", encoding="utf-8") as f:
-                        edits = cast(dict[str, object], json.load(fp=f))
-                    if is_lorebook_data(edits):
-                        for del_id in edits.get("deleted", []):
-                            if str(del_id) in self.data["entries"]:
-                                del self.data["entries"][str(del_id)]
-                            self.deleted_entry_ids.add(str(del_id))
-                        for entry_id, edited_entry_data in edits["entries"].items():
-                            self.deleted_entry_ids.discard(entry_id)
-                            self.data["entries"][entry_id] = edited_entry_data
-                except Exception as e:
-                    logger.error(f"Failed to apply edits: {e}")
-
-            for entry_data in self.data["entries"].values():
-                self._ensure_entry_key_is_list(entry_data)
+            self._invalidate_indexes()
+            if len(snapshot["order"]) == len(self.data["entries"]):
+                self._sorted_ids = list(snapshot["order"])
+            logger.debug(
+                f"Loaded {len(self.data['entries'])} entries from "
+                f"{source} in {(time.perf_counter() - started) * 1000:.1f} ms."
+            )
             self.data_loaded.emit()
             self.set_dirty_flag(False)
         except Exception as e:
@@ -155,14 +396,11 @@ class LorebookDataHandler(AbstractDataHandler):
         if not self.data:
             return []
         entries: dict[str, LorebookEntry] = self.data["entries"]
-
-        def sort_key(item: tuple[str, LorebookEntry]) -> int:
-            try:
-                return item[1].get("uid", 0)
-            except (ValueError, TypeError, KeyError):
-                return 0
-
-        return sorted(entries.items(), key=sort_key)
+        if self._sorted_ids is None:
+            self._sorted_ids = [
+                entry_id for entry_id, _ in sorted(entries.items(), key=_sort_key)
+            ]
+        return [(entry_id, entries[entry_id]) for entry_id in self._sorted_ids]
 
     @override
     def save(self) -> None:
@@ -170,8 +408,7 @@ class LorebookDataHandler(AbstractDataHandler):
         assert self.data is not None, "Cannot save with no data loaded."
 
         if self.modified_entry_ids or self.deleted_entry_ids:
-            base_name, _ = os.path.splitext(self.input_path)
-            edit_file_path: str = f"{base_name}_edit.json"
+            edit_file_path: str = get_edit_path(self.input_path)
 
             logger.info(f"Saving changes to {edit_file_path}...")
 
@@ -179,8 +416,9 @@ class LorebookDataHandler(AbstractDataHandler):
 
             if os.path.exists(path=edit_file_path):
                 try:
-                    with open(edit_file_path, mode="r", encoding="utf-8") as f:
-                        existing_edits = cast(dict[str, object], json.load(fp=f))
+                    existing_edits = cast(
+                        dict[str, object], serialization.load_file(edit_file_path)
+                    )
                     if is_lorebook_data(existing_edits):
                         edits_to_save = existing_edits
                 except Exception as e:
@@ -196,40 +434,102 @@ class LorebookDataHandler(AbstractDataHandler):
 
             edits_to_save["deleted"] = list(self.deleted_entry_ids)
 
-            with open(file=edit_file_path, mode="w", encoding="utf-8") as f:
-                json.dump(obj=edits_to_save, fp=f, ensure_ascii=False, indent=2)
+            serialization.dump_file(
+                edits_to_save, edit_file_path, compact=self._compact_project_files()
+            )
 
             logger.info("Successfully saved edits and deletions.")
+            self.edited_entry_ids.update(self.modified_entry_ids)
             self.modified_entry_ids.clear()
+            self._refresh_snapshot()
         else:
             logger.debug("Save called, but nothing modified.")
 
         self.set_dirty_flag(False)
 
+    def _refresh_snapshot(self) -> None:
+        if not self.input_path or not self.data:
+            return
+        if not self.use_snapshots or not snapshots_enabled():
+            return
+        self._snapshot_revision += 1
+        self._snapshot_timer.start()
+
+    @QtCore.Slot()
+    def flush_snapshot(self) -> None:
+        self._snapshot_timer.stop()
+        if self._snapshot_revision == self._snapshot_written_revision:
+            return
+        self._snapshot_written_revision = self._snapshot_revision
+        if not self.input_path or not self.data:
+            return
+        data = cast(LorebookData, dict(self.data))
+        data["entries"] = {
+            entry_id: with_normalized_keys(entry_data)
+            for entry_id, entry_data in self.data["entries"].items()
+        }
+        write_snapshot_in_background(
+            self.input_path,
+            {
+                "data": data,
+                "deleted": sorted(self.deleted_entry_ids),
+                "edited": sorted(self.edited_entry_ids),
+                "order": [entry_id for entry_id, _ in self.get_sorted_lore_entries()],
+            },
+            _snapshot_signature(self.input_path),
+        )
+
+    def entry_versions(self) -> dict[str, str]:
+        if not self.data or not self.input_path:
+            return {}
+        source_version = f"source:{_file_signature(self.input_path)}"
+        edit_version = f"edits:{_file_signature(get_edit_path(self.input_path))}"
+        return {
+            entry_id: edit_version if entry_id in self.edited_entry_ids else source_version
+            for entry_id in self.data["entries"]
+            if entry_id not in self.modified_entry_ids
+        }
+
+    def _compact_project_files(self) -> bool:
+        return bool(settings.current_settings.get("compact_project_files", False))
+
     @override
     def get_project_name(self) -> str:
         if self.input_path:
             return os.path.basename(self.input_path)
         return "New LORE-book"
 
-    def update_entry(self, entry_id: str, new_entry_data: LorebookEntry) -> None:
+    def update_entry(
+        self, entry_id: str, new_entry_data: LorebookEntry
+    ) -> frozenset[str]:
         if not self.data or entry_id not in self.data["entries"]:
             logger.warning(
                 f"Attempted to update a non-existent entry with ID {entry_id}"
             )
-            return
+            return frozenset()
+        changed_fields = diff_entry_fields(self.data["entries"][entry_id], new_entry_data)
+        if not changed_fields:
+            logger.debug(f"Entry {entry_id} unchanged, skipping update.")
+            return changed_fields
         self.data["entries"][entry_id] = new_entry_data
+        if "uid" in changed_fields:
+            self._invalidate_indexes()
         self.modified_entry_ids.add(entry_id)
         self.set_dirty_flag(True)
+        self.entry_fields_changed.emit(entry_id, changed_fields)
         self.entry_updated.emit(entry_id, new_entry_data)
-        logger.debug(f"Entry {entry_id} has been updated and marked for saving.")
+        logger.debug(
+            f"Entry {entry_id} updated ({', '.join(sorted(changed_fields))}) and marked for saving."
+        )
+        return changed_fields
 
     def create_new(self, path: str) -> None:
         logger.info(f"Creating and saving new LORE-book to {path}")
         new_data: LorebookData = copy.deepcopy(LOREBOOK_TEMPLATE)
         try:
-            with open(file=path, mode="w", encoding="utf-8") as f:
-                json.dump(obj=new_data, fp=f, ensure_ascii=False, indent=2)
+            serialization.dump_file(
+                new_data, path, compact=self._compact_project_files()
+            )
             self.load(path)
         except Exception as e:
             logger.error(f"Failed to save new LORE-book to {path}: {e}", exc_info=True)
@@ -275,16 +575,28 @@ class LorebookDataHandler(AbstractDataHandler):
     def get_file_filter(self) -> str:
         return "LORE-book (*.json);;All Files (*)"
     
+    def _get_uid_index(self) -> dict[str, str]:
+        if self._uid_index is None:
+            self._uid_index = {}
+            if self.data:
+                for dict_key, entry_data_val in self.data["entries"].items():
+                    entry_uid_val: int | None = entry_data_val.get("uid")
+                    if entry_uid_val is not None:
+                        _ = self._uid_index.setdefault(str(entry_uid_val), str(dict_key))
+        return self._uid_index
+
     def find_entry_dict_key_by_uid(self, uid_to_find: str) -> str | None:
         if not self.data:
             return None
-        uid_to_find_str = str(uid_to_find)
-        for dict_key, entry_data_val in self.data["entries"].items():
-            entry_uid_val: int | None = entry_data_val.get("uid")
-            if entry_uid_val is not None and str(entry_uid_val) == uid_to_find_str:
-                return str(dict_key)
-        logger.warning(f"Could not find LORE entry dict key for UID '{uid_to_find}'.")
-        return None
+        dict_key = self._get_uid_index().get(str(uid_to_find))
+        if dict_key is None:
+            logger.warning(f"Could not find LORE entry dict key for UID '{uid_to_find}'.")
+        return dict_key
+
+    def get_entry(self, entry_id: str) -> LorebookEntry | None:
+        if not self.data:
+            return None
+        return self.data["entries"].get(entry_id)
 
     def get_next_uid(self) -> int:
         if not self.data:
@@ -325,6 +637,7 @@ class LorebookDataHandler(AbstractDataHandler):
         }
         entry_id: str = str(new_uid)
         self.data["entries"][entry_id] = new_entry
+        self._invalidate_indexes()
         self.modified_entry_ids.add(entry_id)
         self.set_dirty_flag(True)
         self.entry_added.emit(entry_id)
@@ -343,6 +656,7 @@ class LorebookDataHandler(AbstractDataHandler):
         new_entry["uid"] = new_uid
         new_entry["comment"] = f"{original_entry.get('comment', 'Entry')} (Copy)"
         self.data["entries"][new_entry_id] = new_entry
+        self._invalidate_indexes()
         self.modified_entry_ids.add(new_entry_id)
         self.set_dirty_flag(True)
         self.entry_added.emit(new_entry_id)
@@ -359,6 +673,7 @@ class LorebookDataHandler(AbstractDataHandler):
             return
 
         del self.data["entries"][entry_id]
+        self._invalidate_indexes()
 
         self.deleted_entry_ids.add(entry_id)
 
@@ -0,0 +1,359 @@
+import time
+import uuid
+import logging
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from logging import Logger
+from typing import Callable
+from .constants import (
+    LOG_PREFIX,
+    SYSTEM_PROMPT,
+    CONTEXT_INSTRUCTIONS,
+    USER_PROMPT,
+    REGEN_PROMPT,
+)
+from .providers import TranslationProvider, ProviderError, RateLimitError, clean_translation
+from .tracing import tracer, STAGE_DISPATCH, STAGE_RESPONSE_PARSED
+
+logger: Logger = logging.getLogger(f"{LOG_PREFIX}_APP.engine")
+
+RPM_WINDOW_SECONDS = 60.0
+DEFAULT_RPM_LIMIT = 15
+DEFAULT_COOLDOWN_SECONDS = 60.0
+DEFAULT_MAX_RETRIES = 3
+RETRY_BACKOFF_SECONDS = 2.0
+
+
+def mask_api_key(api_key: str) -> str:
+    if len(api_key) <= 8:
+        return "****"
+    return f"{api_key[:4]}...{api_key[-4:]}"
+
+
+def build_prompts(
+    source_text: str,
+    src_lang: str,
+    tgt_lang: str,
+    context: str = "",
+    previous_translation: str | None = None,
+) -> tuple[str, str]:
+    context_instructions = (
+        CONTEXT_INSTRUCTIONS.format(context_section=context) if context else ""
+    )
+    system_prompt = SYSTEM_PROMPT.format(
+        source_language_name=src_lang,
+        target_language_name=tgt_lang,
+        context_instructions=context_instructions,
+    )
+    if previous_translation:
+        user_prompt = REGEN_PROMPT.format(
+            source_language_name=src_lang,
+            target_language_name=tgt_lang,
+            keyword=source_text,
+            wrong_keyword=previous_translation,
+        )
+    else:
+        user_prompt = USER_PROMPT.format(
+            source_language_name=src_lang,
+            target_language_name=tgt_lang,
+            keyword=source_text,
+        )
+    return system_prompt, user_prompt
+
+
+@dataclass
+class TranslationRequest:
+    source_text: str
+    src_lang: str
+    tgt_lang: str
+    context: str = ""
+    group: str = "default"
+    previous_translation: str | None = None
+    request_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    attempts: int = 0
+
+
+ResultCallback = Callable[[TranslationRequest, str | None, Exception | None], None]
+
+
+class KeyPool:
+    def __init__(
+        self,
+        api_keys: list[str],
+        rpm_limit: int = DEFAULT_RPM_LIMIT,
+        cooldown_seconds: float = DEFAULT_COOLDOWN_SECONDS,
+        window_seconds: float = RPM_WINDOW_SECONDS,
+    ) -> None:
+        if not api_keys:
+            raise ValueError("At least one API key is required.")
+        self.api_keys = list(dict.fromkeys(api_keys))
+        self.rpm_limit = max(1, rpm_limit)
+        self.cooldown_seconds = cooldown_seconds
+        self.window_seconds = window_seconds
+        self._windows: dict[str, deque[float]] = {key: deque() for key in self.api_keys}
+        self._cooldown_until: dict[str, float] = {key: 0.0 for key in self.api_keys}
+        self._next_index = 0
+
+    def acquire(self, now: float) -> tuple[str | None, float]:
+        shortest_wait = float("inf")
+        key_count = len(self.api_keys)
+        for offset in range(key_count):
+            key = self.api_keys[(self._next_index + offset) % key_count]
+            window = self._windows[key]
+            while window and now - window[0] >= self.window_seconds:
+                window.popleft()
+            wait = self._cooldown_until[key] - now
+            if len(window) >= self.rpm_limit:
+                wait = max(wait, window[0] + self.window_seconds - now)
+            if wait <= 0:
+                window.append(now)
+                self._next_index = (self._next_index + offset + 1) % key_count
+                return key, 0.0
+            shortest_wait = min(shortest_wait, wait)
+        return None, shortest_wait
+
+    def cool_down(self, api_key: str, now: float, seconds: float | None = None) -> float:
+        seconds = seconds or self.cooldown_seconds
+        self._cooldown_until[api_key] = max(self._cooldown_until[api_key], now + seconds)
+        return seconds
+
+    def capacity_per_minute(self) -> int:
+        return self.rpm_limit * len(self.api_keys)
+
+    def snapshot(self, now: float) -> list[dict]:
+        return [
+            {
+                "key": mask_api_key(key),
+                "requests_last_minute": sum(
+                    1 for stamp in self._windows[key] if now - stamp < self.window_seconds
+                ),
+                "cooldown_seconds": max(0.0, round(self._cooldown_until[key] - now, 1)),
+            }
+            for key in self.api_keys
+        ]
+
+
+class TranslationEngine:
+    def __init__(
+        self,
+        provider: TranslationProvider,
+        api_keys: list[str],
+        rpm_limit: int = DEFAULT_RPM_LIMIT,
+        concurrency: int | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        cooldown_seconds: float = DEFAULT_COOLDOWN_SECONDS,
+        rpm_window_seconds: float = RPM_WINDOW_SECONDS,
+    ) -> None:
+        self.provider = provider
+        self.key_pool = KeyPool(api_keys, rpm_limit, cooldown_seconds, rpm_window_seconds)
+        self.max_retries = max_retries
+        self.concurrency = concurrency or max(2, len(self.key_pool.api_keys) * 2)
+        self._queues: OrderedDict[str, deque[tuple[TranslationRequest, ResultCallback]]] = OrderedDict()
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._not_before: dict[str, float] = {}
+        self._running: dict[str, str] = {}
+        self._cancelled: set[str] = set()
+        self._stopping = False
+        self._executor: ThreadPoolExecutor | None = None
+        self._dispatcher: threading.Thread | None = None
+        self.completed = 0
+        self.failed = 0
+        self.retried = 0
+        self.rate_limited = 0
+        self.cooldown_seconds = 0.0
+        self.requests_per_key: dict[str, int] = {key: 0 for key in self.key_pool.api_keys}
+
+    def start(self) -> "TranslationEngine":
+        with self._condition:
+            if self._dispatcher is not None:
+                return self
+            self._stopping = False
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.concurrency, thread_name_prefix="lgt-engine"
+            )
+            self._dispatcher = threading.Thread(
+                target=self._dispatch_loop, name="lgt-dispatcher", daemon=True
+            )
+            self._dispatcher.start()
+        logger.info(
+            f"Engine started: {len(self.key_pool.api_keys)} key(s), {self.key_pool.rpm_limit} RPM each, concurrency {self.concurrency}."
+        )
+        return self
+
+    def submit(self, request: TranslationRequest, callback: ResultCallback) -> None:
+        tracer.start(request.request_id, model=self.provider.model)
+        with self._condition:
+            self._queues.setdefault(request.group, deque()).append((request, callback))
+            self._condition.notify_all()
+
+    def cancel_group(self, group: str) -> int:
+        with self._condition:
+            dropped = self._queues.pop(group, None)
+            for request, _ in dropped or ():
+                self._not_before.pop(request.request_id, None)
+            self._cancelled.update(
+                request_id for request_id, running_group in self._running.items() if running_group == group
+            )
+            self._condition.notify_all()
+        for request, _ in dropped or ():
+            tracer.discard(request.request_id)
+        return len(dropped) if dropped else 0
+
+    def pending_count(self, group: str | None = None) -> int:
+        with self._condition:
+            if group is not None:
+                return len(self._queues.get(group, ()))
+            return sum(len(queue) for queue in self._queues.values())
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._in_flight or any(self._queues.values()):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+            dispatcher = self._dispatcher
+            executor = self._executor
+            self._dispatcher = None
+            self._executor = None
+        if dispatcher is not None and wait:
+            dispatcher.join()
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        with self._condition:
+            return {
+                "queued": sum(len(queue) for queue in self._queues.values()),
+                "in_flight": self._in_flight,
+                "completed": self.completed,
+                "failed": self.failed,
+                "retried": self.retried,
+                "rate_limited": self.rate_limited,
+                "cooldown_seconds": round(self.cooldown_seconds, 3),
+                "groups": {group: len(queue) for group, queue in self._queues.items() if queue},
+                "keys": self.key_pool.snapshot(now),
+            }
+
+    def _next_job(self, now: float) -> tuple[TranslationRequest, ResultCallback] | None:
+        for _ in range(len(self._queues)):
+            group, queue = next(iter(self._queues.items()))
+            self._queues.move_to_end(group)
+            if not queue:
+                del self._queues[group]
+                continue
+            for index, (request, _) in enumerate(queue):
+                if self._not_before.get(request.request_id, 0.0) <= now:
+                    self._not_before.pop(request.request_id, None)
+                    job = queue[index]
+                    del queue[index]
+                    return job
+        return None
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stopping and (
+                    not any(self._queues.values()) or self._in_flight >= self.concurrency
+                ):
+                    self._condition.wait()
+                if self._stopping:
+                    return
+                now = time.monotonic()
+                job = self._next_job(now)
+                if job is None:
+                    self._condition.wait(0.25)
+                    continue
+                api_key, wait = self.key_pool.acquire(now)
+                if api_key is None:
+                    self._queues.setdefault(job[0].group, deque()).appendleft(job)
+                    self._queues.move_to_end(job[0].group, last=False)
+                    self._condition.wait(min(wait, 1.0))
+                    continue
+                self._in_flight += 1
+                self._running[job[0].request_id] = job[0].group
+                self.requests_per_key[api_key] += 1
+                executor = self._executor
+            tracer.mark(job[0].request_id, STAGE_DISPATCH, key=mask_api_key(api_key))
+            executor.submit(self._run_job, job[0], job[1], api_key)
+
+    def _run_job(self, request: TranslationRequest, callback: ResultCallback, api_key: str) -> None:
+        request.attempts += 1
+        translation: str | None = None
+        error: Exception | None = None
+        requeue = False
+        try:
+            system_prompt, user_prompt = build_prompts(
+                request.source_text,
+                request.src_lang,
+                request.tgt_lang,
+                request.context,
+                request.previous_translation,
+            )
+            translation = clean_translation(
+                self.provider.complete(
+                    system_prompt, user_prompt, api_key, trace_id=request.request_id
+                )
+            )
+            tracer.mark(request.request_id, STAGE_RESPONSE_PARSED)
+            if not translation:
+                raise ProviderError("Provider returned an empty translation.", retryable=True)
+        except RateLimitError as e:
+            logger.warning(f"Key {mask_api_key(api_key)} rate limited: {e}")
+            with self._condition:
+                self.rate_limited += 1
+                self.cooldown_seconds += self.key_pool.cool_down(
+                    api_key, time.monotonic(), e.retry_after
+                )
+            error = e
+            requeue = request.attempts <= self.max_retries
+        except ProviderError as e:
+            error = e
+            requeue = e.retryable and request.attempts <= self.max_retries
+        except Exception as e:
+            logger.error(f"Unexpected error translating '{request.source_text}': {e}", exc_info=True)
+            error = e
+        with self._condition:
+            self._in_flight -= 1
+            self._running.pop(request.request_id, None)
+            dropped = requeue and request.request_id in self._cancelled
+            self._cancelled.discard(request.request_id)
+            if dropped:
+                requeue = False
+            elif requeue:
+                self.retried += 1
+                self._not_before[request.request_id] = (
+                    time.monotonic() + RETRY_BACKOFF_SECONDS * request.attempts
+                )
+                self._queues.setdefault(request.group, deque()).appendleft((request, callback))
+            elif error is None:
+                self.completed += 1
+            else:
+                self.failed += 1
+            self._condition.notify_all()
+        if requeue:
+            logger.debug(f"Requeued '{request.source_text}' (attempt {request.attempts}): {error}")
+            return
+        if dropped:
+            logger.debug(f"Dropped retry of '{request.source_text}': group '{request.group}' was cancelled.")
+            tracer.discard(request.request_id)
+            return
+        try:
+            callback(request, translation if error is None else None, error)
+        except Exception as e:
+            logger.error(f"Result callback failed for '{request.source_text}': {e}", exc_info=True)
+        if error is None:
+            tracer.finish(request.request_id)
+        else:
+            tracer.discard(request.request_id)
@@ -1,9 +1,13 @@
 import os
-import json
-import copy
 import logging
-from PySide6 import QtWidgets
+from PySide6 import QtWidgets, QtCore
 from .ui.dialogs import ExportSettingsDialog
+from .export_writer import (
+    ExportCancelled,
+    ExportCommitError,
+    build_export_keys,
+    write_lorebook_streams,
+)
 from omni_trans_core import settings
 from omni_trans_core.localization_manager import translate
 from typing import TYPE_CHECKING
@@ -14,7 +18,97 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(f"{LOG_PREFIX}_APP.export_manager")
 
+
+class ExportSignals(QtCore.QObject):
+    progress = QtCore.Signal(int, int)
+    finished = QtCore.Signal(list)
+    cancelled = QtCore.Signal()
+    failed = QtCore.Signal(str)
+
+
+class ExportRunnable(QtCore.QRunnable):
+    def __init__(
+        self,
+        data,
+        outputs,
+        signals: ExportSignals,
+        compact=False,
+        incremental=False,
+        entry_versions=None,
+    ):
+        super().__init__()
+        self.data = data
+        self.outputs = outputs
+        self.compact = compact
+        self.incremental = incremental
+        self.entry_versions = entry_versions
+        self.signals = signals
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    @QtCore.Slot()
+    def run(self):
+        try:
+            write_lorebook_streams(
+                self.data,
+                self.outputs,
+                progress_callback=self.signals.progress.emit,
+                is_cancelled=lambda: self._cancelled,
+                compact=self.compact,
+                incremental=self.incremental,
+                entry_versions=self.entry_versions,
+            )
+        except ExportCancelled:
+            self.signals.cancelled.emit()
+        except ExportCommitError as e:
+            logger.error(f"Export could not replace {len(e.failed)} file(s): {e}")
+            self.signals.failed.emit(str(e))
+        except Exception as e:
+            output_paths = ", ".join(path for path, _ in self.outputs)
+            logger.error(f"Export failed for {output_paths}: {e}", exc_info=True)
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit([path for path, _ in self.outputs])
+
+
+def _make_entry_transform(main_window: "CoreApp", src_lang, selected_langs, include_originals, missing_rule):
+    if not selected_langs:
+        return None
+    cache_manager = main_window.cache_manager
+    translations = {
+        (key_text, lang): cache_manager.get_from_cache(key_text, src_lang, lang)
+        for lang in selected_langs
+        for key_text in main_window.coverage_index.translated_keys(src_lang, lang)
+    }
+
+    def lookup(key_text, lang):
+        return translations.get((key_text, lang))
+
+    def transform_entry(entry_data):
+        exported_entry = dict(entry_data)
+        exported_entry["key"] = build_export_keys(
+            entry_data.get("key", []),
+            lookup,
+            selected_langs,
+            include_originals,
+            missing_rule,
+        )
+        return exported_entry
+
+    return transform_entry
+
+
+def _snapshot_lorebook(data):
+    snapshot = dict(data)
+    snapshot["entries"] = dict(data["entries"])
+    return snapshot
+
 def export_lorebook(main_window: "CoreApp"):
+    if getattr(main_window, "_active_export", None) is not None:
+        logger.info("Export already in progress.")
+        return
     if not main_window.data_handler.data:
         QtWidgets.QMessageBox.warning(
             main_window,
@@ -32,6 +126,10 @@ def export_lorebook(main_window: "CoreApp"):
         export_dialog.get_export_settings()
     )
     src_lang = settings.current_settings.get("selected_source_language")
+    incremental = export_dialog.is_incremental()
+    if settings.current_settings.get("incremental_export", False) != incremental:
+        settings.current_settings["incremental_export"] = incremental
+        settings.save_settings()
     if not lore_name:
         QtWidgets.QMessageBox.warning(
             main_window,
@@ -39,34 +137,37 @@ def export_lorebook(main_window: "CoreApp"):
             translate("dialog.export.error.no_name.text"),
         )
         return
-    data_to_export = copy.deepcopy(main_window.data_handler.data)
     if selected_langs:
         logger.info(f"Applying translations for languages: {selected_langs}")
-        for entry_data in data_to_export["entries"].values():
-            original_keys = list(entry_data.get("key", []))
-            final_keys = set()
-            if include_originals:
-                final_keys.update(original_keys)
-            for key_text in original_keys:
-                found_translation = False
-                for lang in selected_langs:
-                    cached_trans = main_window.cache_manager.get_from_cache(
-                        key_text, src_lang, lang
-                    )
-                    if cached_trans:
-                        final_keys.add(cached_trans)
-                        found_translation = True
-                if (
-                    not found_translation
-                    and missing_rule == "leave"
-                    and not include_originals
-                ):
-                    final_keys.add(key_text)
-            entry_data["key"] = sorted(list(final_keys))
     project_path = main_window.data_handler.get_project_path()
     start_dir = (
         os.path.dirname(project_path) if project_path else os.path.expanduser("~")
     )
+    if export_dialog.get_output_mode() == "per_language" and selected_langs:
+        outputs = _choose_per_language_outputs(
+            main_window,
+            start_dir,
+            lore_name,
+            src_lang,
+            selected_langs,
+            include_originals,
+            missing_rule,
+        )
+        if not outputs:
+            return
+        logger.info(
+            f"Attempting to export {len(outputs)} per-language LORE-books to: {os.path.dirname(outputs[0][0])}"
+        )
+        _start_export_job(
+            main_window,
+            _snapshot_lorebook(main_window.data_handler.data),
+            outputs,
+            incremental,
+        )
+        return
+    transform_entry = _make_entry_transform(
+        main_window, src_lang, selected_langs, include_originals, missing_rule
+    )
     default_save_path = os.path.join(start_dir, f"{lore_name}.json")
     output_path, _ = QtWidgets.QFileDialog.getSaveFileName(
         main_window,
@@ -78,24 +179,113 @@ def export_lorebook(main_window: "CoreApp"):
         logger.info("Export operation cancelled by user in file dialog.")
         return
     logger.info(f"Attempting to export compiled LORE-book to: {output_path}")
-    main_window.loading_overlay.start_animation(
-        translate("app.status.exporting_file", filename=os.path.basename(output_path))
+    _start_export_job(
+        main_window,
+        _snapshot_lorebook(main_window.data_handler.data),
+        [(output_path, transform_entry)],
+        incremental,
+    )
+
+
+def _choose_per_language_outputs(
+    main_window: "CoreApp",
+    start_dir,
+    lore_name,
+    src_lang,
+    selected_langs,
+    include_originals,
+    missing_rule,
+):
+    output_dir = QtWidgets.QFileDialog.getExistingDirectory(
+        main_window, translate("dialog.export.choose_directory"), start_dir
+    )
+    if not output_dir:
+        logger.info("Export operation cancelled by user in directory dialog.")
+        return []
+    outputs = [
+        (
+            os.path.join(output_dir, f"{lore_name}_{lang}.json"),
+            _make_entry_transform(
+                main_window, src_lang, [lang], include_originals, missing_rule
+            ),
+        )
+        for lang in selected_langs
+    ]
+    existing = [os.path.basename(path) for path, _ in outputs if os.path.exists(path)]
+    if existing:
+        reply = QtWidgets.QMessageBox.question(
+            main_window,
+            translate("dialog.export.prompt.overwrite.title"),
+            translate("dialog.export.prompt.overwrite.text", files="\n".join(existing)),
+            QtWidgets.QMessageBox.StandardButton.Yes
+            | QtWidgets.QMessageBox.StandardButton.No,
+            QtWidgets.QMessageBox.StandardButton.No,
+        )
+        if reply != QtWidgets.QMessageBox.StandardButton.Yes:
+            logger.info("Export operation cancelled by user at overwrite prompt.")
+            return []
+    return outputs
+
+
+def _start_export_job(main_window: "CoreApp", data, outputs, incremental=False):
+    total_entries = len(data["entries"])
+    file_names = ", ".join(os.path.basename(path) for path, _ in outputs)
+    progress_dialog = QtWidgets.QProgressDialog(
+        translate("app.status.exporting_file", filename=file_names),
+        translate("dialog.export.progress.cancel"),
+        0,
+        max(total_entries, 1),
+        main_window,
     )
-    try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data_to_export, f, ensure_ascii=False, indent=2)
+    progress_dialog.setWindowTitle(translate("dialog.export.title"))
+    progress_dialog.setWindowModality(QtCore.Qt.WindowModality.WindowModal)
+    progress_dialog.setMinimumDuration(300)
+    progress_dialog.setValue(0)
+    signals = ExportSignals()
+    runnable = ExportRunnable(
+        data,
+        outputs,
+        signals,
+        compact=bool(settings.current_settings.get("compact_export_files", False)),
+        incremental=incremental,
+        entry_versions=main_window.data_handler.entry_versions() if incremental else None,
+    )
+    main_window._active_export = (runnable, signals, progress_dialog)
+
+    def finish_job():
+        main_window._active_export = None
+        progress_dialog.reset()
+        progress_dialog.deleteLater()
+
+    def on_progress(written, total):
+        progress_dialog.setMaximum(max(total, 1))
+        progress_dialog.setValue(written)
+
+    def on_finished(paths):
+        finish_job()
         QtWidgets.QMessageBox.information(
             main_window,
             translate("app.dialog.export_success.title"),
-            translate("app.dialog.export_success.text", path=output_path),
+            translate("app.dialog.export_success.text", path="\n".join(paths)),
         )
         logger.info("Export successful.")
-    except Exception as e:
-        logger.error(f"Export failed for {output_path}: {e}", exc_info=True)
+
+    def on_cancelled():
+        finish_job()
+        main_window.status_bar.showMessage(translate("app.status.export_cancelled"), 5000)
+        logger.info("Export cancelled by user.")
+
+    def on_failed(error):
+        finish_job()
         QtWidgets.QMessageBox.critical(
             main_window,
             translate("app.dialog.export_error.title"),
-            translate("app.dialog.export_error.text", error=str(e)),
+            translate("app.dialog.export_error.text", error=error),
         )
-    finally:
-        main_window.loading_overlay.stop_animation()
+
+    signals.progress.connect(on_progress)
+    signals.finished.connect(on_finished)
+    signals.cancelled.connect(on_cancelled)
+    signals.failed.connect(on_failed)
+    progress_dialog.canceled.connect(runnable.cancel)
+    QtCore.QThreadPool.globalInstance().start(runnable)
@@ -0,0 +1,311 @@
+import os
+import json
+import hashlib
+import logging
+import tempfile
+from logging import Logger
+from typing import Callable, Iterable, Mapping, Any
+from .constants import LOG_PREFIX
+from . import serialization
+
+logger: Logger = logging.getLogger(f"{LOG_PREFIX}_APP.export_writer")
+
+INDENT = "  "
+MANIFEST_VERSION = 1
+MANIFEST_SUFFIX = ".manifest.json"
+
+TranslationLookup = Callable[[str, str], str | None]
+ProgressCallback = Callable[[int, int], None]
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+class ExportCommitError(OSError):
+    def __init__(self, committed: list[str], failed: list[tuple[str, str]]):
+        self.committed = committed
+        self.failed = failed
+        message = "; ".join(f"{path}: {error}" for path, error in failed)
+        if committed:
+            message += f" (already written: {', '.join(committed)})"
+        super().__init__(message)
+
+
+def build_export_keys(
+    original_keys: Iterable[str],
+    lookup: TranslationLookup,
+    selected_langs: list[str],
+    include_originals: bool,
+    missing_rule: str,
+) -> list[str]:
+    original_keys = list(original_keys)
+    final_keys: set[str] = set()
+    if include_originals:
+        final_keys.update(original_keys)
+    for key_text in original_keys:
+        found_translation = False
+        for lang in selected_langs:
+            cached_trans = lookup(key_text, lang)
+            if cached_trans:
+                final_keys.add(cached_trans)
+                found_translation = True
+        if not found_translation and missing_rule == "leave" and not include_originals:
+            final_keys.add(key_text)
+    return sorted(final_keys)
+
+
+def _dump_value(value: Any, depth: int, compact: bool = False) -> str:
+    text = serialization.dumps(value, compact=compact)
+    if depth == 0 or compact:
+        return text
+    return text.replace("\n", "\n" + INDENT * depth)
+
+
+def _dump_key(key: str) -> str:
+    return json.dumps(key, ensure_ascii=False)
+
+
+EntryTransform = Callable[[dict[str, Any]], dict[str, Any]]
+
+
+def manifest_path_for(output_path: str) -> str:
+    return f"{output_path}{MANIFEST_SUFFIX}"
+
+
+def _fingerprint(entry_data: dict[str, Any], version: str | None = None) -> str:
+    if version is None:
+        encoded = serialization.dumps_raw(entry_data)
+    else:
+        encoded = "\x1f".join([version, *map(str, entry_data.get("key") or [])]).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+class _PreviousExport:
+    def __init__(self, output_path: str, compact: bool):
+        self.entries: dict[str, list] = {}
+        self.file = None
+        try:
+            manifest = serialization.load_file(manifest_path_for(output_path))
+            stat = os.stat(output_path)
+        except (OSError, ValueError):
+            return
+        if (
+            not isinstance(manifest, dict)
+            or manifest.get("version") != MANIFEST_VERSION
+            or manifest.get("compact") != compact
+            or manifest.get("size") != stat.st_size
+            or manifest.get("mtime_ns") != stat.st_mtime_ns
+        ):
+            logger.debug(f"Previous export manifest for {output_path} is stale, ignoring it.")
+            return
+        self.entries = manifest.get("entries", {})
+        self.file = open(output_path, "rb")
+
+    def read(self, entry_id: str, fingerprint: str) -> bytes | None:
+        record = self.entries.get(entry_id)
+        if self.file is None or record is None or record[0] != fingerprint:
+            return None
+        self.file.seek(record[1])
+        return self.file.read(record[2])
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+class _StreamTarget:
+    def __init__(
+        self,
+        output_path: str,
+        transform_entry: EntryTransform | None,
+        incremental: bool = False,
+        compact: bool = False,
+    ):
+        self.output_path = output_path
+        self.transform_entry = transform_entry
+        self.incremental = incremental
+        self.compact = compact
+        self.offset = 0
+        self.reused = 0
+        self.manifest_entries: dict[str, list] = {}
+        self.previous = _PreviousExport(output_path, compact) if incremental else None
+        directory = os.path.dirname(os.path.abspath(output_path))
+        fd, self.temp_path = tempfile.mkstemp(
+            prefix=f".{os.path.basename(output_path)}.", suffix=".tmp", dir=directory
+        )
+        self.file = os.fdopen(fd, "wb")
+
+    def write(self, text: str) -> None:
+        self.write_bytes(text.encode("utf-8"))
+
+    def write_bytes(self, chunk: bytes) -> None:
+        self.file.write(chunk)
+        self.offset += len(chunk)
+
+    def write_entry(
+        self, entry_id: str, entry_data: dict[str, Any], version: str | None = None
+    ) -> None:
+        if self.transform_entry is not None:
+            entry_data = self.transform_entry(entry_data)
+        fingerprint = _fingerprint(entry_data, version)
+        chunk = self.previous.read(entry_id, fingerprint) if self.previous else None
+        if chunk is None:
+            chunk = _dump_value(entry_data, 2, self.compact).encode("utf-8")
+        else:
+            self.reused += 1
+        self.manifest_entries[entry_id] = [fingerprint, self.offset, len(chunk)]
+        self.write_bytes(chunk)
+
+    def close(self) -> None:
+        if self.previous is not None:
+            self.previous.close()
+        if not self.file.closed:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.file.close()
+
+    def commit(self) -> None:
+        os.replace(self.temp_path, self.output_path)
+        if not self.incremental:
+            return
+        try:
+            stat = os.stat(self.output_path)
+            manifest = {
+                "version": MANIFEST_VERSION,
+                "compact": self.compact,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "entries": self.manifest_entries,
+            }
+            serialization.dump_file_raw(manifest, manifest_path_for(self.output_path))
+        except OSError as e:
+            logger.warning(f"Could not write export manifest for {self.output_path}: {e}")
+
+    def discard(self) -> None:
+        if self.previous is not None:
+            self.previous.close()
+        if not self.file.closed:
+            self.file.close()
+        try:
+            os.remove(self.temp_path)
+        except OSError:
+            logger.warning(f"Could not remove temporary export file {self.temp_path}")
+
+
+def write_lorebook_streams(
+    data: dict[str, Any],
+    outputs: list[tuple[str, EntryTransform | None]],
+    progress_callback: ProgressCallback | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
+    progress_step: int = 50,
+    compact: bool = False,
+    incremental: bool = False,
+    entry_versions: Mapping[str, str] | None = None,
+) -> int:
+    entries: dict[str, Any] = data.get("entries", {})
+    if entry_versions is None:
+        entry_versions = {}
+    colon = ":" if compact else ": "
+
+    def newline(depth: int) -> str:
+        return "" if compact else "\n" + INDENT * depth
+
+    total = len(entries)
+    targets: list[_StreamTarget] = []
+    try:
+        for output_path, transform_entry in outputs:
+            targets.append(
+                _StreamTarget(output_path, transform_entry, incremental, compact)
+            )
+
+        def write_all(text: str) -> None:
+            for target in targets:
+                target.write(text)
+
+        write_all("{")
+        first_top_level = True
+        for top_key, top_value in data.items():
+            write_all("" if first_top_level else ",")
+            first_top_level = False
+            write_all(f"{newline(1)}{_dump_key(top_key)}{colon}")
+            if top_key != "entries":
+                write_all(_dump_value(top_value, 1, compact))
+                continue
+            if not entries:
+                write_all("{}")
+                continue
+            write_all("{")
+            for written, (entry_id, entry_data) in enumerate(entries.items(), 1):
+                if is_cancelled is not None and is_cancelled():
+                    raise ExportCancelled()
+                write_all(
+                    f"{'' if written == 1 else ','}{newline(2)}{_dump_key(str(entry_id))}{colon}"
+                )
+                untransformed_text = None
+                for target in targets:
+                    if target.incremental:
+                        target.write_entry(
+                            str(entry_id), entry_data, entry_versions.get(str(entry_id))
+                        )
+                    elif target.transform_entry is None:
+                        if untransformed_text is None:
+                            untransformed_text = _dump_value(entry_data, 2, compact)
+                        target.write(untransformed_text)
+                    else:
+                        target.write(
+                            _dump_value(target.transform_entry(entry_data), 2, compact)
+                        )
+                if progress_callback is not None and (
+                    written % progress_step == 0 or written == total
+                ):
+                    progress_callback(written, total)
+            write_all(f"{newline(1)}}}")
+        write_all(f"{newline(0)}}}" if not first_top_level else "}")
+        for target in targets:
+            target.close()
+    except BaseException:
+        for target in targets:
+            target.discard()
+        raise
+    committed: list[str] = []
+    failed: list[tuple[str, str]] = []
+    for target in targets:
+        try:
+            target.commit()
+        except OSError as e:
+            target.discard()
+            failed.append((target.output_path, str(e)))
+        else:
+            committed.append(target.output_path)
+    if failed:
+        raise ExportCommitError(committed, failed)
+    logger.debug(f"Streamed {total} entries to {len(targets)} file(s).")
+    for target in targets:
+        if target.incremental:
+            logger.info(
+                f"Incremental export reused {target.reused}/{total} entries for {os.path.basename(target.output_path)}."
+            )
+    return total
+
+
+def write_lorebook_stream(
+    data: dict[str, Any],
+    output_path: str,
+    transform_entry: EntryTransform | None = None,
+    progress_callback: ProgressCallback | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
+    progress_step: int = 50,
+    compact: bool = False,
+    incremental: bool = False,
+) -> int:
+    return write_lorebook_streams(
+        data,
+        [(output_path, transform_entry)],
+        progress_callback=progress_callback,
+        is_cancelled=is_cancelled,
+        progress_step=progress_step,
+        compact=compact,
+        incremental=incremental,
+    )
@@ -0,0 +1,264 @@
+import os
+import time
+import logging
+import threading
+from collections import Counter
+from logging import Logger
+from typing import Callable, Any
+from .constants import LOG_PREFIX
+from .data_handler import LorebookDataHandler
+from .cache_store import TranslationCacheStore, headless_cache_path
+from .engine import TranslationEngine, TranslationRequest
+from .progress_reporter import ProgressReporter
+from .export_writer import build_export_keys, write_lorebook_streams
+from .tracing import tracer, STAGE_CACHE_WRITTEN
+
+logger: Logger = logging.getLogger(f"{LOG_PREFIX}_APP.headless")
+
+CACHE_SAVE_INTERVAL = 25
+
+LanguagePair = tuple[str, str]
+EventCallback = Callable[[dict[str, Any]], None]
+
+
+def parse_language_pair(text: str) -> LanguagePair:
+    src_lang, separator, tgt_lang = text.partition(":")
+    src_lang, tgt_lang = src_lang.strip(), tgt_lang.strip()
+    if not separator or not src_lang or not tgt_lang:
+        raise ValueError(f"Invalid language pair '{text}', expected SOURCE:TARGET.")
+    if src_lang == tgt_lang:
+        raise ValueError(f"Source and target language are the same in '{text}'.")
+    return src_lang, tgt_lang
+
+
+def collect_source_texts(data_handler: LorebookDataHandler) -> dict[str, str]:
+    source_texts: dict[str, str] = {}
+    for _, entry_data in data_handler.get_sorted_lore_entries():
+        content = entry_data.get("content", "") or ""
+        for key_text in entry_data.get("key", []):
+            key_text = key_text.strip()
+            if key_text and key_text not in source_texts:
+                source_texts[key_text] = content
+    return source_texts
+
+
+class BookJob:
+    def __init__(
+        self,
+        engine: TranslationEngine,
+        path: str,
+        pairs: list[LanguagePair],
+        emit: EventCallback,
+        force: bool = False,
+        use_context: bool = False,
+        group: str | None = None,
+    ) -> None:
+        self.engine = engine
+        self.path = path
+        self.pairs = list(dict.fromkeys(pairs))
+        self.emit = emit
+        self.force = force
+        self.use_context = use_context
+        self.group = group or os.path.abspath(path)
+        self.data_handler = LorebookDataHandler()
+        self.cache: TranslationCacheStore | None = None
+        self.status = "pending"
+        self.progress = ProgressReporter()
+        self.cached = 0
+        self.errors: list[str] = []
+        self.failed_source_texts: set[str] = set()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self._pending: list[TranslationRequest] = []
+        self._lock = threading.Lock()
+        self._closing = False
+        self._finished = threading.Event()
+
+    @property
+    def total(self) -> int:
+        return self.progress.total
+
+    @property
+    def translated(self) -> int:
+        return self.progress.completed
+
+    @property
+    def failed(self) -> int:
+        return self.progress.failed
+
+    @property
+    def processed(self) -> int:
+        return self.translated + self.failed
+
+    def _event(self, event: str, **fields: Any) -> None:
+        self.emit({"event": event, "book": self.path, **fields})
+
+    def load(self) -> None:
+        self.data_handler.load(self.path)
+        self.cache = TranslationCacheStore(headless_cache_path(self.path))
+
+    def plan(self, only_keys: set[str] | None = None) -> None:
+        assert self.cache is not None, "Call load() before plan()."
+        source_texts = collect_source_texts(self.data_handler)
+        if only_keys is not None:
+            source_texts = {
+                key_text: content
+                for key_text, content in source_texts.items()
+                if key_text in only_keys
+            }
+        self._pending.clear()
+        self.cached = 0
+        for src_lang, tgt_lang in self.pairs:
+            for source_text, content in source_texts.items():
+                if not self.force and self.cache.get(source_text, src_lang, tgt_lang):
+                    self.cached += 1
+                    continue
+                self._pending.append(
+                    TranslationRequest(
+                        source_text=source_text,
+                        src_lang=src_lang,
+                        tgt_lang=tgt_lang,
+                        context=content if self.use_context else "",
+                        group=self.group,
+                    )
+                )
+        self.progress.reset(len(self._pending))
+        self.status = "queued"
+        self._event(
+            "book_loaded",
+            entries=len(self.data_handler.data["entries"]),
+            unique_keys=len(source_texts),
+            pairs=[f"{src}:{tgt}" for src, tgt in self.pairs],
+            queued=self.total,
+            cached=self.cached,
+        )
+
+    def prepare(self) -> None:
+        self.load()
+        self.plan()
+
+    def start(self) -> None:
+        self.progress.reset(len(self._pending))
+        self.started_at = time.monotonic()
+        self.status = "running"
+        pending, self._pending = self._pending, []
+        if not pending:
+            self._finish()
+            return
+        for request in pending:
+            self.engine.submit(request, self._on_result)
+
+    def cancel(self) -> None:
+        dropped = self.engine.cancel_group(self.group)
+        logger.info(f"Cancelled {dropped} queued request(s) for {self.path}")
+        with self._lock:
+            if self._closing:
+                return
+            self.progress.record_failed(dropped)
+            self.status = "cancelled"
+        self._finish()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._finished.wait(timeout)
+
+    def is_finished(self) -> bool:
+        return self._finished.is_set()
+
+    def _on_result(
+        self, request: TranslationRequest, translation: str | None, error: Exception | None
+    ) -> None:
+        assert self.cache is not None
+        with self._lock:
+            if self._closing:
+                return
+            if request.attempts > 1:
+                self.progress.record_retry(request.attempts - 1)
+            if translation:
+                self.cache.set(request.source_text, request.src_lang, request.tgt_lang, translation)
+                tracer.mark(request.request_id, STAGE_CACHE_WRITTEN)
+                self.progress.record_completed()
+            else:
+                self.progress.record_failed()
+                self.failed_source_texts.add(request.source_text)
+                message = str(error) if error else "No translation returned."
+                self.errors.append(f"{request.source_text} ({request.src_lang}->{request.tgt_lang}): {message}")
+            snapshot = self.progress.snapshot()
+            done = snapshot["processed"] >= snapshot["total"]
+        if not translation:
+            self._event(
+                "item_failed",
+                source_text=request.source_text,
+                pair=f"{request.src_lang}:{request.tgt_lang}",
+                attempts=request.attempts,
+                error=message,
+            )
+        self._event(
+            "progress",
+            processed=snapshot["processed"],
+            total=snapshot["total"],
+            translated=snapshot["completed"],
+            failed=snapshot["failed"],
+            retries=snapshot["retries"],
+            eta_seconds=snapshot["eta_seconds"],
+        )
+        if done:
+            self._finish()
+        elif snapshot["processed"] % CACHE_SAVE_INTERVAL == 0:
+            self.cache.save()
+
+    def _finish(self) -> None:
+        with self._lock:
+            if self._closing:
+                return
+            self._closing = True
+            if self.status != "cancelled":
+                self.status = "failed" if self.failed else "done"
+            self.finished_at = time.monotonic()
+        if self.cache is not None:
+            self.cache.save()
+        self._event("book_done", **self.summary())
+        self._finished.set()
+
+    def summary(self) -> dict[str, Any]:
+        elapsed = None
+        if self.started_at is not None:
+            elapsed = round((self.finished_at or time.monotonic()) - self.started_at, 3)
+        return {
+            "status": self.status,
+            "total": self.total,
+            "translated": self.translated,
+            "failed": self.failed,
+            "retries": self.progress.retries,
+            "cached": self.cached,
+            "elapsed_seconds": elapsed,
+        }
+
+    def lookup(self, src_lang: str) -> Callable[[str, str], str | None]:
+        assert self.cache is not None
+        cache = self.cache
+        return lambda key_text, lang: cache.get(key_text, src_lang, lang)
+
+    def export(self, export_dir: str, compact: bool = False) -> list[str]:
+        data = self.data_handler.data
+        assert data is not None, "Cannot export with no data loaded."
+        os.makedirs(export_dir, exist_ok=True)
+        lore_name = os.path.splitext(os.path.basename(self.path))[0]
+        outputs = []
+        target_counts = Counter(tgt_lang for _, tgt_lang in self.pairs)
+        for src_lang, tgt_lang in self.pairs:
+            lookup = self.lookup(src_lang)
+
+            def transform_entry(entry_data, lookup=lookup, tgt_lang=tgt_lang):
+                exported_entry = dict(entry_data)
+                exported_entry["key"] = build_export_keys(
+                    entry_data.get("key", []), lookup, [tgt_lang], False, "leave"
+                )
+                return exported_entry
+
+            suffix = tgt_lang if target_counts[tgt_lang] == 1 else f"{src_lang}_{tgt_lang}"
+            output_path = os.path.join(export_dir, f"{lore_name}_{suffix}.json")
+            outputs.append((output_path, transform_entry))
+        write_lorebook_streams(data, outputs, compact=compact)
+        output_paths = [path for path, _ in outputs]
+        self._event("book_exported", files=output_paths)
+        return output_paths
@@ -0,0 +1,307 @@
+import os
+import re
+import copy
+import mmap
+import logging
+import threading
+from logging import Logger
+from typing import Any, Callable
+from .constants import LOG_PREFIX
+from . import serialization
+
+logger: Logger = logging.getLogger(f"{LOG_PREFIX}_APP.lazy_content")
+
+LAZY_FIELDS = frozenset({"content"})
+
+_BOM = b"\xef\xbb\xbf"
+_WHITESPACE = re.compile(rb"[ \t\r\n]*")
+_STRUCTURE = re.compile(rb'["{}\[\]]')
+_SCALAR = re.compile(rb"[^,\]}\s]+")
+_QUOTE = ord('"')
+_BACKSLASH = ord("\\")
+_OPENERS = (ord("{"), ord("["))
+_LAZY_KEY_TOKENS = {f'"{field}"'.encode(): field for field in LAZY_FIELDS}
+_MAX_KEY_TOKEN = max(len(token) for token in _LAZY_KEY_TOKENS)
+
+
+class StaleSourceError(OSError):
+    pass
+
+
+class MappedSource:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            stat = os.fstat(self._file.fileno())
+            self.signature = (stat.st_size, stat.st_mtime_ns)
+            self.buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        self._lock = threading.Lock()
+
+    def is_current(self) -> bool:
+        if self.buffer.closed:
+            return False
+        stat = os.fstat(self._file.fileno())
+        return (stat.st_size, stat.st_mtime_ns) == self.signature
+
+    def read_field(self, start: int, end: int) -> Any:
+        with self._lock:
+            if self.buffer.closed:
+                raise StaleSourceError(f"{self.path} is no longer mapped; reload the LORE-book.")
+            if not self.is_current():
+                logger.warning(f"{self.path} changed on disk since it was loaded; deferred content is unavailable.")
+                self.close()
+                raise StaleSourceError(f"{self.path} changed on disk since it was loaded; reload the LORE-book.")
+            return serialization.loads(self.buffer[start:end])
+
+    def close(self) -> None:
+        if not self.buffer.closed:
+            self.buffer.close()
+        if not self._file.closed:
+            self._file.close()
+
+
+class MappedText:
+    __slots__ = ("source", "start", "end")
+
+    def __init__(self, source: MappedSource, start: int, end: int) -> None:
+        self.source = source
+        self.start = start
+        self.end = end
+
+    def decode(self) -> str:
+        return self.source.read_field(self.start, self.end)
+
+    def __repr__(self) -> str:
+        return f"<MappedText {os.path.basename(self.source.path)}[{self.start}:{self.end}]>"
+
+
+def _decoded(value: Any) -> Any:
+    return value.decode() if isinstance(value, MappedText) else value
+
+
+class LazyEntry(dict):
+    __slots__ = ("_pending",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._pending = any(
+            isinstance(dict.get(self, field), MappedText) for field in LAZY_FIELDS
+        )
+
+    def _materialize(self) -> None:
+        if not self._pending:
+            return
+        for field in LAZY_FIELDS:
+            value = dict.get(self, field)
+            if isinstance(value, MappedText):
+                dict.__setitem__(self, field, value.decode())
+        self._pending = False
+
+    def is_materialized(self) -> bool:
+        return not self._pending
+
+    def __getitem__(self, key: str) -> Any:
+        return _decoded(dict.__getitem__(self, key))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return _decoded(dict.get(self, key, default))
+
+    def __iter__(self):
+        return dict.__iter__(self)
+
+    def items(self):
+        return self.copy().items()
+
+    def values(self):
+        return self.copy().values()
+
+    def pop(self, key: str, *default: Any) -> Any:
+        self._materialize()
+        return dict.pop(self, key, *default)
+
+    def popitem(self) -> tuple[str, Any]:
+        self._materialize()
+        return dict.popitem(self)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        self._materialize()
+        return dict.setdefault(self, key, default)
+
+    def copy(self) -> dict[str, Any]:
+        if not self._pending:
+            return dict(dict.items(self))
+        return {key: _decoded(value) for key, value in dict.items(self)}
+
+    def __copy__(self) -> dict[str, Any]:
+        return self.copy()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, Any]:
+        return copy.deepcopy(self.copy(), memo)
+
+    def __reduce_ex__(self, protocol: int):
+        return (dict, (self.copy(),))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyEntry):
+            other = other.copy()
+        return dict.__eq__(self.copy(), other)
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+
+def _skip_whitespace(buffer: mmap.mmap, pos: int) -> int:
+    return _WHITESPACE.match(buffer, pos).end()
+
+
+def _string_end(buffer: mmap.mmap, pos: int) -> int:
+    end = pos
+    while True:
+        end = buffer.find(b'"', end + 1)
+        if end < 0:
+            raise ValueError(f"Unterminated string at byte {pos}.")
+        backslashes = 0
+        while buffer[end - 1 - backslashes] == _BACKSLASH:
+            backslashes += 1
+        if backslashes % 2 == 0:
+            return end + 1
+
+
+def _value_end(buffer: mmap.mmap, pos: int) -> int:
+    first = buffer[pos] if pos < len(buffer) else None
+    if first == _QUOTE:
+        return _string_end(buffer, pos)
+    if first not in _OPENERS:
+        match = _SCALAR.match(buffer, pos)
+        if match is None:
+            raise ValueError(f"Expected a JSON value at byte {pos}.")
+        return match.end()
+    depth = 0
+    while True:
+        match = _STRUCTURE.search(buffer, pos)
+        if match is None:
+            raise ValueError(f"Unterminated JSON value at byte {pos}.")
+        token = buffer[match.start()]
+        if token == _QUOTE:
+            pos = _string_end(buffer, match.start())
+            continue
+        pos = match.end()
+        depth += 1 if token in _OPENERS else -1
+        if depth == 0:
+            return pos
+
+
+def _read_plain(buffer: mmap.mmap, pos: int) -> tuple[Any, int]:
+    end = _value_end(buffer, pos)
+    return serialization.loads(buffer[pos:end]), end
+
+
+def _scan_object(
+    buffer: mmap.mmap, pos: int, read_value: Callable[[str, int], tuple[Any, int]]
+) -> tuple[dict[str, Any], int]:
+    if buffer[pos:pos + 1] != b"{":
+        raise ValueError(f"Expected a JSON object at byte {pos}.")
+    members: dict[str, Any] = {}
+    pos = _skip_whitespace(buffer, pos + 1)
+    if buffer[pos:pos + 1] == b"}":
+        return members, pos + 1
+    while True:
+        key_end = _string_end(buffer, pos)
+        key: str = serialization.loads(buffer[pos:key_end])
+        pos = _skip_whitespace(buffer, key_end)
+        if buffer[pos:pos + 1] != b":":
+            raise ValueError(f"Expected ':' at byte {pos}.")
+        members[key], pos = read_value(key, _skip_whitespace(buffer, pos + 1))
+        pos = _skip_whitespace(buffer, pos)
+        separator = buffer[pos:pos + 1]
+        if separator == b"}":
+            return members, pos + 1
+        if separator != b",":
+            raise ValueError(f"Expected ',' or '}}' at byte {pos}.")
+        pos = _skip_whitespace(buffer, pos + 1)
+
+
+def _read_entry(source: MappedSource, pos: int) -> tuple[Any, int]:
+    buffer = source.buffer
+    if buffer[pos:pos + 1] != b"{":
+        return _read_plain(buffer, pos)
+    start = pos
+    depth = 0
+    lazy_spans: list[tuple[str, int, int]] = []
+    while True:
+        match = _STRUCTURE.search(buffer, pos)
+        if match is None:
+            raise ValueError(f"Unterminated entry at byte {start}.")
+        token_start = match.start()
+        token = buffer[token_start]
+        if token != _QUOTE:
+            pos = match.end()
+            depth += 1 if token in _OPENERS else -1
+            if depth == 0:
+                break
+            continue
+        pos = _string_end(buffer, token_start)
+        if depth != 1:
+            continue
+        field = _LAZY_KEY_TOKENS.get(buffer[token_start:pos]) if pos - token_start <= _MAX_KEY_TOKEN else None
+        if field is None:
+            continue
+        colon = _skip_whitespace(buffer, pos)
+        if buffer[colon:colon + 1] != b":":
+            continue
+        value_start = _skip_whitespace(buffer, colon + 1)
+        if buffer[value_start:value_start + 1] == b'"':
+            pos = _string_end(buffer, value_start)
+            lazy_spans.append((field, value_start, pos))
+    if not lazy_spans:
+        return serialization.loads(buffer[start:pos]), pos
+    parts: list[bytes] = []
+    cursor = start
+    for _, span_start, span_end in lazy_spans:
+        parts.append(buffer[cursor:span_start])
+        parts.append(b"null")
+        cursor = span_end
+    parts.append(buffer[cursor:pos])
+    entry = LazyEntry(serialization.loads(b"".join(parts)))
+    for field, span_start, span_end in lazy_spans:
+        dict.__setitem__(entry, field, MappedText(source, span_start, span_end))
+    entry._pending = True
+    return entry, pos
+
+
+def load_mapped_lorebook(path: str) -> tuple[dict[str, Any], MappedSource]:
+    source = MappedSource(path)
+    try:
+        return _scan_lorebook(source), source
+    except Exception:
+        source.close()
+        raise
+
+
+def _scan_lorebook(source: MappedSource) -> dict[str, Any]:
+    path = source.path
+    buffer = source.buffer
+    pos = _skip_whitespace(buffer, len(_BOM) if buffer[:len(_BOM)] == _BOM else 0)
+
+    def read_entries(pos: int) -> tuple[Any, int]:
+        if buffer[pos:pos + 1] != b"{":
+            return _read_plain(buffer, pos)
+        return _scan_object(buffer, pos, lambda _, value_pos: _read_entry(source, value_pos))
+
+    data, end = _scan_object(
+        buffer,
+        pos,
+        lambda key, value_pos: read_entries(value_pos) if key == "entries" else _read_plain(buffer, value_pos),
+    )
+    if _skip_whitespace(buffer, end) != len(buffer):
+        raise ValueError(f"Unexpected data after the LORE-book at byte {end}.")
+    logger.debug(
+        f"Memory-mapped {path}: {len(data.get('entries', {}))} entries, "
+        f"{len(buffer)} bytes, content left on disk."
+    )
+    return data
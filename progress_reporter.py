@@ -0,0 +1,81 @@
+import time
+import threading
+from typing import Any, Optional
+
+
+class ProgressReporter:
+    def __init__(self, eta_smoothing: float = 0.2) -> None:
+        self._lock = threading.Lock()
+        self.eta_smoothing = eta_smoothing
+        self.reset()
+
+    def reset(self, total: int = 0) -> None:
+        with self._lock:
+            self.total = total
+            self.completed = 0
+            self.failed = 0
+            self.retries = 0
+            self.started_at = time.monotonic()
+            self._last_done_at = self.started_at
+            self._avg_seconds_per_job: Optional[float] = None
+
+    def _record_done(self, count: int) -> None:
+        now = time.monotonic()
+        per_job = (now - self._last_done_at) / count
+        self._last_done_at = now
+        if self._avg_seconds_per_job is None:
+            self._avg_seconds_per_job = per_job
+        else:
+            self._avg_seconds_per_job += self.eta_smoothing * (per_job - self._avg_seconds_per_job)
+
+    def record_completed(self, count: int = 1) -> None:
+        if count <= 0:
+            return
+        with self._lock:
+            self.completed += count
+            self._record_done(count)
+
+    def record_failed(self, count: int = 1) -> None:
+        if count <= 0:
+            return
+        with self._lock:
+            self.failed += count
+            self._record_done(count)
+
+    def record_retry(self, count: int = 1) -> None:
+        with self._lock:
+            self.retries += count
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            processed = self.completed + self.failed
+            remaining = max(self.total - processed, 0)
+            elapsed = time.monotonic() - self.started_at
+            eta_seconds = None
+            if self._avg_seconds_per_job is not None and remaining:
+                eta_seconds = remaining * self._avg_seconds_per_job
+            elif not remaining:
+                eta_seconds = 0.0
+            return {
+                "total": self.total,
+                "completed": self.completed,
+                "failed": self.failed,
+                "retries": self.retries,
+                "processed": processed,
+                "remaining": remaining,
+                "elapsed_seconds": elapsed,
+                "eta_seconds": eta_seconds,
+            }
+
+    @staticmethod
+    def format_snapshot(snapshot: dict[str, Any]) -> str:
+        text = f"{snapshot['processed']}/{snapshot['total']} done"
+        if snapshot["failed"]:
+            text += f", {snapshot['failed']} failed"
+        if snapshot["retries"]:
+            text += f", {snapshot['retries']} retried"
+        eta = snapshot["eta_seconds"]
+        if eta is not None and snapshot["remaining"]:
+            minutes, seconds = divmod(int(eta), 60)
+            text += f" — ETA {minutes}:{seconds:02d}"
+        return text
@@ -0,0 +1,176 @@
+import re
+import logging
+from abc import ABC, abstractmethod
+from logging import Logger
+import requests
+from .constants import LOG_PREFIX, APP_NAME
+from .tracing import tracer, STAGE_REQUEST_SENT, STAGE_FIRST_BYTE
+
+logger: Logger = logging.getLogger(f"{LOG_PREFIX}_APP.providers")
+
+GEMINI_API_URL = "https://generativelanguage.googleapis.com/v1beta"
+DEFAULT_GEMINI_MODEL = "gemini-2.0-flash"
+DEFAULT_TIMEOUT_SECONDS = 60.0
+RETRYABLE_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+
+class ProviderError(Exception):
+    def __init__(self, message: str, retryable: bool = False) -> None:
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class RateLimitError(ProviderError):
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message, retryable=True)
+        self.retry_after = retry_after
+
+
+def _parse_retry_after(response: requests.Response) -> float | None:
+    header = response.headers.get("Retry-After")
+    if header:
+        try:
+            return float(header)
+        except ValueError:
+            pass
+    match = re.search(r'"retryDelay"\s*:\s*"(\d+(?:\.\d+)?)s"', response.text)
+    return float(match.group(1)) if match else None
+
+
+def clean_translation(text: str) -> str:
+    lines = [line.strip() for line in text.strip().splitlines() if line.strip()]
+    if not lines:
+        return ""
+    cleaned = lines[0]
+    if len(cleaned) >= 2 and cleaned[0] == cleaned[-1] and cleaned[0] in "\"'`«»“”":
+        cleaned = cleaned[1:-1].strip()
+    return cleaned.strip("\"“”«»").strip()
+
+
+class TranslationProvider(ABC):
+    name = "base"
+
+    def __init__(
+        self,
+        model: str,
+        temperature: float | None = None,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    ) -> None:
+        self.model = model
+        self.temperature = temperature
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    @abstractmethod
+    def complete(
+        self, system_prompt: str, user_prompt: str, api_key: str, trace_id: str | None = None
+    ) -> str: ...
+
+    def _post(
+        self, url: str, payload: dict, headers: dict[str, str], trace_id: str | None = None
+    ) -> dict:
+        if trace_id:
+            tracer.mark(trace_id, STAGE_REQUEST_SENT)
+        try:
+            response = self.session.post(
+                url, json=payload, headers=headers, timeout=self.timeout, stream=True
+            )
+        except requests.RequestException as e:
+            raise ProviderError(f"{self.name} request failed: {e}", retryable=True) from e
+        if trace_id:
+            tracer.mark(trace_id, STAGE_FIRST_BYTE)
+        if response.status_code == 429:
+            raise RateLimitError(
+                f"{self.name} rate limit reached (HTTP 429).",
+                retry_after=_parse_retry_after(response),
+            )
+        if response.status_code >= 400:
+            raise ProviderError(
+                f"{self.name} returned HTTP {response.status_code}: {response.text[:300]}",
+                retryable=response.status_code in RETRYABLE_STATUS_CODES,
+            )
+        try:
+            return response.json()
+        except ValueError as e:
+            raise ProviderError(f"{self.name} returned invalid JSON.", retryable=True) from e
+
+
+class GeminiProvider(TranslationProvider):
+    name = "gemini"
+
+    def __init__(self, model: str = DEFAULT_GEMINI_MODEL, base_url: str = GEMINI_API_URL, **kwargs) -> None:
+        super().__init__(model, **kwargs)
+        self.base_url = base_url.rstrip("/")
+
+    def complete(
+        self, system_prompt: str, user_prompt: str, api_key: str, trace_id: str | None = None
+    ) -> str:
+        model_path = self.model if self.model.startswith("models/") else f"models/{self.model}"
+        payload: dict = {
+            "systemInstruction": {"parts": [{"text": system_prompt}]},
+            "contents": [{"role": "user", "parts": [{"text": user_prompt}]}],
+        }
+        if self.temperature is not None:
+            payload["generationConfig"] = {"temperature": self.temperature}
+        data = self._post(
+            f"{self.base_url}/{model_path}:generateContent",
+            payload,
+            {"x-goog-api-key": api_key},
+            trace_id,
+        )
+        candidates = data.get("candidates") or []
+        if not candidates:
+            block_reason = (data.get("promptFeedback") or {}).get("blockReason", "no candidates")
+            raise ProviderError(f"Gemini returned no translation ({block_reason}).")
+        parts = (candidates[0].get("content") or {}).get("parts") or []
+        return "".join(part.get("text", "") for part in parts if not part.get("thought"))
+
+
+class OpenAICompatibleProvider(TranslationProvider):
+    name = "openai"
+
+    def __init__(self, model: str, base_url: str, **kwargs) -> None:
+        super().__init__(model, **kwargs)
+        self.base_url = base_url.rstrip("/")
+
+    def complete(
+        self, system_prompt: str, user_prompt: str, api_key: str, trace_id: str | None = None
+    ) -> str:
+        payload: dict = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+        }
+        if self.temperature is not None:
+            payload["temperature"] = self.temperature
+        headers = {"Authorization": f"Bearer {api_key}", "X-Title": APP_NAME}
+        data = self._post(f"{self.base_url}/chat/completions", payload, headers, trace_id)
+        choices = data.get("choices") or []
+        if not choices:
+            raise ProviderError("Provider returned no choices.")
+        return (choices[0].get("message") or {}).get("content") or ""
+
+
+def create_provider(
+    name: str,
+    model: str | None = None,
+    base_url: str | None = None,
+    temperature: float | None = None,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+) -> TranslationProvider:
+    if name == GeminiProvider.name:
+        return GeminiProvider(
+            model=model or DEFAULT_GEMINI_MODEL,
+            base_url=base_url or GEMINI_API_URL,
+            temperature=temperature,
+            timeout=timeout,
+        )
+    if name == OpenAICompatibleProvider.name:
+        if not model or not base_url:
+            raise ValueError("The OpenAI-compatible provider needs both a model and a base URL.")
+        return OpenAICompatibleProvider(
+            model=model, base_url=base_url, temperature=temperature, timeout=timeout
+        )
+    raise ValueError(f"Unknown provider '{name}'.")
@@ -0,0 +1,182 @@
+import logging
+from logging import Logger
+from typing import Callable, Protocol
+from PySide6 import QtCore, QtWidgets
+from omni_trans_core.utils import DebounceTimer
+from .data_handler import LorebookDataHandler
+from .lazy_content import MappedText, StaleSourceError
+from .constants import LOG_PREFIX
+
+logger: Logger = logging.getLogger(f"{LOG_PREFIX}_APP.search_service")
+
+SEARCH_DEBOUNCE_MS = 250
+SEARCHABLE_FIELDS = frozenset({"uid", "key", "comment", "content"})
+
+
+class SearchableView(Protocol):
+    def apply_search_filter(self, matched_entry_ids: set[str] | None) -> None: ...
+
+
+SearchRecord = tuple[str, str, tuple[str, ...], str, str | MappedText]
+
+
+def make_search_record(entry_id: str, entry_data: dict) -> SearchRecord:
+    return (
+        entry_id,
+        str(entry_data.get("uid", "")),
+        tuple(entry_data.get("key", [])),
+        entry_data.get("comment", "") or "",
+        dict.get(entry_data, "content", "") or "",
+    )
+
+
+def record_matches(record: SearchRecord, needle: str) -> bool:
+    _, uid, keys, comment, content = record
+    if needle in uid.casefold() or needle in ", ".join(keys).casefold():
+        return True
+    if needle in comment.casefold():
+        return True
+    if isinstance(content, MappedText):
+        try:
+            content = content.decode()
+        except StaleSourceError:
+            return False
+    return needle in str(content).casefold()
+
+
+class SearchSignals(QtCore.QObject):
+    finished = QtCore.Signal(int, object)
+
+
+class SearchRunnable(QtCore.QRunnable):
+    def __init__(
+        self,
+        generation: int,
+        query: str,
+        records: tuple[SearchRecord, ...],
+        extra_texts: dict[str, str],
+        signals: SearchSignals,
+    ) -> None:
+        super().__init__()
+        self.generation = generation
+        self.query = query
+        self.records = records
+        self.extra_texts = extra_texts
+        self.signals = signals
+
+    @QtCore.Slot()
+    def run(self) -> None:
+        needle = self.query.casefold()
+        matched = {
+            record[0]
+            for record in self.records
+            if needle in self.extra_texts.get(record[0], "").casefold()
+            or record_matches(record, needle)
+        }
+        self.signals.finished.emit(self.generation, matched)
+
+
+class SearchService(QtCore.QObject):
+    results_ready = QtCore.Signal(object)
+
+    def __init__(
+        self, data_handler: LorebookDataHandler, parent: QtCore.QObject | None = None
+    ) -> None:
+        super().__init__(parent)
+        self.data_handler = data_handler
+        self.query: str = ""
+        self.matched_entry_ids: set[str] | None = None
+        self._inputs: list[QtWidgets.QLineEdit] = []
+        self._views: list[SearchableView] = []
+        self._text_providers: list[Callable[[], dict[str, str]]] = []
+        self._generation: int = 0
+        self._signals = SearchSignals()
+        self._signals.finished.connect(self._on_search_finished)
+        self._debounce_timer = DebounceTimer(self._start_search, SEARCH_DEBOUNCE_MS, self)
+        self.data_handler.data_loaded.connect(self.refresh)
+        self.data_handler.entry_added.connect(self.refresh)
+        self.data_handler.entry_deleted.connect(self.refresh)
+        self.data_handler.entry_fields_changed.connect(self._on_entry_fields_changed)
+
+    def attach_input(
+        self, search_input: QtWidgets.QLineEdit, filter_owner: QtCore.QObject | None = None
+    ) -> None:
+        if filter_owner is not None and not QtCore.QObject.disconnect(
+            search_input, QtCore.SIGNAL("textChanged(QString)"), filter_owner, None
+        ):
+            logger.debug(f"No built-in search filter of {type(filter_owner).__name__} to detach.")
+        if self._inputs and search_input.text() != self._inputs[0].text():
+            search_input.setText(self._inputs[0].text())
+        search_input.textChanged.connect(
+            lambda text, source=search_input: self._on_input_changed(source, text)
+        )
+        self._inputs.append(search_input)
+
+    def register_view(self, view: SearchableView) -> None:
+        self._views.append(view)
+        view.apply_search_filter(self.matched_entry_ids)
+
+    def add_text_provider(self, provider: Callable[[], dict[str, str]]) -> None:
+        self._text_providers.append(provider)
+        self.refresh()
+
+    @QtCore.Slot()
+    def refresh(self) -> None:
+        if self.query:
+            self._debounce_timer.trigger()
+
+    @QtCore.Slot(str, object)
+    def _on_entry_fields_changed(self, _entry_id: str, changed_fields: frozenset[str]) -> None:
+        if changed_fields & SEARCHABLE_FIELDS:
+            self.refresh()
+
+    def _on_input_changed(self, source: QtWidgets.QLineEdit, text: str) -> None:
+        for search_input in self._inputs:
+            if search_input is not source and search_input.text() != text:
+                search_input.blockSignals(True)
+                search_input.setText(text)
+                search_input.blockSignals(False)
+        self.query = text.strip()
+        if not self.query:
+            self._debounce_timer.cancel()
+            self._generation += 1
+            self._publish(None)
+            return
+        self._debounce_timer.trigger()
+
+    def _collect_extra_texts(self) -> dict[str, str]:
+        extra_texts: dict[str, list[str]] = {}
+        for provider in self._text_providers:
+            for entry_id, text in provider().items():
+                extra_texts.setdefault(entry_id, []).append(text)
+        return {entry_id: " ".join(texts) for entry_id, texts in extra_texts.items()}
+
+    def _start_search(self) -> None:
+        if not self.query:
+            return
+        self._generation += 1
+        records = tuple(
+            make_search_record(entry_id, entry_data)
+            for entry_id, entry_data in self.data_handler.get_sorted_lore_entries()
+        )
+        runnable = SearchRunnable(
+            self._generation,
+            self.query,
+            records,
+            self._collect_extra_texts(),
+            self._signals,
+        )
+        QtCore.QThreadPool.globalInstance().start(runnable)
+
+    @QtCore.Slot(int, object)
+    def _on_search_finished(self, generation: int, matched: set[str]) -> None:
+        if generation != self._generation:
+            return
+        logger.debug(f"Search '{self.query}' matched {len(matched)} entries.")
+        self._publish(matched)
+
+    def _publish(self, matched: set[str] | None) -> None:
+        self.matched_entry_ids = matched
+        for view in self._views:
+            view.apply_search_filter(matched)
+        self.results_ready.emit(matched)
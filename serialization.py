@@ -0,0 +1,114 @@
+import os
+import json
+import tempfile
+import logging
+from logging import Logger
+from typing import Any
+from .constants import LOG_PREFIX
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger: Logger = logging.getLogger(f"{LOG_PREFIX}_APP.serialization")
+
+HAS_ORJSON = orjson is not None
+BACKEND_STDLIB = "json"
+BACKEND_ORJSON = "orjson"
+
+_use_fast_backend = HAS_ORJSON
+
+
+def set_fast_backend_enabled(enabled: bool) -> None:
+    global _use_fast_backend
+    _use_fast_backend = bool(enabled) and HAS_ORJSON
+
+
+def active_backend() -> str:
+    return BACKEND_ORJSON if _use_fast_backend else BACKEND_STDLIB
+
+
+def _stdlib_dumps(obj: Any, compact: bool) -> str:
+    if compact:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def _has_only_safe_scalars(obj: Any) -> bool:
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if type(key) is not str:
+                    return False
+                stack.append(item)
+        elif isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, float):
+            return False
+        elif isinstance(value, int) and not isinstance(value, bool):
+            if not -(2**63) <= value < 2**64:
+                return False
+        elif value is not None and not isinstance(value, (str, bool)):
+            return False
+    return True
+
+
+def dumps(obj: Any, compact: bool = False) -> str:
+    if _use_fast_backend and _has_only_safe_scalars(obj):
+        option = 0 if compact else orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    return _stdlib_dumps(obj, compact)
+
+
+def dumps_raw(obj: Any) -> bytes:
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    if _use_fast_backend:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def load_file(path: str) -> Any:
+    with open(path, "rb") as f:
+        raw = f.read()
+    if raw.startswith(b"\xef\xbb\xbf"):
+        raw = raw[3:]
+    return loads(raw)
+
+
+def replace_file(path: str, payload: bytes) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def dump_file(obj: Any, path: str, compact: bool = False) -> None:
+    replace_file(path, dumps(obj, compact=compact).encode("utf-8"))
+
+
+def dump_file_raw(obj: Any, path: str) -> None:
+    replace_file(path, dumps_raw(obj))
@@ -0,0 +1,423 @@
+import os
+import re
+import sys
+import json
+import uuid
+import time
+import logging
+import argparse
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from logging import Logger
+from typing import Any
+from urllib.parse import urlparse, parse_qs
+from .constants import LOG_PREFIX
+from . import serialization
+from .cli import (
+    add_engine_arguments,
+    configure_logging,
+    create_engine_from_args,
+    initialize_settings,
+    write_trace_file,
+)
+from .data_handler import is_lorebook_data
+from .engine import TranslationEngine
+from .batch import is_within
+from .headless import BookJob, parse_language_pair
+from .tracing import tracer
+
+logger: Logger = logging.getLogger(f"{LOG_PREFIX}_APP.service")
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_UPLOAD_BYTES = 64 * 1024 * 1024
+MAX_JOB_EVENTS = 500
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+FINISHED_STATES = frozenset({"completed", "failed", "cancelled"})
+JSON_CONTENT_TYPE = "application/json"
+UPLOAD_DIR_NAME = "upload"
+
+_UNSAFE_NAME_CHARS = re.compile(r"[^\w.\- ]+")
+
+
+class ServiceError(Exception):
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def _safe_book_name(name: str) -> str:
+    base_name = os.path.basename(name or "").strip()
+    base_name = _UNSAFE_NAME_CHARS.sub("_", os.path.splitext(base_name)[0]).strip(" .")
+    return base_name or "lorebook"
+
+
+class ServiceJob:
+    def __init__(self, job_id: str, name: str, book_path: str, output_dir: str) -> None:
+        self.job_id = job_id
+        self.name = name
+        self.book_path = book_path
+        self.output_dir = output_dir
+        self.created_at = time.time()
+        self.book: BookJob | None = None
+        self.state = "queued"
+        self.error: str | None = None
+        self.results: dict[str, str] = {}
+        self.events: deque[dict[str, Any]] = deque(maxlen=MAX_JOB_EVENTS)
+        self.event_count = 0
+        self._lock = threading.Lock()
+
+    def record_event(self, event: dict[str, Any]) -> None:
+        with self._lock:
+            self.event_count += 1
+            self.events.append({"seq": self.event_count, **event})
+
+    def events_since(self, since: int) -> list[dict[str, Any]]:
+        with self._lock:
+            return [event for event in self.events if event["seq"] > since]
+
+    def to_dict(self) -> dict[str, Any]:
+        book = self.book
+        progress = book.summary() if book is not None else {}
+        return {
+            "job_id": self.job_id,
+            "name": self.name,
+            "state": self.state,
+            "error": self.error,
+            "created_at": self.created_at,
+            "pairs": [f"{src}:{tgt}" for src, tgt in book.pairs] if book else [],
+            "progress": {
+                "processed": book.processed if book else 0,
+                "total": progress.get("total", 0),
+                "translated": progress.get("translated", 0),
+                "failed": progress.get("failed", 0),
+                "retries": progress.get("retries", 0),
+                "cached": progress.get("cached", 0),
+                "elapsed_seconds": progress.get("elapsed_seconds"),
+            },
+            "results": sorted(self.results),
+        }
+
+
+class TranslationService:
+    def __init__(
+        self,
+        engine: TranslationEngine,
+        work_dir: str,
+        compact_exports: bool = False,
+        path_roots: list[str] | None = None,
+    ) -> None:
+        self.engine = engine
+        self.work_dir = os.path.abspath(work_dir)
+        self.jobs_dir = os.path.join(self.work_dir, "jobs")
+        self.compact_exports = compact_exports
+        self.path_roots = [os.path.realpath(root) for root in path_roots or []]
+        self.jobs: dict[str, ServiceJob] = {}
+        self._lock = threading.Lock()
+        self._export_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lgt-export")
+        os.makedirs(self.jobs_dir, exist_ok=True)
+
+    def start(self) -> None:
+        self.engine.start()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            jobs = list(self.jobs.values())
+        for job in jobs:
+            if job.book is not None and job.state not in FINISHED_STATES:
+                job.book.cancel()
+        self.engine.shutdown(wait=False)
+        self._export_executor.shutdown(wait=True)
+
+    def _resolve_local_path(self, local_path: str) -> str:
+        if not self.path_roots:
+            raise ServiceError(
+                HTTPStatus.FORBIDDEN,
+                "Local 'path' submissions are disabled; start the service with --path-root.",
+            )
+        book_path = os.path.realpath(local_path)
+        if not any(is_within(book_path, root) for root in self.path_roots):
+            raise ServiceError(HTTPStatus.FORBIDDEN, f"'{local_path}' is outside the allowed path roots.")
+        if not os.path.isfile(book_path):
+            raise ServiceError(HTTPStatus.BAD_REQUEST, f"'{local_path}' is not a file.")
+        return book_path
+
+    def submit_job(self, payload: Any) -> ServiceJob:
+        if not isinstance(payload, dict):
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "Request body must be a JSON object.")
+        lorebook = payload.get("lorebook")
+        if lorebook is None and not isinstance(payload.get("path"), str):
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "Provide a 'lorebook' object or a local 'path'.")
+        if lorebook is not None and not is_lorebook_data(lorebook):
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "'lorebook' must be a LORE-book object with 'entries'.")
+        raw_pairs = payload.get("pairs")
+        if not isinstance(raw_pairs, list) or not raw_pairs:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "'pairs' must be a non-empty list of 'SOURCE:TARGET'.")
+        try:
+            pairs = [parse_language_pair(str(pair)) for pair in raw_pairs]
+        except ValueError as e:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, str(e)) from e
+
+        job_id = uuid.uuid4().hex[:12]
+        job_dir = os.path.join(self.jobs_dir, job_id)
+        local_path = payload.get("path")
+        if lorebook is None and isinstance(local_path, str):
+            book_path = self._resolve_local_path(local_path)
+            name = _safe_book_name(book_path)
+        else:
+            name = _safe_book_name(str(payload.get("name", "")))
+            book_path = os.path.join(job_dir, UPLOAD_DIR_NAME, f"{name}.json")
+        job = ServiceJob(job_id, name, book_path, job_dir)
+        job.book = BookJob(
+            self.engine,
+            book_path,
+            pairs,
+            lambda event: self._on_book_event(job, event),
+            force=bool(payload.get("force", False)),
+            use_context=bool(payload.get("use_context", False)),
+            group=job_id,
+        )
+        try:
+            if lorebook is not None:
+                os.makedirs(os.path.dirname(book_path), exist_ok=True)
+                serialization.dump_file(lorebook, book_path, compact=True)
+            job.book.prepare()
+        except Exception as e:
+            logger.error(f"Failed to prepare job {job_id}: {e}", exc_info=True)
+            raise ServiceError(HTTPStatus.BAD_REQUEST, f"Could not load LORE-book: {e}") from e
+        with self._lock:
+            self.jobs[job_id] = job
+        job.state = "running"
+        job.book.start()
+        logger.info(f"Accepted job {job_id} ({name}) with {job.book.total} request(s).")
+        return job
+
+    def get_job(self, job_id: str) -> ServiceJob:
+        with self._lock:
+            job = self.jobs.get(job_id)
+        if job is None:
+            raise ServiceError(HTTPStatus.NOT_FOUND, f"Unknown job '{job_id}'.")
+        return job
+
+    def list_jobs(self) -> list[dict[str, Any]]:
+        with self._lock:
+            jobs = list(self.jobs.values())
+        return [job.to_dict() for job in jobs]
+
+    def cancel_job(self, job_id: str) -> ServiceJob:
+        job = self.get_job(job_id)
+        if job.book is not None and job.state not in FINISHED_STATES:
+            job.book.cancel()
+        return job
+
+    def result_path(self, job_id: str, language: str | None) -> str:
+        job = self.get_job(job_id)
+        if job.state != "completed":
+            raise ServiceError(HTTPStatus.CONFLICT, f"Job '{job_id}' is {job.state}.")
+        if language is None:
+            candidates = list(job.results)
+        elif language in job.results:
+            candidates = [language]
+        else:
+            candidates = [pair for pair in job.results if pair.split(":", 1)[1] == language]
+        if not candidates:
+            raise ServiceError(HTTPStatus.NOT_FOUND, f"No result for language '{language}'.")
+        if len(candidates) != 1:
+            raise ServiceError(
+                HTTPStatus.BAD_REQUEST,
+                f"Choose a language pair with ?lang=SOURCE:TARGET, available: {', '.join(sorted(candidates))}.",
+            )
+        return job.results[candidates[0]]
+
+    def _on_book_event(self, job: ServiceJob, event: dict[str, Any]) -> None:
+        event = {key: value for key, value in event.items() if key != "book"}
+        job.record_event(event)
+        if event["event"] != "book_done":
+            return
+        if event.get("status") == "cancelled":
+            job.state = "cancelled"
+            return
+        job.state = "exporting"
+        self._export_executor.submit(self._export_job, job)
+
+    def _export_job(self, job: ServiceJob) -> None:
+        assert job.book is not None
+        try:
+            output_paths = job.book.export(job.output_dir, compact=self.compact_exports)
+        except Exception as e:
+            logger.error(f"Export failed for job {job.job_id}: {e}", exc_info=True)
+            job.error = f"Export failed: {e}"
+            job.state = "failed"
+            return
+        for (src_lang, tgt_lang), output_path in zip(job.book.pairs, output_paths):
+            job.results[f"{src_lang}:{tgt_lang}"] = output_path
+        if job.book.failed:
+            job.error = f"{job.book.failed} item(s) failed to translate."
+        job.state = "completed"
+        logger.info(f"Job {job.job_id} completed: {job.book.summary()}")
+
+
+class ServiceRequestHandler(BaseHTTPRequestHandler):
+    server_version = "LGTService/1.0"
+    service: TranslationService
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def _send_json(self, status: HTTPStatus, body: Any) -> None:
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_text(self, status: HTTPStatus, text: str, content_type: str) -> None:
+        payload = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_file(self, path: str) -> None:
+        size = os.path.getsize(path)
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(size))
+        self.send_header(
+            "Content-Disposition", f'attachment; filename="{os.path.basename(path)}"'
+        )
+        self.end_headers()
+        with open(path, "rb") as f:
+            while chunk := f.read(64 * 1024):
+                self.wfile.write(chunk)
+
+    def _read_json_body(self) -> Any:
+        content_type = self.headers.get("Content-Type", "").split(";", 1)[0].strip().lower()
+        if content_type != JSON_CONTENT_TYPE:
+            raise ServiceError(
+                HTTPStatus.UNSUPPORTED_MEDIA_TYPE, f"Content-Type must be {JSON_CONTENT_TYPE}."
+            )
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+        except ValueError:
+            length = -1
+        if length <= 0:
+            raise ServiceError(HTTPStatus.LENGTH_REQUIRED, "A JSON request body is required.")
+        if length > MAX_UPLOAD_BYTES:
+            raise ServiceError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Upload is too large.")
+        try:
+            return serialization.loads(self.rfile.read(length))
+        except ValueError as e:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {e}") from e
+
+    def _route(self, method: str) -> None:
+        url = urlparse(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        query = parse_qs(url.query)
+        try:
+            if method == "GET" and parts == ["stats"]:
+                self._send_json(HTTPStatus.OK, self.service.engine.stats())
+            elif method == "GET" and parts == ["traces"]:
+                self._send_json(HTTPStatus.OK, tracer.snapshot())
+            elif method == "GET" and parts == ["metrics"]:
+                self._send_text(HTTPStatus.OK, tracer.to_openmetrics(), OPENMETRICS_CONTENT_TYPE)
+            elif parts == ["jobs"] and method == "GET":
+                self._send_json(HTTPStatus.OK, {"jobs": self.service.list_jobs()})
+            elif parts == ["jobs"] and method == "POST":
+                job = self.service.submit_job(self._read_json_body())
+                self._send_json(HTTPStatus.ACCEPTED, job.to_dict())
+            elif len(parts) == 2 and parts[0] == "jobs" and method == "GET":
+                self._send_json(HTTPStatus.OK, self.service.get_job(parts[1]).to_dict())
+            elif len(parts) == 2 and parts[0] == "jobs" and method == "DELETE":
+                self._send_json(HTTPStatus.OK, self.service.cancel_job(parts[1]).to_dict())
+            elif len(parts) == 3 and parts[0] == "jobs" and parts[2] == "events" and method == "GET":
+                try:
+                    since = int(query.get("since", ["0"])[0])
+                except ValueError:
+                    since = 0
+                job = self.service.get_job(parts[1])
+                self._send_json(
+                    HTTPStatus.OK, {"state": job.state, "events": job.events_since(since)}
+                )
+            elif len(parts) == 3 and parts[0] == "jobs" and parts[2] == "result" and method == "GET":
+                self._send_file(self.service.result_path(parts[1], query.get("lang", [None])[0]))
+            else:
+                raise ServiceError(HTTPStatus.NOT_FOUND, f"No route for {method} {url.path}.")
+        except ServiceError as e:
+            self._send_json(e.status, {"error": str(e)})
+        except Exception as e:
+            logger.error(f"Unhandled error for {method} {self.path}: {e}", exc_info=True)
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)})
+
+    def do_GET(self) -> None:
+        self._route("GET")
+
+    def do_POST(self) -> None:
+        self._route("POST")
+
+    def do_DELETE(self) -> None:
+        self._route("DELETE")
+
+
+def create_server(
+    service: TranslationService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT
+) -> ThreadingHTTPServer:
+    handler = type("BoundServiceRequestHandler", (ServiceRequestHandler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m lgt_app.service",
+        description="Run a local HTTP service that translates uploaded LORE-books.",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--work-dir", default="lgt_service", help="Where uploads, caches and results are kept.")
+    parser.add_argument("--compact", action="store_true", help="Write results without indentation.")
+    parser.add_argument(
+        "--path-root",
+        action="append",
+        default=[],
+        metavar="DIR",
+        help="Allow jobs to reference local LORE-books under this folder (repeatable).",
+    )
+    add_engine_arguments(parser)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    configure_logging(args)
+    try:
+        engine = create_engine_from_args(args)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    initialize_settings()
+    service = TranslationService(
+        engine, args.work_dir, compact_exports=args.compact, path_roots=args.path_root
+    )
+    service.start()
+    server = create_server(service, args.host, args.port)
+    logger.warning(f"Serving on http://{args.host}:{server.server_port} (work dir {service.work_dir})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+        write_trace_file(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+import os
+import sys
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from logging import Logger
+from typing import Any, Iterator
+from .constants import LOG_PREFIX
+
+logger: Logger = logging.getLogger(f"{LOG_PREFIX}_APP.startup")
+
+STARTUP_PROFILE_ENV = "LGT_PROFILE_STARTUP"
+STARTUP_PROFILE_FLAG = "--profile-startup"
+STARTUP_BUDGET_MS = 1500
+TOP_IMPORTS = 15
+
+
+class _TimedLoader:
+    def __init__(self, loader: Any, profiler: "StartupProfiler") -> None:
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        self._profiler._enter_import(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit_import(module.__name__)
+
+
+class _ImportTimingFinder:
+    def __init__(self, profiler: "StartupProfiler") -> None:
+        self._profiler = profiler
+
+    def find_spec(self, fullname: str, path=None, target=None):
+        if threading.get_ident() != self._profiler._thread_id:
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self._profiler)
+            return spec
+        return None
+
+
+class StartupProfiler:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.started = time.perf_counter()
+        self.phases: list[tuple[str, float, float]] = []
+        self.imports: dict[str, tuple[float, float]] = {}
+        self.first_paint_ms: float | None = None
+        self._stack: list[list[Any]] = []
+        self._finder: _ImportTimingFinder | None = None
+        self._thread_id = threading.get_ident()
+
+    def enable_from_environment(self, argv: list[str] | None = None) -> bool:
+        argv = sys.argv if argv is None else argv
+        requested = STARTUP_PROFILE_FLAG in argv or os.environ.get(
+            STARTUP_PROFILE_ENV, ""
+        ).strip().lower() in ("1", "true", "yes", "on")
+        if STARTUP_PROFILE_FLAG in argv:
+            argv.remove(STARTUP_PROFILE_FLAG)
+        if requested:
+            self.enable()
+        return requested
+
+    def enable(self) -> None:
+        if self.enabled:
+            return
+        self.enabled = True
+        self.started = time.perf_counter()
+        self._thread_id = threading.get_ident()
+        self._finder = _ImportTimingFinder(self)
+        sys.meta_path.insert(0, self._finder)
+
+    def _elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        start = self._elapsed_ms()
+        modules_before = len(sys.modules)
+        try:
+            yield
+        finally:
+            self.phases.append((name, start, self._elapsed_ms() - start))
+            logger.debug(
+                f"Startup phase '{name}' took {self.phases[-1][2]:.1f} ms "
+                f"({len(sys.modules) - modules_before} new module(s))."
+            )
+
+    def _enter_import(self, name: str) -> None:
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def _exit_import(self, name: str) -> None:
+        if not self._stack:
+            return
+        _, started, children = self._stack.pop()
+        cumulative = time.perf_counter() - started
+        self.imports[name] = (cumulative * 1000, (cumulative - children) * 1000)
+        if self._stack:
+            self._stack[-1][2] += cumulative
+
+    def mark_first_paint(self) -> None:
+        if not self.enabled or self.first_paint_ms is not None:
+            return
+        self.first_paint_ms = self._elapsed_ms()
+        if self._finder is not None and self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+        self._finder = None
+        self.log_report()
+
+    def report(self) -> dict[str, Any]:
+        by_self = sorted(self.imports.items(), key=lambda item: item[1][1], reverse=True)
+        top_level: dict[str, float] = {}
+        for name, (cumulative, _) in self.imports.items():
+            root = name.partition(".")[0]
+            if name == root:
+                top_level[root] = top_level.get(root, 0.0) + cumulative
+        return {
+            "first_paint_ms": round(self.first_paint_ms or self._elapsed_ms(), 1),
+            "budget_ms": STARTUP_BUDGET_MS,
+            "phases": [
+                {"name": name, "start_ms": round(start, 1), "duration_ms": round(duration, 1)}
+                for name, start, duration in self.phases
+            ],
+            "packages": [
+                {"name": name, "cumulative_ms": round(cumulative, 1)}
+                for name, cumulative in sorted(top_level.items(), key=lambda item: item[1], reverse=True)[:TOP_IMPORTS]
+            ],
+            "imports": [
+                {"name": name, "self_ms": round(self_ms, 1), "cumulative_ms": round(cumulative, 1)}
+                for name, (cumulative, self_ms) in by_self[:TOP_IMPORTS]
+            ],
+            "modules_imported": len(self.imports),
+        }
+
+    def log_report(self) -> None:
+        report = self.report()
+        lines = [f"Startup profile: first paint after {report['first_paint_ms']:.1f} ms."]
+        lines.append("Phases:")
+        for phase in report["phases"]:
+            lines.append(
+                f"  {phase['name']:<28} {phase['duration_ms']:>8.1f} ms (at {phase['start_ms']:.1f} ms)"
+            )
+        lines.append(f"Packages by cumulative import time ({report['modules_imported']} modules imported):")
+        for package in report["packages"]:
+            lines.append(f"  {package['name']:<28} {package['cumulative_ms']:>8.1f} ms")
+        lines.append("Slowest modules by self time:")
+        for module in report["imports"]:
+            lines.append(
+                f"  {module['name']:<40} {module['self_ms']:>8.1f} ms self, {module['cumulative_ms']:>8.1f} ms total"
+            )
+        logger.info("\n".join(lines))
+        if report["first_paint_ms"] > STARTUP_BUDGET_MS:
+            logger.warning(
+                f"Main window painted after {report['first_paint_ms']:.0f} ms, over the {STARTUP_BUDGET_MS} ms startup budget."
+            )
+
+
+profiler = StartupProfiler()
@@ -1,3 +1,4 @@
+import time
 import logging
 import copy
 from PySide6 import QtWidgets, QtCore, QtGui
@@ -16,9 +17,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(f'{settings.LOG_PREFIX}_APP.editor_tab')
 
+LIST_FIELDS = frozenset({"uid", "key", "comment"})
+
 class EditorTab(AbstractTab):
     TAB_NAME = "Editor"
-    search_term_changed = QtCore.Signal(str)
+    materialized = QtCore.Signal()
 
     def __init__(self, main_window: "CoreApp", data_handler: "LorebookDataHandler"):
         super().__init__(main_window)
@@ -27,6 +30,7 @@ class EditorTab(AbstractTab):
         self.selected_editor_entry_id = None
         self.editor_active_entry_copy = None
         self.is_saving_from_editor = False
+        self.search_matches = None
         self.editor_widgets = {}
         self.editor_logic_map = {
             0: "AND ANY",
@@ -55,14 +59,32 @@ class EditorTab(AbstractTab):
             1: "Yes",
             2: "No"
         }
+        self.is_materialized = False
         self._init_field_mapping()
-        self.init_ui()
-        self._connect_signals()
         self.editor_debounce_timer = DebounceTimer(
             self.editor_save_entry_changes, 1000, self
         )
+
+    def showEvent(self, event):
+        if not self.is_materialized:
+            self.materialize()
+        super().showEvent(event)
+
+    def materialize(self):
+        if self.is_materialized:
+            return
+        started = time.perf_counter()
+        self.is_materialized = True
+        self.init_ui()
+        self._connect_signals()
         self.retranslate_ui()
         loc_man.language_changed.connect(self.retranslate_ui)
+        if self.data_handler.data:
+            self.editor_refresh_listbox()
+        logger.debug(
+            f"Editor tab built on first show in {(time.perf_counter() - started) * 1000:.1f} ms."
+        )
+        self.materialized.emit()
 
     def _init_field_mapping(self):
         self.field_mapping = {
@@ -332,6 +354,8 @@ class EditorTab(AbstractTab):
         return scroll_area
 
     def retranslate_ui(self):
+        if not self.is_materialized:
+            return
         loc_man.register(self.lore_entries_label, "text", "tab.editor.label.lore_entries")
         loc_man.register(self.editor_search_input, "placeholderText", "tab.editor.search.placeholder")
         loc_man.register(self.editor_add_btn, "text", "tab.editor.button.add")
@@ -403,7 +427,6 @@ class EditorTab(AbstractTab):
             )
 
     def _connect_signals(self):
-        self.editor_search_input.textChanged.connect(self.on_global_search_changed)
         self.table_widget.selection_changed.connect(self.editor_load_entry_details)
         self.editor_add_btn.clicked.connect(self.editor_add_entry)
         self.editor_duplicate_btn.clicked.connect(self.editor_duplicate_entry)
@@ -470,15 +493,20 @@ class EditorTab(AbstractTab):
                 )
         self.editor_widgets["content_edit"].focus_out.connect(self.on_before_save)
         self.data_handler.entry_deleted.connect(self.editor_refresh_listbox)
-        self.data_handler.entry_updated.connect(self._on_entry_updated)
+        self.data_handler.entry_fields_changed.connect(self._on_entry_fields_changed)
 
     @QtCore.Slot(bool)
     def toggle_recursion_level_field_animated(self, checked):
         widget = self.editor_widgets.get("delayRecursionLevel_edit")
         UIAnimator.toggle_visibility_animated(widget, show=checked)
 
-    @QtCore.Slot(str, dict)
-    def _on_entry_updated(self, entry_id: str, new_data: dict):
+    @QtCore.Slot(str, object)
+    def _on_entry_fields_changed(self, entry_id: str, changed_fields: frozenset):
+        if not changed_fields & LIST_FIELDS:
+            return
+        new_data = self.data_handler.get_entry(entry_id)
+        if new_data is None:
+            return
         update_dict = {
             "uid": str(new_data.get("uid", "N/A")),
             "keywords": ", ".join(new_data.get("key", [])),
@@ -488,9 +516,14 @@ class EditorTab(AbstractTab):
 
     @QtCore.Slot()
     def on_data_loaded(self):
-        self.editor_refresh_listbox()
+        if self.is_materialized:
+            self.editor_refresh_listbox()
 
     def clear_view(self):
+        if not self.is_materialized:
+            self.selected_editor_entry_id = None
+            self.editor_active_entry_copy = None
+            return
         self.editor_clear_form()
         self.editor_form_widget.setEnabled(False)
         self.editor_refresh_listbox()
@@ -524,19 +557,16 @@ class EditorTab(AbstractTab):
             uid = str(entry_data.get("uid", "N/A"))
             comment = entry_data.get("comment", "")
             keywords = ", ".join(entry_data.get("key", []))
-            full_searchable_text = (
-                f"{uid} {keywords} {comment} {entry_data.get('content', '')}"
-            )
             table_data.append(
                 {
                     "id": entry_id,
                     "uid": uid,
                     "keywords": keywords,
                     "comment": comment,
-                    "search_text": full_searchable_text,
                 }
             )
         self.table_widget.set_data(table_data, unique_id_key="id")
+        self.apply_search_filter(self.search_matches)
         if (
             selected_id_before_refresh
             and selected_id_before_refresh in self.table_widget._id_to_row_map
@@ -601,7 +631,7 @@ class EditorTab(AbstractTab):
         if not self.selected_editor_entry_id or self.editor_active_entry_copy is None:
             return
         self.editor_debounce_timer.cancel()
-        entry = self.editor_active_entry_copy
+        entry = dict(self.editor_active_entry_copy)
         for key, (widget_name, type, *default) in self.field_mapping.items():
             widget = self.editor_widgets[widget_name]
             default_val = default[0] if default else None
@@ -633,9 +663,12 @@ class EditorTab(AbstractTab):
         for key in keys_to_remove_if_none:
             if entry.get(key) is None and key in entry:
                 del entry[key]
-        self.data_handler.update_entry(
-            self.selected_editor_entry_id, self.editor_active_entry_copy
+        changed_fields = self.data_handler.update_entry(
+            self.selected_editor_entry_id, entry
         )
+        if not changed_fields:
+            return
+        self.editor_active_entry_copy = entry
         UIAnimator.flash_status_label(
             self.editor_save_status_label, "<b>Applied ✅</b>"
         )
@@ -706,9 +739,14 @@ class EditorTab(AbstractTab):
                 index_to_select = min(row_to_reselect, new_row_count - 1)
                 self.editor_entry_table.setCurrentCell(index_to_select, 0)
 
-    @QtCore.Slot(str)
-    def on_global_search_changed(self, text):
-        self.search_term_changed.emit(text)
+    def apply_search_filter(self, matched_entry_ids):
+        self.search_matches = matched_entry_ids
+        if not self.is_materialized:
+            return
+        for entry_id, row_index in self.table_widget._id_to_row_map.items():
+            hidden = matched_entry_ids is not None and entry_id not in matched_entry_ids
+            if self.editor_entry_table.isRowHidden(row_index) != hidden:
+                self.editor_entry_table.setRowHidden(row_index, hidden)
 
     def _select_entry_in_list_by_id(self, entry_id_to_select):
         row_index = self.table_widget._id_to_row_map.get(entry_id_to_select)
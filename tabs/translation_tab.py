@@ -1,4 +1,6 @@
 import logging
+from collections import OrderedDict
+from typing import NamedTuple
 from PySide6 import QtWidgets, QtCore
 from omni_trans_core.interfaces import (
     AbstractTab,
@@ -16,6 +18,10 @@ from omni_trans_core.ui.widgets import (
 )
 from omni_trans_core import constants as const
 from omni_trans_core import settings
+from ..ui.delegates import ContentPreviewDelegate
+from ..ui.row_highlight import ITEM_ID_ROLE
+from ..ui.diagnostics import LatencyDiagnosticsPanel
+from ..tracing import tracer, STAGE_RESPONSE_PARSED, STAGE_ROW_UPDATED
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from omni_trans_core.core import CoreApp
@@ -23,17 +29,79 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(f'{settings.LOG_PREFIX}_APP.translation_tab')
 
+RESULT_FLUSH_INTERVAL_MS = 33
+PREVIEW_CACHE_SIZE = 1024
+PREVIEW_MAX_LENGTH = 150
+CONTENT_PREVIEW_COLUMN = 3
+ENTRY_ID_ROLE = QtCore.Qt.ItemDataRole.UserRole + 64
+TABLE_LAYOUT_FIELDS = frozenset({"uid", "key"})
+
+
+def make_content_preview(text: str) -> str:
+    clean_text = text[: PREVIEW_MAX_LENGTH + 1].replace("\n", " ")
+    if len(text) > PREVIEW_MAX_LENGTH:
+        return clean_text[: PREVIEW_MAX_LENGTH - 3] + "..."
+    return clean_text
+
+
+class InflightRequest(NamedTuple):
+    token: int
+    version: int
+    src_lang: str
+    tgt_lang: str
+    trace_id: str
+
+
+class ContentPreviewCache:
+    def __init__(self, max_size: int = PREVIEW_CACHE_SIZE):
+        self.max_size = max_size
+        self._previews: OrderedDict[str, str] = OrderedDict()
+
+    def get(self, entry_id: str, content: str) -> str:
+        preview = self._previews.get(entry_id)
+        if preview is not None:
+            self._previews.move_to_end(entry_id)
+            return preview
+        preview = make_content_preview(content)
+        self._previews[entry_id] = preview
+        if len(self._previews) > self.max_size:
+            _ = self._previews.popitem(last=False)
+        return preview
+
+    def invalidate(self, entry_id: str):
+        _ = self._previews.pop(entry_id, None)
+
+    def clear(self):
+        self._previews.clear()
+
+
 class TranslationTab(AbstractTab, IControlWidgetActions):
     TAB_NAME = "Translation"
     translation_requested = QtCore.Signal(list, bool)
     generation_params_updated = QtCore.Signal(str, dict)
     data_availability_changed = QtCore.Signal(bool)
+    translations_changed = QtCore.Signal()
 
     def __init__(self, main_window: "CoreApp", data_handler: "LorebookDataHandler"):
         super().__init__(main_window)
         self.main_window = main_window
         self.data_handler = data_handler
         self.table_data = []
+        self.row_data_by_id = {}
+        self.search_matches = None
+        self.preview_cache = ContentPreviewCache()
+        self._pending_results: dict[str, str] = {}
+        self._pending_trace_ids: dict[str, str] = {}
+        self._pending_flash_ids: set[str] = set()
+        self._item_versions: dict[tuple[str, str, str], int] = {}
+        self._user_translations: dict[tuple[str, str, str], str] = {}
+        self._inflight_requests: dict[str, InflightRequest] = {}
+        self._request_seq: int = 0
+        self._discarded_result_ids: set[str] = set()
+        self._result_flush_timer = QtCore.QTimer(self)
+        self._result_flush_timer.setSingleShot(True)
+        self._result_flush_timer.setInterval(RESULT_FLUSH_INTERVAL_MS)
+        self._result_flush_timer.timeout.connect(self._flush_pending_results)
         self.data_availability_changed.emit(False)
         self.init_ui()
         self._connect_signals()
@@ -81,6 +149,13 @@ class TranslationTab(AbstractTab, IControlWidgetActions):
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.table.setWordWrap(False)
+        self.row_delegate = ContentPreviewDelegate(
+            self.table, CONTENT_PREVIEW_COLUMN, self._preview_for_index
+        )
+        self.table.setItemDelegate(self.row_delegate)
+        header = self.table.horizontalHeader()
+        self._sort_indicator = (header.sortIndicatorSection(), header.sortIndicatorOrder())
+        header.sortIndicatorChanged.connect(self._on_sort_indicator_changed)
         top_middle_h_splitter.addWidget(self.table_widget)
         right_panel_widget = QtWidgets.QWidget()
         right_panel_layout = QtWidgets.QVBoxLayout(right_panel_widget)
@@ -92,6 +167,8 @@ class TranslationTab(AbstractTab, IControlWidgetActions):
         right_panel_layout.addWidget(self.gen_params_widget)
         self.rpm_status_widget = RPMStatusWidget(self)
         right_panel_layout.addWidget(self.rpm_status_widget)
+        self.latency_panel = LatencyDiagnosticsPanel(tracer, self)
+        right_panel_layout.addWidget(self.latency_panel)
         right_panel_layout.addStretch()
         top_middle_h_splitter.addWidget(right_panel_widget)
         top_middle_h_splitter.setStretchFactor(0, 2)
@@ -113,9 +190,11 @@ class TranslationTab(AbstractTab, IControlWidgetActions):
         self.target_lang_widget.language_changed.connect(
             self._on_target_language_changed
         )
+        self.data_handler.data_loaded.connect(self.preview_cache.clear)
         self.data_handler.entry_added.connect(self.populate_table_data)
+        self.data_handler.entry_deleted.connect(self.preview_cache.invalidate)
         self.data_handler.entry_deleted.connect(self.populate_table_data)
-        self.data_handler.entry_updated.connect(self.populate_table_data)
+        self.data_handler.entry_fields_changed.connect(self._on_entry_fields_changed)
         self.connection_widget.model_changed.connect(
             self.gen_params_widget.set_connection_type
         )
@@ -136,31 +215,16 @@ class TranslationTab(AbstractTab, IControlWidgetActions):
 
     @QtCore.Slot(str)
     def on_source_language_change(self, lang_name: str):
-        if self.main_window.translation_manager.active_translation_jobs > 0:
-            QtWidgets.QMessageBox.warning(
-                self,
-                "Operation in Progress",
-                "Cannot change source language while translations are active.",
-            )
-            self.source_lang_widget.update_language_combo()
-            return
         logger.info(f"Source language changed to: {lang_name}")
         self.main_window.status_bar.showMessage(
             f"LORE-book source language: {lang_name}"
         )
+        self._discard_pending_results()
         if self.data_handler.data:
             self.populate_table_data()
 
     @QtCore.Slot(str)
     def _on_target_language_changed(self, lang_name: str):
-        if self.main_window.translation_manager.active_translation_jobs > 0:
-            QtWidgets.QMessageBox.warning(
-                self,
-                "Operation in Progress",
-                "Cannot change target language while translations are active.",
-            )
-            self.target_lang_widget.update_language_combo()
-            return
         logger.info(f"Target language changed to: {lang_name or 'None'}")
         self.control_panel.set_active_language(lang_name)
 
@@ -172,6 +236,7 @@ class TranslationTab(AbstractTab, IControlWidgetActions):
         self.full_content_display.clear()
         self.table.clearSelection()
         self.control_panel.clear_selection()
+        self._discard_pending_results()
         if self.data_handler.data:
             self.populate_table_data()
         self.main_window.status_bar.showMessage(
@@ -183,8 +248,28 @@ class TranslationTab(AbstractTab, IControlWidgetActions):
         self.populate_table_data()
         self.connection_widget.update_connections()
 
+    @QtCore.Slot(str, object)
+    def _on_entry_fields_changed(self, entry_id: str, changed_fields: frozenset):
+        if "content" in changed_fields:
+            self.preview_cache.invalidate(entry_id)
+        if changed_fields & TABLE_LAYOUT_FIELDS:
+            self.populate_table_data()
+            return
+        if "content" in changed_fields:
+            self.table.viewport().update()
+            selected_data = self.table_widget.get_selected_rows_data()
+            if selected_data and self._entry_id_for_row_data(selected_data[0]) == entry_id:
+                self.full_content_display.setPlainText(self._get_entry_content(entry_id))
+
     def clear_view(self):
+        self._discard_pending_results()
+        self._item_versions.clear()
+        self._user_translations.clear()
+        self._clear_inflight_requests()
+        self.preview_cache.clear()
+        self.row_delegate.clear_highlights()
         self.table_data = []
+        self.row_data_by_id = {}
         self.table.setRowCount(0)
         self.control_panel.clear_selection()
         self.full_content_display.clear()
@@ -192,9 +277,11 @@ class TranslationTab(AbstractTab, IControlWidgetActions):
         logger.debug("TranslationTab view cleared for new file.")
 
     def populate_table_data(self):
+        self._flush_pending_results()
         sorted_entries = self.data_handler.get_sorted_lore_entries()
         if not sorted_entries:
             self.table_data.clear()
+            self.row_data_by_id = {}
             self.table_widget.set_data([], unique_id_key="id")
             return
         new_table_data = []
@@ -202,21 +289,15 @@ class TranslationTab(AbstractTab, IControlWidgetActions):
         src_lang = self.source_lang_widget.combo.currentText()
         if not src_lang:
             self.table_data.clear()
+            self.row_data_by_id = {}
             self.table_widget.set_data([], unique_id_key="id")
             return
 
-        def get_preview(text: str) -> str:
-            clean_text = text.replace("\n", " ")
-            return (
-                (clean_text[:147] + "...") if len(clean_text) > 150 else clean_text
-            )
-
         for entry_id, entry_data in sorted_entries:
             uid = entry_data.get("uid")
             if uid is None:
                 continue
             original_keys = entry_data.get("key", [])
-            content = entry_data.get("content", "")
             if not isinstance(original_keys, list):
                 continue
 
@@ -234,27 +315,93 @@ class TranslationTab(AbstractTab, IControlWidgetActions):
                     new_table_data.append(
                         {
                             "id": f"{uid}:{orig_key_disp}",
+                            "entry_id": entry_id,
                             "uid": str(uid),
                             "key": orig_key_disp,
                             "translation": cached_trans,
-                            "content": content,
-                            "content_preview": get_preview(content),
+                            "content_preview": "",
                         }
                     )
             else:
                 new_table_data.append(
                     {
                         "id": f"{uid}:",
+                        "entry_id": entry_id,
                         "uid": str(uid),
                         "key": "",
                         "translation": "",
-                        "content": content,
-                        "content_preview": get_preview(content),
+                        "content_preview": "",
                     }
                 )
         self.table_data = new_table_data
+        self.row_data_by_id = {row_data["id"]: row_data for row_data in new_table_data}
         self.data_availability_changed.emit(bool(self.table_data))
         self.table_widget.set_data(self.table_data, unique_id_key="id")
+        self._tag_row_items()
+        self.apply_search_filter(self.search_matches)
+        self.translations_changed.emit()
+
+    def apply_search_filter(self, matched_entry_ids: set[str] | None):
+        self.search_matches = matched_entry_ids
+        id_to_row_map = self.table_widget._id_to_row_map
+        for row_data in self.table_data:
+            row_index = id_to_row_map.get(row_data["id"])
+            if row_index is None:
+                continue
+            hidden = (
+                matched_entry_ids is not None
+                and row_data["entry_id"] not in matched_entry_ids
+            )
+            if self.table.isRowHidden(row_index) != hidden:
+                self.table.setRowHidden(row_index, hidden)
+
+    def _entry_id_for_row_data(self, row_data: dict) -> str | None:
+        entry_id = row_data.get("entry_id")
+        if entry_id is None and row_data.get("uid") is not None:
+            entry_id = self.data_handler.find_entry_dict_key_by_uid(str(row_data["uid"]))
+        return entry_id
+
+    def _get_entry_content(self, entry_id: str | None) -> str:
+        entry_data = self.data_handler.get_entry(entry_id) if entry_id else None
+        return entry_data.get("content", "") if entry_data else ""
+
+    def _tag_row_items(self):
+        for item_id, row_index in self.table_widget._id_to_row_map.items():
+            row_data = self.row_data_by_id.get(item_id)
+            if row_data is None:
+                continue
+            for column, role, value in (
+                (0, ITEM_ID_ROLE, item_id),
+                (CONTENT_PREVIEW_COLUMN, ENTRY_ID_ROLE, row_data["entry_id"]),
+            ):
+                item = self.table.item(row_index, column)
+                if item is None:
+                    item = QtWidgets.QTableWidgetItem()
+                    self.table.setItem(row_index, column, item)
+                item.setData(role, value)
+
+    def _preview_for_index(self, index: QtCore.QModelIndex) -> str:
+        entry_id = index.data(ENTRY_ID_ROLE)
+        if not entry_id:
+            return ""
+        return self.preview_cache.get(entry_id, self._get_entry_content(entry_id))
+
+    @QtCore.Slot(int, QtCore.Qt.SortOrder)
+    def _on_sort_indicator_changed(self, column: int, order: QtCore.Qt.SortOrder):
+        if column != CONTENT_PREVIEW_COLUMN:
+            self._sort_indicator = (column, order)
+            return
+        # Previews are painted by the delegate, so the model has nothing to sort this column by.
+        self.table.horizontalHeader().setSortIndicator(*self._sort_indicator)
+
+    def get_search_texts(self) -> dict[str, str]:
+        texts: dict[str, list[str]] = {}
+        for row_data in self.table_data:
+            if row_data["translation"]:
+                texts.setdefault(row_data["entry_id"], []).append(
+                    row_data["translation"]
+                )
+        return {entry_id: " ".join(parts) for entry_id, parts in texts.items()}
 
     @QtCore.Slot()
     def _on_table_selection_changed(self, selected_data: list[dict]):
@@ -262,26 +409,16 @@ class TranslationTab(AbstractTab, IControlWidgetActions):
             self.control_panel.clear_selection()
             self.full_content_display.clear()
             return
-        if self.main_window.translation_manager.active_translation_jobs > 0:
-            self.table.clearSelection()
-            return
         first_item = selected_data[0]
         item_id = first_item.get("id", "")
         orig_k = first_item.get("key", "")
         trans_k = first_item.get("translation", "")
-        content_k = first_item.get("content", "")
+        content_k = self._get_entry_content(self._entry_id_for_row_data(first_item))
         self.control_panel.set_data(item_id, orig_k, trans_k)
         self.full_content_display.setPlainText(content_k)
 
     @QtCore.Slot(str, str)
     def _on_item_edited(self, item_id: str, new_text: str):
-        if self.main_window.translation_manager.active_translation_jobs > 0:
-            QtWidgets.QMessageBox.warning(
-                self,
-                "Operation in Progress",
-                "Cannot save edits while translations are active.",
-            )
-            return
         try:
             uid, orig_k = item_id.split(":", 1)
         except ValueError:
@@ -299,14 +436,16 @@ class TranslationTab(AbstractTab, IControlWidgetActions):
         self.main_window.cache_manager.update_cache(
             orig_k, new_text, src_lang, tgt_lang
         )
+        self._record_user_translation(item_id, src_lang, tgt_lang, new_text)
         self.main_window.status_bar.showMessage(
             f"Applied edit for '{orig_k}' (UID {uid}).", 3000
         )
-        for row_data in self.table_data:
-            if row_data.get("id") == item_id:
-                row_data["translation"] = new_text
-                break
+        self._drop_pending_result(item_id)
+        row_data = self.row_data_by_id.get(item_id)
+        if row_data is not None:
+            row_data["translation"] = new_text
         self.table_widget.update_row_by_id(item_id, {"translation": new_text})
+        self.translations_changed.emit()
 
     def get_selected_items(self) -> list[TranslatableItem]:
         selected_rows_data = self.table_widget.get_selected_rows_data()
@@ -317,13 +456,9 @@ class TranslationTab(AbstractTab, IControlWidgetActions):
             uid = row_data.get("uid")
             orig_k = row_data.get("key")
             trans_k = row_data.get("translation")
-            content = row_data.get("content")
-            dict_key = self.data_handler.find_entry_dict_key_by_uid(str(uid))
-            entry_data = (
-                self.data_handler.data["entries"].get(dict_key, {})
-                if dict_key and self.data_handler.data
-                else {}
-            )
+            dict_key = self._entry_id_for_row_data(row_data)
+            entry_data = (self.data_handler.get_entry(dict_key) if dict_key else None) or {}
+            content = entry_data.get("content", "")
             item = TranslatableItem(
                 id=row_data.get("id", ""),
                 source_text=str(orig_k),
@@ -345,16 +480,80 @@ class TranslationTab(AbstractTab, IControlWidgetActions):
                 self, "Info", "Load or create a LORE-book first."
             )
             return
+        src_lang, tgt_lang = self._current_languages()
+        model = self.main_window.get_active_model_full_id() or ""
+        for item in items:
+            item_id = item["id"]
+            self._request_seq += 1
+            token = self._request_seq
+            superseded = self._inflight_requests.get(item_id)
+            if superseded is not None:
+                tracer.discard(superseded.trace_id)
+            trace_id = f"{item_id}#{token}"
+            tracer.start(trace_id, model=model)
+            item["request_token"] = token
+            self._inflight_requests[item_id] = InflightRequest(
+                token,
+                self._item_versions.get((item_id, src_lang, tgt_lang), 0),
+                src_lang,
+                tgt_lang,
+                trace_id,
+            )
         self.translation_requested.emit(items, force_regen)
 
-    def handle_deletion_request(self, items: list[TranslatableItem]):
-        if self.main_window.translation_manager.active_translation_jobs > 0:
-            QtWidgets.QMessageBox.warning(
-                self,
-                "Operation in Progress",
-                "Cannot delete translations while other operations are active.",
+    def _current_languages(self) -> tuple[str, str]:
+        return (
+            self.source_lang_widget.combo.currentText(),
+            self.target_lang_widget.combo.currentText(),
+        )
+
+    def _record_user_translation(
+        self, item_id: str, src_lang: str, tgt_lang: str, text: str
+    ):
+        version_key = (item_id, src_lang, tgt_lang)
+        self._item_versions[version_key] = self._item_versions.get(version_key, 0) + 1
+        self._user_translations[version_key] = text
+
+    def _clear_inflight_requests(self):
+        for request in self._inflight_requests.values():
+            tracer.discard(request.trace_id)
+        self._inflight_requests.clear()
+
+    def _accept_result(self, item_id: str, request: InflightRequest | None) -> bool:
+        source_text = item_id.split(":", 1)[-1]
+        if request is None:
+            return self._verify_untracked_result(item_id, source_text)
+        version_key = (item_id, request.src_lang, request.tgt_lang)
+        if self._item_versions.get(version_key, 0) != request.version:
+            user_text = self._user_translations.get(version_key, "")
+            self.main_window.cache_manager.update_cache(
+                source_text, user_text, request.src_lang, request.tgt_lang
             )
-            return
+            logger.info(
+                f"Discarded late result for '{item_id}' ({request.tgt_lang}): edited by user during the request."
+            )
+            return False
+        if (request.src_lang, request.tgt_lang) != self._current_languages():
+            logger.debug(
+                f"Result for '{item_id}' targets {request.src_lang}->{request.tgt_lang}; cached without display."
+            )
+            return False
+        return True
+
+    def _verify_untracked_result(self, item_id: str, source_text: str) -> bool:
+        src_lang, tgt_lang = self._current_languages()
+        version_key = (item_id, src_lang, tgt_lang)
+        if version_key in self._user_translations:
+            self.main_window.cache_manager.update_cache(
+                source_text, self._user_translations[version_key], src_lang, tgt_lang
+            )
+            logger.info(
+                f"Discarded untracked result for '{item_id}' ({tgt_lang}): the translation was set by the user."
+            )
+            return False
+        return True
+
+    def handle_deletion_request(self, items: list[TranslatableItem]):
         tgt_lang = self.target_lang_widget.combo.currentText()
         src_lang = self.source_lang_widget.combo.currentText()
         if not all([tgt_lang, src_lang]):
@@ -382,22 +581,22 @@ class TranslationTab(AbstractTab, IControlWidgetActions):
                 self.main_window.cache_manager.update_cache(
                     source_text, "", src_lang, tgt_lang
                 )
-                for row_data in self.table_data:
-                    if row_data.get("id") == item_id:
-                        row_data["translation"] = ""
-                        break
+                self._record_user_translation(item_id, src_lang, tgt_lang, "")
+                self._drop_pending_result(item_id)
+                row_data = self.row_data_by_id.get(item_id)
+                if row_data is not None:
+                    row_data["translation"] = ""
                 self.table_widget.update_row_by_id(item_id, {"translation": ""})
                 if self.control_panel.current_item_id == item_id:
                     self.control_panel.update_item_display(item_id, "")
                 deleted_count += 1
             if deleted_ids:
-                self.table_widget.flash_row_by_id(
-                    deleted_ids, color=const.FLASH_DANGER_COLOR
-                )
+                self.row_delegate.highlight_items(deleted_ids, const.FLASH_DANGER_COLOR)
             if deleted_count > 0:
                 self.main_window.status_bar.showMessage(
                     f"Deleted {deleted_count} translation(s).", 5000
                 )
+                self.translations_changed.emit()
 
     def show_info_message(self, title: str, text: str):
         QtWidgets.QMessageBox.information(self, title, text)
@@ -408,13 +607,90 @@ class TranslationTab(AbstractTab, IControlWidgetActions):
         final_translation = update_data.get("final_translation", "")
         if not item_id:
             return
-        self.table_widget.update_row_by_id(item_id, {"translation": final_translation})
-        self.control_panel.update_item_display(item_id, final_translation)
-        self.table_widget.scroll_to_row_by_id(item_id)
+        request = self._inflight_requests.get(item_id)
+        token = update_data.get("request_token")
+        if token is not None and (request is None or token != request.token):
+            logger.debug(f"Ignored result of a superseded request for '{item_id}'.")
+            self._discarded_result_ids.add(item_id)
+            if request is None:
+                self._verify_untracked_result(item_id, item_id.split(":", 1)[-1])
+            return
+        if request is not None:
+            del self._inflight_requests[item_id]
+        if not self._accept_result(item_id, request):
+            self._discarded_result_ids.add(item_id)
+            if request is not None:
+                tracer.discard(request.trace_id)
+            return
+        self._discarded_result_ids.discard(item_id)
+        self._drop_pending_result(item_id)
+        self._pending_results[item_id] = final_translation
+        if request is not None:
+            tracer.mark(request.trace_id, STAGE_RESPONSE_PARSED)
+            self._pending_trace_ids[item_id] = request.trace_id
+        self._schedule_result_flush()
 
     def flash_items(self, item_ids: list[str]):
         for item_id in item_ids:
-            self.table_widget.flash_row_by_id(item_id)
+            if item_id in self._discarded_result_ids:
+                self._discarded_result_ids.discard(item_id)
+            else:
+                self._pending_flash_ids.add(item_id)
+        self._schedule_result_flush()
+
+    def _schedule_result_flush(self):
+        if not self._result_flush_timer.isActive():
+            self._result_flush_timer.start()
+
+    def _drop_pending_result(self, item_id: str):
+        self._pending_results.pop(item_id, None)
+        trace_id = self._pending_trace_ids.pop(item_id, None)
+        if trace_id is not None:
+            tracer.discard(trace_id)
+
+    def _discard_pending_results(self):
+        self._result_flush_timer.stop()
+        for trace_id in self._pending_trace_ids.values():
+            tracer.discard(trace_id)
+        self._pending_results.clear()
+        self._pending_trace_ids.clear()
+        self._pending_flash_ids.clear()
+        self._discarded_result_ids.clear()
+
+    @QtCore.Slot()
+    def _flush_pending_results(self):
+        self._result_flush_timer.stop()
+        if not self._pending_results and not self._pending_flash_ids:
+            return
+        results = self._pending_results
+        trace_ids = self._pending_trace_ids
+        flash_ids = self._pending_flash_ids
+        self._pending_results = {}
+        self._pending_trace_ids = {}
+        self._pending_flash_ids = set()
+        self.table.setUpdatesEnabled(False)
+        try:
+            for item_id, final_translation in results.items():
+                row_data = self.row_data_by_id.get(item_id)
+                if row_data is not None:
+                    row_data["translation"] = final_translation
+                self.table_widget.update_row_by_id(
+                    item_id, {"translation": final_translation}
+                )
+                if self.control_panel.current_item_id == item_id:
+                    self.control_panel.update_item_display(item_id, final_translation)
+        finally:
+            self.table.setUpdatesEnabled(True)
+        for trace_id in trace_ids.values():
+            tracer.finish(trace_id, STAGE_ROW_UPDATED)
+        if flash_ids:
+            self.row_delegate.highlight_items(flash_ids)
+        if results:
+            self.table_widget.scroll_to_row_by_id(next(reversed(results)))
+            self.translations_changed.emit()
+        logger.debug(
+            f"Applied {len(results)} translation result(s) and {len(flash_ids)} highlight(s) in one frame."
+        )
 
     @QtCore.Slot()
     def on_settings_changed(self):
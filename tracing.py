@@ -0,0 +1,204 @@
+import math
+import time
+import logging
+import threading
+from collections import OrderedDict
+from logging import Logger
+from typing import Any
+from .constants import LOG_PREFIX
+
+logger: Logger = logging.getLogger(f"{LOG_PREFIX}_APP.tracing")
+
+STAGE_ENQUEUE = "enqueue"
+STAGE_DISPATCH = "dispatch"
+STAGE_REQUEST_SENT = "request_sent"
+STAGE_FIRST_BYTE = "first_byte"
+STAGE_RESPONSE_PARSED = "response_parsed"
+STAGE_CACHE_WRITTEN = "cache_written"
+STAGE_ROW_UPDATED = "row_updated"
+STAGES = (
+    STAGE_ENQUEUE,
+    STAGE_DISPATCH,
+    STAGE_REQUEST_SENT,
+    STAGE_FIRST_BYTE,
+    STAGE_RESPONSE_PARSED,
+    STAGE_CACHE_WRITTEN,
+    STAGE_ROW_UPDATED,
+)
+SEGMENT_TOTAL = "total"
+
+LATENCY_BUCKETS = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, math.inf,
+)
+MAX_ACTIVE_TRACES = 10000
+UNKNOWN_LABEL = "unknown"
+
+
+class Histogram:
+    __slots__ = ("bucket_counts", "count", "total", "maximum")
+
+    def __init__(self) -> None:
+        self.bucket_counts = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.bucket_counts[index] += 1
+                break
+        self.count += 1
+        self.total += seconds
+        self.maximum = max(self.maximum, seconds)
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for bound, bucket_count in zip(LATENCY_BUCKETS, self.bucket_counts):
+            if bucket_count and seen + bucket_count >= rank:
+                upper = min(bound, self.maximum)
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+            lower = bound
+        return self.maximum
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "max": round(self.maximum, 6),
+            "p50": round(self.quantile(0.5), 6),
+            "p95": round(self.quantile(0.95), 6),
+            "buckets": {
+                ("+Inf" if math.isinf(bound) else str(bound)): bucket_count
+                for bound, bucket_count in zip(LATENCY_BUCKETS, self.bucket_counts)
+            },
+        }
+
+
+class _ActiveTrace:
+    __slots__ = ("marks", "model", "key")
+
+    def __init__(self, model: str, key: str) -> None:
+        self.marks: dict[str, float] = {}
+        self.model = model
+        self.key = key
+
+
+class Tracer:
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._active: OrderedDict[str, _ActiveTrace] = OrderedDict()
+        self._histograms: dict[tuple[str, str, str], Histogram] = {}
+        self._finished = 0
+        self._dropped = 0
+        self._lock = threading.Lock()
+
+    def start(self, trace_id: str, model: str = "", key: str = "", stage: str = STAGE_ENQUEUE) -> None:
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        with self._lock:
+            trace = _ActiveTrace(model or UNKNOWN_LABEL, key or UNKNOWN_LABEL)
+            trace.marks[stage] = now
+            self._active[trace_id] = trace
+            self._active.move_to_end(trace_id)
+            while len(self._active) > MAX_ACTIVE_TRACES:
+                self._active.popitem(last=False)
+                self._dropped += 1
+
+    def mark(self, trace_id: str, stage: str, model: str | None = None, key: str | None = None) -> None:
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        with self._lock:
+            trace = self._active.get(trace_id)
+            if trace is None:
+                return
+            trace.marks[stage] = now
+            if model:
+                trace.model = model
+            if key:
+                trace.key = key
+
+    def finish(self, trace_id: str, stage: str | None = None) -> None:
+        if not self.enabled:
+            return
+        if stage is not None:
+            self.mark(trace_id, stage)
+        with self._lock:
+            trace = self._active.pop(trace_id, None)
+            if trace is None:
+                return
+            self._finished += 1
+            present = [(name, trace.marks[name]) for name in STAGES if name in trace.marks]
+            for (previous_stage, started), (stage_name, ended) in zip(present, present[1:]):
+                self._observe(f"{previous_stage}_to_{stage_name}", trace, ended - started)
+            if len(present) > 1:
+                self._observe(SEGMENT_TOTAL, trace, present[-1][1] - present[0][1])
+
+    def discard(self, trace_id: str) -> None:
+        with self._lock:
+            self._active.pop(trace_id, None)
+
+    def _observe(self, segment: str, trace: _ActiveTrace, seconds: float) -> None:
+        series = (segment, trace.model, trace.key)
+        histogram = self._histograms.get(series)
+        if histogram is None:
+            histogram = self._histograms[series] = Histogram()
+        histogram.observe(max(0.0, seconds))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._active.clear()
+            self._histograms.clear()
+            self._finished = 0
+            self._dropped = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            series = [
+                {"segment": segment, "model": model, "key": key, **histogram.to_dict()}
+                for (segment, model, key), histogram in sorted(self._histograms.items())
+            ]
+            return {
+                "active": len(self._active),
+                "finished": self._finished,
+                "dropped": self._dropped,
+                "series": series,
+            }
+
+    def to_openmetrics(self) -> str:
+        lines = [
+            "# TYPE lgt_job_stage_seconds histogram",
+            "# UNIT lgt_job_stage_seconds seconds",
+            "# HELP lgt_job_stage_seconds Time spent between translation job stages.",
+        ]
+        with self._lock:
+            items = sorted(self._histograms.items())
+            finished = self._finished
+        for (segment, model, key), histogram in items:
+            labels = f'segment="{_escape(segment)}",model="{_escape(model)}",key="{_escape(key)}"'
+            cumulative = 0
+            for bound, bucket_count in zip(LATENCY_BUCKETS, histogram.bucket_counts):
+                cumulative += bucket_count
+                bound_label = "+Inf" if math.isinf(bound) else repr(bound)
+                lines.append(f'lgt_job_stage_seconds_bucket{{{labels},le="{bound_label}"}} {cumulative}')
+            lines.append(f"lgt_job_stage_seconds_count{{{labels}}} {histogram.count}")
+            lines.append(f"lgt_job_stage_seconds_sum{{{labels}}} {histogram.total:.6f}")
+        lines.append("# TYPE lgt_jobs_traced counter")
+        lines.append("# HELP lgt_jobs_traced Translation jobs with a finished trace.")
+        lines.append(f"lgt_jobs_traced_total {finished}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+tracer = Tracer()
@@ -0,0 +1,25 @@
+import logging
+from PySide6 import QtWidgets
+from omni_trans_core import settings
+from ..constants import FLASH_SUCCESS_COLOR
+from .row_highlight import RowHighlightDelegate, HIGHLIGHT_DURATION_MS
+
+logger = logging.getLogger(f"{settings.LOG_PREFIX}_APP_UI.delegates")
+
+
+class ContentPreviewDelegate(RowHighlightDelegate):
+    def __init__(
+        self,
+        view: QtWidgets.QAbstractItemView,
+        preview_column: int,
+        preview_provider,
+        duration_ms: int = HIGHLIGHT_DURATION_MS,
+    ):
+        super().__init__(view, FLASH_SUCCESS_COLOR, duration_ms=duration_ms)
+        self.preview_column = preview_column
+        self.preview_provider = preview_provider
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        if index.column() == self.preview_column:
+            option.text = self.preview_provider(index) or ""
@@ -0,0 +1,146 @@
+import json
+import logging
+from PySide6 import QtWidgets, QtCore
+from omni_trans_core.localization_manager import loc_man, translate
+from omni_trans_core import settings
+from ..tracing import Tracer
+
+logger = logging.getLogger(f"{settings.LOG_PREFIX}_APP_UI.diagnostics")
+
+REFRESH_INTERVAL_MS = 1000
+COLUMN_KEYS = (
+    "diagnostics.latency.column.segment",
+    "diagnostics.latency.column.model",
+    "diagnostics.latency.column.key",
+    "diagnostics.latency.column.count",
+    "diagnostics.latency.column.p50",
+    "diagnostics.latency.column.p95",
+    "diagnostics.latency.column.max",
+)
+
+
+def _format_ms(seconds: float) -> str:
+    return f"{seconds * 1000:.0f}"
+
+
+class LatencyDiagnosticsPanel(QtWidgets.QGroupBox):
+    def __init__(self, tracer: Tracer, parent=None):
+        super().__init__(parent)
+        self.tracer = tracer
+        self._last_finished = -1
+        loc_man.register(self, "title", "diagnostics.latency.title")
+        layout = QtWidgets.QVBoxLayout(self)
+        self.summary_label = QtWidgets.QLabel()
+        layout.addWidget(self.summary_label)
+        self.table = QtWidgets.QTableWidget(0, len(COLUMN_KEYS))
+        self.table.setHorizontalHeaderLabels([translate(key) for key in COLUMN_KEYS])
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.table.horizontalHeader().setSectionResizeMode(
+            QtWidgets.QHeaderView.ResizeMode.ResizeToContents
+        )
+        self.table.setMinimumHeight(120)
+        layout.addWidget(self.table)
+        buttons_layout = QtWidgets.QHBoxLayout()
+        self.export_json_button = QtWidgets.QPushButton()
+        loc_man.register(self.export_json_button, "text", "diagnostics.latency.button.export_json")
+        self.export_metrics_button = QtWidgets.QPushButton()
+        loc_man.register(self.export_metrics_button, "text", "diagnostics.latency.button.export_openmetrics")
+        self.reset_button = QtWidgets.QPushButton()
+        loc_man.register(self.reset_button, "text", "diagnostics.latency.button.reset")
+        buttons_layout.addWidget(self.export_json_button)
+        buttons_layout.addWidget(self.export_metrics_button)
+        buttons_layout.addStretch()
+        buttons_layout.addWidget(self.reset_button)
+        layout.addLayout(buttons_layout)
+        self.export_json_button.clicked.connect(self._export_json)
+        self.export_metrics_button.clicked.connect(self._export_openmetrics)
+        self.reset_button.clicked.connect(self._reset)
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setInterval(REFRESH_INTERVAL_MS)
+        self._refresh_timer.timeout.connect(self.refresh)
+        self.refresh()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self._refresh_timer.start()
+
+    def hideEvent(self, event):
+        self._refresh_timer.stop()
+        super().hideEvent(event)
+
+    @QtCore.Slot()
+    def refresh(self):
+        snapshot = self.tracer.snapshot()
+        self.summary_label.setText(
+            translate(
+                "diagnostics.latency.summary",
+                finished=snapshot["finished"],
+                active=snapshot["active"],
+            )
+        )
+        if snapshot["finished"] == self._last_finished:
+            return
+        self._last_finished = snapshot["finished"]
+        series = snapshot["series"]
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.table.setRowCount(len(series))
+            for row, item in enumerate(series):
+                values = (
+                    item["segment"],
+                    item["model"],
+                    item["key"],
+                    str(item["count"]),
+                    _format_ms(item["p50"]),
+                    _format_ms(item["p95"]),
+                    _format_ms(item["max"]),
+                )
+                for column, value in enumerate(values):
+                    cell = self.table.item(row, column)
+                    if cell is None:
+                        cell = QtWidgets.QTableWidgetItem()
+                        self.table.setItem(row, column, cell)
+                    cell.setText(value)
+        finally:
+            self.table.setUpdatesEnabled(True)
+
+    def _save_text(self, caption_key: str, default_name: str, file_filter: str, text: str):
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, translate(caption_key), default_name, file_filter
+        )
+        if not path:
+            return
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+            logger.info(f"Latency diagnostics written to {path}")
+        except OSError as e:
+            logger.error(f"Failed to write latency diagnostics to {path}: {e}")
+            QtWidgets.QMessageBox.critical(self, translate(caption_key), str(e))
+
+    @QtCore.Slot()
+    def _export_json(self):
+        self._save_text(
+            "diagnostics.latency.button.export_json",
+            "latency.json",
+            "JSON (*.json);;All Files (*)",
+            json.dumps(self.tracer.snapshot(), indent=2),
+        )
+
+    @QtCore.Slot()
+    def _export_openmetrics(self):
+        self._save_text(
+            "diagnostics.latency.button.export_openmetrics",
+            "latency.prom",
+            "OpenMetrics (*.prom *.txt);;All Files (*)",
+            self.tracer.to_openmetrics(),
+        )
+
+    @QtCore.Slot()
+    def _reset(self):
+        self.tracer.reset()
+        self._last_finished = -1
+        self.refresh()
@@ -76,6 +76,10 @@ class ExportSettingsDialog(AnimatedDialog):
         self.includeOriginalsCheck = QtWidgets.QCheckBox()
         self.includeOriginalsCheck.setChecked(True)
         options_layout.addWidget(self.includeOriginalsCheck)
+        self.incrementalExportCheck = QtWidgets.QCheckBox()
+        self.incrementalExportCheck.setChecked(
+            settings.current_settings.get("incremental_export", False))
+        options_layout.addWidget(self.incrementalExportCheck)
         missing_trans_group = QtWidgets.QGroupBox()
         missing_trans_layout = QtWidgets.QVBoxLayout(missing_trans_group)
         self.leaveOriginalRadio = QtWidgets.QRadioButton()
@@ -90,7 +94,18 @@ class ExportSettingsDialog(AnimatedDialog):
         self.stats_label = QtWidgets.QLabel()
         self.stats_label.setWordWrap(True)
         stats_layout.addWidget(self.stats_label)
+        self.coverage_label = QtWidgets.QLabel()
+        self.coverage_label.setWordWrap(True)
+        stats_layout.addWidget(self.coverage_label)
         main_layout.addWidget(stats_group, stretch=1)
+        self.output_mode_group = QtWidgets.QGroupBox()
+        output_mode_layout = QtWidgets.QVBoxLayout(self.output_mode_group)
+        self.combinedOutputRadio = QtWidgets.QRadioButton()
+        self.combinedOutputRadio.setChecked(True)
+        self.perLanguageOutputRadio = QtWidgets.QRadioButton()
+        output_mode_layout.addWidget(self.combinedOutputRadio)
+        output_mode_layout.addWidget(self.perLanguageOutputRadio)
+        main_layout.addWidget(self.output_mode_group)
         self.buttonBox = QtWidgets.QDialogButtonBox( QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel)
         self.buttonBox.accepted.connect(self.accept_settings)
         self.buttonBox.rejected.connect(self.reject)
@@ -109,18 +124,23 @@ class ExportSettingsDialog(AnimatedDialog):
         self.findChildren(QtWidgets.QGroupBox)[2].setTitle( translate("dialog.export.group.options"))
         loc_man.register( self.includeOriginalsCheck, "text", "dialog.export.check.include_originals")
         loc_man.register( self.includeOriginalsCheck, "toolTip", "dialog.export.check.include_originals.tooltip",)
+        loc_man.register( self.incrementalExportCheck, "text", "dialog.export.check.incremental")
+        loc_man.register( self.incrementalExportCheck, "toolTip", "dialog.export.check.incremental.tooltip")
         self.findChildren(QtWidgets.QGroupBox)[3].setTitle( translate("dialog.export.group.missing_translation"))
         loc_man.register( self.leaveOriginalRadio, "text", "dialog.export.radio.leave_original")
         loc_man.register(self.skipKeyRadio, "text", "dialog.export.radio.skip_key")
         self.findChildren(QtWidgets.QGroupBox)[4].setTitle( translate("dialog.export.group.stats"))
+        self.output_mode_group.setTitle(translate("dialog.export.group.output_mode"))
+        loc_man.register( self.combinedOutputRadio, "text", "dialog.export.radio.combined_file")
+        loc_man.register( self.perLanguageOutputRadio, "text", "dialog.export.radio.file_per_language")
         self.update_stats()
 
     def update_stats(self):
-        self.stats_label.setText(translate("dialog.export.stats.calculating"))
+        coverage_index = self.main_window.coverage_index
         total_entries = len(self.all_entries)
         _, selected_languages, _, _ = self.get_export_settings()
-        total_original_keys = sum(
-            len(entry.get("key", [])) for entry in self.all_entries.values())
+        total_original_keys = coverage_index.total_keys
+        self.update_coverage_display()
         if not selected_languages:
             stats_text = translate(
                 "dialog.export.stats.no_languages_selected",
@@ -128,15 +148,9 @@ class ExportSettingsDialog(AnimatedDialog):
                 num_keys=total_original_keys,)
             self.stats_label.setText(stats_text)
             return
-        translations_found_per_lang = {lang: 0 for lang in selected_languages}
-        for entry in self.all_entries.values():
-            original_keys = entry.get("key", [])
-            if not original_keys:
-                continue
-            for key_text in original_keys:
-                for lang in selected_languages:
-                    if self.main_window.cache_manager.get_from_cache( key_text, self.src_lang, lang ):
-                        translations_found_per_lang[lang] += 1
+        translations_found_per_lang = {
+            lang: coverage_index.translated_count(self.src_lang, lang)
+            for lang in selected_languages}
         total_translations_found = sum(translations_found_per_lang.values())
         stats_text = translate(
             "dialog.export.stats.template",
@@ -159,6 +173,26 @@ class ExportSettingsDialog(AnimatedDialog):
                 + "\n".join(warnings))
         self.stats_label.setText(stats_text)
 
+    def update_coverage_display(self):
+        coverage_index = self.main_window.coverage_index
+        total_keys = coverage_index.total_keys
+        if not self.available_target_langs or not total_keys:
+            self.coverage_label.clear()
+            return
+        lines = [translate("dialog.export.stats.coverage_header")]
+        for lang in sorted(self.available_target_langs):
+            translated = coverage_index.translated_count(self.src_lang, lang)
+            lines.append(
+                translate(
+                    "dialog.export.stats.coverage_template",
+                    lang_name=lang,
+                    num_translated=translated,
+                    num_keys=total_keys,
+                    percent=round(100 * translated / total_keys),
+                )
+            )
+        self.coverage_label.setText("<br>".join(lines))
+
     def select_all_langs(self):
         for checkbox in self.lang_checkboxes.values():
             checkbox.setChecked(True)
@@ -180,6 +214,12 @@ class ExportSettingsDialog(AnimatedDialog):
                 return
         self.accept()
 
+    def is_incremental(self):
+        return self.incrementalExportCheck.isChecked()
+
+    def get_output_mode(self):
+        return "per_language" if self.perLanguageOutputRadio.isChecked() else "combined"
+
     def get_export_settings(self):
         lore_name = self.loreNameEdit.text().strip()
         selected_target_languages = [
@@ -0,0 +1,80 @@
+import time
+from typing import Callable, Iterable, Optional
+from PySide6 import QtWidgets, QtCore, QtGui
+
+HIGHLIGHT_DURATION_MS = 1200
+HIGHLIGHT_FRAME_MS = 33
+HIGHLIGHT_MAX_ALPHA = 140
+ITEM_ID_ROLE = QtCore.Qt.ItemDataRole.UserRole + 65
+
+
+def item_id_from_first_column(index: QtCore.QModelIndex) -> Optional[str]:
+    return index.siblingAtColumn(0).data(ITEM_ID_ROLE)
+
+
+class RowHighlightDelegate(QtWidgets.QStyledItemDelegate):
+    def __init__(
+        self,
+        view: QtWidgets.QAbstractItemView,
+        default_color: str,
+        item_id_for_index: Callable[[QtCore.QModelIndex], Optional[str]] = item_id_from_first_column,
+        duration_ms: int = HIGHLIGHT_DURATION_MS,
+    ):
+        super().__init__(view)
+        self.view = view
+        self.default_color = default_color
+        self.item_id_for_index = item_id_for_index
+        self.duration = duration_ms / 1000.0
+        self._highlights: dict[str, tuple[float, QtGui.QColor]] = {}
+        self._frame_timer = QtCore.QTimer(self)
+        self._frame_timer.setInterval(HIGHLIGHT_FRAME_MS)
+        self._frame_timer.timeout.connect(self._on_frame)
+
+    def highlight_items(self, item_ids: Iterable[str], color: Optional[str] = None):
+        started = time.monotonic()
+        qcolor = QtGui.QColor(color or self.default_color)
+        for item_id in item_ids:
+            if item_id is not None:
+                self._highlights[item_id] = (started, qcolor)
+        if self._highlights and not self._frame_timer.isActive():
+            self._frame_timer.start()
+        self.view.viewport().update()
+
+    def clear_highlights(self):
+        self._highlights.clear()
+        self._frame_timer.stop()
+        self.view.viewport().update()
+
+    def _on_frame(self):
+        now = time.monotonic()
+        expired = [
+            item_id
+            for item_id, (started, _) in self._highlights.items()
+            if now - started >= self.duration
+        ]
+        for item_id in expired:
+            del self._highlights[item_id]
+        if not self._highlights:
+            self._frame_timer.stop()
+        self.view.viewport().update()
+
+    def _highlight_color(self, index: QtCore.QModelIndex) -> Optional[QtGui.QColor]:
+        if not self._highlights:
+            return None
+        highlight = self._highlights.get(self.item_id_for_index(index))
+        if highlight is None:
+            return None
+        started, color = highlight
+        progress = (time.monotonic() - started) / self.duration
+        if progress >= 1.0:
+            return None
+        strength = progress * 2 if progress < 0.5 else (1.0 - progress) * 2
+        faded = QtGui.QColor(color)
+        faded.setAlpha(int(HIGHLIGHT_MAX_ALPHA * strength))
+        return faded
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        color = self._highlight_color(index)
+        if color is not None:
+            painter.fillRect(option.rect, color)
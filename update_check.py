@@ -0,0 +1,152 @@
+import time
+import logging
+import urllib.error
+import urllib.request
+from logging import Logger
+from typing import Any
+from PySide6 import QtCore
+from .constants import LOG_PREFIX
+
+logger: Logger = logging.getLogger(f"{LOG_PREFIX}_APP.update_check")
+
+UPDATE_CHECK_TIMEOUT_SECONDS = 5.0
+UPDATE_CHECK_INTERVAL_SECONDS = 6 * 60 * 60
+UPDATE_CHECK_DELAY_MS = 1500
+UPDATE_CHECK_SETTINGS_KEY = "update_check_cache"
+
+
+def parse_version_file(text: str) -> dict[str, str]:
+    versions: dict[str, str] = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if "=" in line and not line.startswith("#"):
+            key, value = line.split("=", 1)
+            versions[key.strip()] = value.strip()
+    return versions
+
+
+def version_tuple(version: str) -> tuple[int, ...]:
+    parts: list[int] = []
+    for part in version.strip().lstrip("v").split("."):
+        digits = "".join(ch for ch in part if ch.isdigit())
+        parts.append(int(digits) if digits else 0)
+    return tuple(parts)
+
+
+def is_newer_version(remote: str, local: str) -> bool:
+    return version_tuple(remote) > version_tuple(local)
+
+
+def fetch_version_file(
+    url: str, cached: dict[str, Any] | None, timeout: float = UPDATE_CHECK_TIMEOUT_SECONDS
+) -> dict[str, Any]:
+    cached = cached or {}
+    request = urllib.request.Request(url, headers={"Cache-Control": "no-cache"})
+    if cached.get("body") is not None:
+        if cached.get("etag"):
+            request.add_header("If-None-Match", cached["etag"])
+        if cached.get("last_modified"):
+            request.add_header("If-Modified-Since", cached["last_modified"])
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            body = response.read().decode("utf-8", errors="replace")
+            return {
+                "url": url,
+                "body": body,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "checked_at": time.time(),
+            }
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached.get("body") is not None:
+            return {**cached, "url": url, "checked_at": time.time()}
+        raise
+
+
+class UpdateCheckSignals(QtCore.QObject):
+    finished = QtCore.Signal(object, str)
+
+
+class UpdateCheckRunnable(QtCore.QRunnable):
+    def __init__(self, url: str, cached: dict[str, Any] | None, signals: UpdateCheckSignals) -> None:
+        super().__init__()
+        self.url = url
+        self.cached = dict(cached) if cached else None
+        self.signals = signals
+
+    @QtCore.Slot()
+    def run(self) -> None:
+        try:
+            result = fetch_version_file(self.url, self.cached)
+        except Exception as e:
+            self.signals.finished.emit(None, str(e))
+            return
+        self.signals.finished.emit(result, "")
+
+
+class UpdateChecker(QtCore.QObject):
+    update_available = QtCore.Signal(str, str)
+
+    def __init__(
+        self,
+        url: str,
+        local_version: str,
+        settings_store: dict[str, Any],
+        save_settings,
+        parent: QtCore.QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self.url = url
+        self.local_version = local_version
+        self.settings_store = settings_store
+        self.save_settings = save_settings
+        self.remote_versions: dict[str, str] = {}
+        self._running = False
+        self._signals = UpdateCheckSignals()
+        self._signals.finished.connect(self._on_finished)
+
+    def schedule(self, delay_ms: int = UPDATE_CHECK_DELAY_MS) -> None:
+        QtCore.QTimer.singleShot(delay_ms, self.start)
+
+    @QtCore.Slot()
+    def start(self) -> None:
+        if self._running or not self.url:
+            return
+        cached = self.settings_store.get(UPDATE_CHECK_SETTINGS_KEY)
+        if (
+            isinstance(cached, dict)
+            and cached.get("url") == self.url
+            and cached.get("body") is not None
+            and time.time() - cached.get("checked_at", 0) < UPDATE_CHECK_INTERVAL_SECONDS
+        ):
+            logger.debug("Using cached version file; skipping the network update check.")
+            self._evaluate(cached["body"])
+            return
+        self._running = True
+        QtCore.QThreadPool.globalInstance().start(
+            UpdateCheckRunnable(self.url, cached if isinstance(cached, dict) else None, self._signals)
+        )
+
+    @QtCore.Slot(object, str)
+    def _on_finished(self, result: dict[str, Any] | None, error: str) -> None:
+        self._running = False
+        if result is None:
+            logger.warning(f"Could not check for updates: {error}. Skipping check.")
+            return
+        self.settings_store[UPDATE_CHECK_SETTINGS_KEY] = result
+        try:
+            self.save_settings()
+        except Exception as e:
+            logger.warning(f"Could not store the update check result: {e}")
+        self._evaluate(result["body"])
+
+    def _evaluate(self, body: str) -> None:
+        self.remote_versions = parse_version_file(body)
+        remote_version = self.remote_versions.get("APP_VERSION", "0.0.0")
+        if is_newer_version(remote_version, self.local_version):
+            logger.warning(
+                f"A new version is available: {remote_version} (installed {self.local_version})."
+            )
+            self.update_available.emit(remote_version, self.remote_versions.get("REPO_URL", ""))
+        else:
+            logger.info(f"Application is up to date (v{self.local_version}).")
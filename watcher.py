@@ -0,0 +1,412 @@
+import os
+import sys
+import time
+import hashlib
+import logging
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from logging import Logger
+from typing import Any, Callable
+from .constants import LOG_PREFIX
+from . import serialization
+from .batch import find_lorebooks, is_within, AUXILIARY_SUFFIXES
+from .cli import (
+    JsonLinesEmitter,
+    add_engine_arguments,
+    configure_logging,
+    create_engine_from_args,
+    initialize_settings,
+    write_trace_file,
+    EXIT_OK,
+    EXIT_USAGE,
+)
+from .engine import TranslationEngine
+from .headless import BookJob, LanguagePair, EventCallback, parse_language_pair
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+logger: Logger = logging.getLogger(f"{LOG_PREFIX}_APP.watcher")
+
+HAS_WATCHDOG = Observer is not None
+DEFAULT_DEBOUNCE_SECONDS = 2.0
+DEFAULT_POLL_INTERVAL = 2.0
+STATE_FILE_NAME = ".lgt_watch_state.json"
+STATE_VERSION = 1
+
+ChangeCallback = Callable[[str], None]
+
+
+def entry_hashes(entries: dict[str, Any]) -> dict[str, str]:
+    return {
+        str(entry_id): hashlib.blake2b(
+            serialization.dumps_raw(entry_data), digest_size=16
+        ).hexdigest()
+        for entry_id, entry_data in entries.items()
+    }
+
+
+def diff_entry_hashes(
+    previous: dict[str, str], current: dict[str, str]
+) -> tuple[set[str], set[str]]:
+    changed = {
+        entry_id
+        for entry_id, entry_hash in current.items()
+        if previous.get(entry_id) != entry_hash
+    }
+    removed = previous.keys() - current.keys()
+    return changed, set(removed)
+
+
+class PollingWatcher:
+    def __init__(
+        self,
+        directories: list[str],
+        on_change: ChangeCallback,
+        recursive: bool = False,
+        interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        self.directories = directories
+        self.on_change = on_change
+        self.recursive = recursive
+        self.interval = interval
+        self._snapshot: dict[str, tuple[int, int]] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        snapshot: dict[str, tuple[int, int]] = {}
+        for path in find_lorebooks(self.directories, self.recursive):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def start(self) -> None:
+        self._snapshot = self._scan()
+        self._thread = threading.Thread(target=self._run, name="lgt-poll-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            snapshot = self._scan()
+            for path, signature in snapshot.items():
+                if self._snapshot.get(path) != signature:
+                    self.on_change(path)
+            for path in self._snapshot.keys() - snapshot.keys():
+                self.on_change(path)
+            self._snapshot = snapshot
+
+
+class _WatchdogHandler(FileSystemEventHandler):
+    def __init__(self, on_change: ChangeCallback) -> None:
+        super().__init__()
+        self.on_change = on_change
+
+    def on_any_event(self, event) -> None:
+        if event.is_directory:
+            return
+        path = getattr(event, "dest_path", "") or event.src_path
+        if path.lower().endswith(".json"):
+            self.on_change(os.path.abspath(path))
+
+
+class WatchdogWatcher:
+    def __init__(self, directories: list[str], on_change: ChangeCallback, recursive: bool = False) -> None:
+        self.observer = Observer()
+        handler = _WatchdogHandler(on_change)
+        for directory in directories:
+            self.observer.schedule(handler, directory, recursive=recursive)
+
+    def start(self) -> None:
+        self.observer.start()
+
+    def stop(self) -> None:
+        self.observer.stop()
+        self.observer.join()
+
+
+class WatchDaemon:
+    def __init__(
+        self,
+        engine: TranslationEngine,
+        directories: list[str],
+        pairs: list[LanguagePair],
+        emit: EventCallback,
+        export_dir: str,
+        recursive: bool = False,
+        debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        force: bool = False,
+        use_context: bool = False,
+        use_polling: bool = False,
+        compact: bool = False,
+    ) -> None:
+        self.engine = engine
+        self.directories = [os.path.abspath(directory) for directory in directories]
+        self.pairs = pairs
+        self.emit = emit
+        self.export_dir = os.path.abspath(export_dir)
+        self.recursive = recursive
+        self.debounce_seconds = debounce_seconds
+        self.force = force
+        self.use_context = use_context
+        self.compact = compact
+        self.state_path = os.path.join(self.export_dir, STATE_FILE_NAME)
+        self.state: dict[str, dict[str, str]] = {}
+        self._due: dict[str, float] = {}
+        self._active: dict[str, BookJob] = {}
+        self._new_hashes: dict[str, dict[str, str]] = {}
+        self._rerun: set[str] = set()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._stop = threading.Event()
+        self._finisher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lgt-watch-export")
+        self._worker: threading.Thread | None = None
+        if HAS_WATCHDOG and not use_polling:
+            self.watcher = WatchdogWatcher(self.directories, self.notify, recursive)
+        else:
+            self.watcher = PollingWatcher(self.directories, self.notify, recursive, poll_interval)
+
+    def _load_state(self) -> None:
+        try:
+            loaded = serialization.load_file(self.state_path)
+        except (OSError, ValueError):
+            return
+        if isinstance(loaded, dict) and loaded.get("version") == STATE_VERSION:
+            self.state = loaded.get("books", {})
+
+    def _save_state(self) -> None:
+        with self._lock:
+            books = dict(self.state)
+        serialization.dump_file_raw({"version": STATE_VERSION, "books": books}, self.state_path)
+
+    def _is_watched_book(self, path: str) -> bool:
+        if not path.lower().endswith(".json") or path.endswith(AUXILIARY_SUFFIXES):
+            return False
+        if is_within(path, self.export_dir):
+            return False
+        return any(
+            is_within(path, directory)
+            and (self.recursive or os.path.dirname(path) == directory)
+            for directory in self.directories
+        )
+
+    def notify(self, path: str) -> None:
+        path = os.path.abspath(path)
+        if not self._is_watched_book(path):
+            return
+        with self._wakeup:
+            self._due[path] = time.monotonic() + self.debounce_seconds
+            self._wakeup.notify()
+
+    def start(self, initial_scan: bool = True) -> None:
+        os.makedirs(self.export_dir, exist_ok=True)
+        self._load_state()
+        self._worker = threading.Thread(target=self._run, name="lgt-watch", daemon=True)
+        self._worker.start()
+        self.watcher.start()
+        if initial_scan:
+            for path in find_lorebooks(self.directories, self.recursive):
+                self.notify(path)
+        self.emit(
+            {
+                "event": "watching",
+                "directories": self.directories,
+                "backend": "watchdog" if isinstance(self.watcher, WatchdogWatcher) else "polling",
+            }
+        )
+
+    def stop(self) -> None:
+        self._stop.set()
+        with self._wakeup:
+            self._wakeup.notify()
+        self.watcher.stop()
+        if self._worker is not None:
+            self._worker.join()
+        with self._lock:
+            active = list(self._active.values())
+        for job in active:
+            job.cancel()
+        self._finisher.shutdown(wait=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            with self._wakeup:
+                now = time.monotonic()
+                ready = [path for path, due in self._due.items() if due <= now]
+                if not ready:
+                    next_due = min(self._due.values(), default=None)
+                    self._wakeup.wait(None if next_due is None else max(0.0, next_due - now))
+                    continue
+                for path in ready:
+                    del self._due[path]
+                busy = {path for path in ready if path in self._active}
+                self._rerun.update(busy)
+            for path in ready:
+                if path not in busy:
+                    self._process(path)
+
+    def _process(self, path: str) -> None:
+        if not os.path.exists(path):
+            with self._lock:
+                removed = self.state.pop(path, None)
+            if removed is not None:
+                self._save_state()
+            return
+        job = BookJob(
+            self.engine,
+            path,
+            self.pairs,
+            lambda event: self._on_job_event(job, event),
+            force=self.force,
+            use_context=self.use_context,
+        )
+        try:
+            job.load()
+        except Exception as e:
+            logger.error(f"Could not load changed LORE-book {path}: {e}")
+            self.emit({"event": "book_failed", "book": path, "error": str(e)})
+            return
+        current = entry_hashes(job.data_handler.data["entries"])
+        with self._lock:
+            previous = self.state.get(path, {})
+        changed, removed = diff_entry_hashes(previous, current)
+        if not changed and not removed:
+            logger.debug(f"No entry changes in {path}, skipping.")
+            return
+        changed_keys = {
+            key_text.strip()
+            for entry_id in changed
+            for key_text in job.data_handler.data["entries"][entry_id].get("key", [])
+        }
+        self.emit(
+            {
+                "event": "book_changed",
+                "book": path,
+                "changed_entries": len(changed),
+                "removed_entries": len(removed),
+                "changed_keys": len(changed_keys),
+            }
+        )
+        with self._lock:
+            self._active[path] = job
+            self._new_hashes[path] = current
+        job.plan(only_keys=changed_keys)
+        job.start()
+
+    def _on_job_event(self, job: BookJob, event: dict[str, Any]) -> None:
+        self.emit(event)
+        if event["event"] == "book_done":
+            self._finisher.submit(self._finish_job, job)
+
+    def _completed_hashes(self, job: BookJob) -> dict[str, str]:
+        hashes = dict(self._new_hashes[job.path])
+        if not job.failed_source_texts:
+            return hashes
+        entries = job.data_handler.data["entries"]
+        for entry_id in list(hashes):
+            keys = {key_text.strip() for key_text in entries[entry_id].get("key", [])}
+            if keys & job.failed_source_texts:
+                del hashes[entry_id]
+        logger.info(
+            f"{len(job.failed_source_texts)} key(s) failed in {job.path}; "
+            f"their entries will be retried on the next change or scan."
+        )
+        return hashes
+
+    def _finish_job(self, job: BookJob) -> None:
+        try:
+            if job.status != "cancelled":
+                job.export(self.export_dir, compact=self.compact)
+                with self._lock:
+                    self.state[job.path] = self._completed_hashes(job)
+                self._save_state()
+        except Exception as e:
+            logger.error(f"Auto-export failed for {job.path}: {e}", exc_info=True)
+            self.emit({"event": "export_failed", "book": job.path, "error": str(e)})
+        finally:
+            with self._wakeup:
+                self._active.pop(job.path, None)
+                self._new_hashes.pop(job.path, None)
+                if job.path in self._rerun:
+                    self._rerun.discard(job.path)
+                    self._due[job.path] = time.monotonic()
+                    self._wakeup.notify()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m lgt_app.watcher",
+        description="Watch folders and translate new or changed LORE-books automatically.",
+    )
+    parser.add_argument("directories", nargs="+", help="Folders to watch.")
+    parser.add_argument("--pair", action="append", required=True, metavar="SOURCE:TARGET")
+    parser.add_argument("--export-dir", required=True, help="Where translated LORE-books are written.")
+    parser.add_argument("--recursive", action="store_true", help="Watch sub-folders too.")
+    parser.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE_SECONDS, help="Seconds to wait after the last change.")
+    parser.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL)
+    parser.add_argument("--polling", action="store_true", help="Always poll instead of using filesystem events.")
+    add_engine_arguments(parser)
+    parser.add_argument("--force", action="store_true", help="Re-translate changed keys even if cached.")
+    parser.add_argument("--use-context", action="store_true", help="Send entry content as translation context.")
+    parser.add_argument("--compact", action="store_true", help="Write exports without indentation.")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    configure_logging(args)
+    emit = JsonLinesEmitter()
+    try:
+        pairs = [parse_language_pair(pair) for pair in args.pair]
+        engine = create_engine_from_args(args)
+        missing = [directory for directory in args.directories if not os.path.isdir(directory)]
+        if missing:
+            raise ValueError(f"Not a directory: {', '.join(missing)}")
+    except ValueError as e:
+        emit({"event": "error", "error": str(e)})
+        return EXIT_USAGE
+    initialize_settings()
+    daemon = WatchDaemon(
+        engine,
+        args.directories,
+        pairs,
+        emit,
+        args.export_dir,
+        recursive=args.recursive,
+        debounce_seconds=args.debounce,
+        poll_interval=args.poll_interval,
+        force=args.force,
+        use_context=args.use_context,
+        use_polling=args.polling,
+        compact=args.compact,
+    )
+    engine.start()
+    daemon.start()
+    try:
+        while True:
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.stop()
+        engine.shutdown(wait=False)
+        write_trace_file(args)
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())